@@ -0,0 +1,58 @@
+"""
+Batch Processing Benchmark
+
+Measures the throughput of a band-pass filter plus FFT over many one-second
+clips, run as a serial loop and through BatchProcessor with an increasing
+number of worker processes.
+
+Usage:
+    python benchmarks/batch.py [num_clips]
+"""
+
+import sys
+import os
+import time
+import numpy as np
+
+# Add the src directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.filters.digital_filters import DigitalFilters
+from src.pipeline.batch import BatchProcessor
+from src.transforms.transforms import SignalTransforms
+
+SAMPLING_RATE = 44100
+
+# The band-pass design every clip uses, warmed once per worker
+DESIGN = (4, (500 / (SAMPLING_RATE / 2), 5000 / (SAMPLING_RATE / 2)), 'band', 'sos')
+
+def band_pass_spectrum(clip):
+    filtered = DigitalFilters.band_pass_filter(clip, 500, 5000, SAMPLING_RATE)
+    return SignalTransforms.fft(filtered, SAMPLING_RATE)[1]
+
+def clips(num_clips):
+    """Yield reproducible one-second noise clips."""
+    rng = np.random.default_rng(0)
+    for _ in range(num_clips):
+        yield rng.standard_normal(SAMPLING_RATE)
+
+def main(num_clips=2000):
+    print(f"{num_clips} clips of {SAMPLING_RATE} samples, {os.cpu_count()} CPUs")
+    print(f"{'method':>20} {'clips/s':>9}")
+
+    start = time.perf_counter()
+    for clip in clips(num_clips):
+        band_pass_spectrum(clip)
+    elapsed = time.perf_counter() - start
+    print(f"{'serial loop':>20} {num_clips / elapsed:>9.1f}")
+
+    for workers in (1, 2, 4, 8):
+        with BatchProcessor(band_pass_spectrum, workers, designs=[DESIGN]) as batch:
+            start = time.perf_counter()
+            for _ in batch.map(clips(num_clips)):
+                pass
+            elapsed = time.perf_counter() - start
+        print(f"{f'{workers} workers':>20} {num_clips / elapsed:>9.1f}")
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
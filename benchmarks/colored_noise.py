@@ -0,0 +1,91 @@
+"""
+Colored Noise Benchmark
+
+Compares the streaming ColoredNoise engine, in one shot and block by
+block, with a full-length FFT 1/f reference (the method SignalGenerator.noise
+used for pink noise before it was built on ColoredNoise), for run time,
+peak traced memory and spectral slope, and measures block-streaming
+throughput for every color.
+
+Usage:
+    python benchmarks/colored_noise.py [num_samples]
+"""
+
+import sys
+import os
+import timeit
+import tracemalloc
+import numpy as np
+
+# Add the src directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.generators.colored_noise import ColoredNoise
+
+def time_call(func, repeat=3):
+    """Return the best wall time of several runs, in milliseconds."""
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1e3
+
+def peak_memory(func):
+    """Return the peak memory traced while running func, in MB."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 1e6
+    finally:
+        tracemalloc.stop()
+
+def fft_pink(num_samples, rng):
+    """Reference pink noise: uniform noise shaped by 1/sqrt(f) over one full-length FFT."""
+    pink = rng.random(num_samples)
+    spectrum = np.fft.fft(pink)
+    frequencies = np.fft.fftfreq(len(spectrum))
+    frequencies[0] = 1e-6  # Avoid divide by zero
+    spectrum /= np.sqrt(np.abs(frequencies))
+    pink = np.real(np.fft.ifft(spectrum))
+    pink /= np.max(np.abs(pink))
+    return pink
+
+def spectral_slope(noise, sampling_rate=44100):
+    """Fit the log-log PSD slope between 200 Hz and 5 kHz (in powers of f)."""
+    nperseg = 8192
+    segments = noise[:len(noise) // nperseg * nperseg].reshape(-1, nperseg)
+    psd = np.mean(np.abs(np.fft.rfft(segments * np.hanning(nperseg), axis=1)) ** 2, axis=0)
+    freqs = np.fft.rfftfreq(nperseg, 1 / sampling_rate)
+    band = (freqs > 200) & (freqs < 5000)
+    return np.polyfit(np.log10(freqs[band]), np.log10(psd[band]), 1)[0]
+
+def stream(color, num_samples, block_size=4096):
+    """Consume a colored noise stream block by block."""
+    for _ in ColoredNoise(color, rng=0).blocks(block_size, num_samples):
+        pass
+
+def main(num_samples=4_410_000):
+    print(f"{num_samples} samples")
+
+    def reference_pink():
+        return fft_pink(num_samples, np.random.default_rng(0))
+
+    def iir_pink():
+        return ColoredNoise('pink', rng=0).generate(num_samples)
+
+    def stream_pink():
+        stream('pink', num_samples)
+
+    def streamed_pink_signal():
+        return np.concatenate(list(ColoredNoise('pink', rng=0).blocks(4096, num_samples)))
+
+    print(f"{'pink method':>22} {'time (ms)':>10} {'peak MB':>9} {'slope':>7}")
+    for label, func, signal in (('FFT reference', reference_pink, reference_pink),
+                                ('IIR one-shot', iir_pink, iir_pink),
+                                ('IIR stream/4096', stream_pink, streamed_pink_signal)):
+        print(f"{label:>22} {time_call(func):>10.1f} {peak_memory(func):>9.1f} "
+              f"{spectral_slope(signal()):>7.2f}")
+
+    print(f"\n{'color':>8} {'Msamples/s':>11}")
+    for color in ColoredNoise.COLORS:
+        elapsed = time_call(lambda: stream(color, num_samples))
+        print(f"{color:>8} {num_samples / elapsed / 1e3:>11.1f}")
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,60 @@
+"""
+FIR Convolution Benchmark
+
+Compares OverlapSaveConvolver against np.convolve and
+scipy.signal.fftconvolve for long linear-phase FIR kernels, and measures
+streaming throughput when the input arrives in small blocks.
+
+Usage:
+    python benchmarks/fir_convolution.py [num_samples]
+"""
+
+import sys
+import os
+import timeit
+import numpy as np
+from scipy import signal as sp_signal
+
+# Add the src directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.filters.fir_filters import FIRFilters, OverlapSaveConvolver
+
+# np.convolve is skipped above this many multiply-adds to keep runs short
+DIRECT_MAX_OPS = 5e9
+
+def time_call(func, repeat=3):
+    """Return the best wall time of several runs, in milliseconds."""
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1e3
+
+def main(num_samples=1_000_000):
+    sampling_rate = 48000
+    rng = np.random.default_rng(0)
+    signal = rng.standard_normal(num_samples)
+
+    print(f"{num_samples} samples, times in ms")
+    print(f"{'taps':>6} {'fft size':>9} {'np.convolve':>12} {'fftconvolve':>12} "
+          f"{'overlap-save':>13} {'stream/512':>11} {'Msamples/s':>11}")
+    for num_taps in (1025, 4097, 16385):
+        taps = FIRFilters.design(num_taps, 4000, sampling_rate)
+        convolver = OverlapSaveConvolver(taps)
+
+        if num_samples * num_taps <= DIRECT_MAX_OPS:
+            direct = f"{time_call(lambda: np.convolve(signal, taps)):.1f}"
+        else:
+            direct = "skipped"
+        fftconv = time_call(lambda: sp_signal.fftconvolve(signal, taps))
+        overlap_save = time_call(lambda: convolver.convolve(signal))
+
+        blocks = np.array_split(signal, num_samples // 512)
+        def stream():
+            convolver.reset()
+            for block in blocks:
+                convolver.process(block)
+        streaming = time_call(stream, repeat=1)
+
+        print(f"{num_taps:>6} {convolver.fft_size:>9} {direct:>12} {fftconv:>12.1f} "
+              f"{overlap_save:>13.1f} {streaming:>11.1f} {num_samples / overlap_save / 1e3:>11.1f}")
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,47 @@
+"""
+Merkle Fingerprint Benchmark
+
+Measures Merkle fingerprint throughput against one flat SHA-256 pass for
+an increasing number of hashing threads, and the cost of checking a
+single chunk against the fingerprint.
+
+Usage:
+    python benchmarks/merkle.py [num_samples]
+"""
+
+import sys
+import os
+import timeit
+import numpy as np
+
+# Add the src directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.security.merkle import MerkleFingerprint
+from src.security.signal_security import SignalSecurity
+
+def time_call(func, repeat=3):
+    """Return the best wall time of several runs, in seconds."""
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+def main(num_samples=50_000_000):
+    signal = np.random.default_rng(0).standard_normal(num_samples)
+    megabytes = signal.nbytes / 1e6
+    print(f"{num_samples} samples ({megabytes:.0f} MB), {os.cpu_count()} CPUs")
+
+    print(f"{'method':>20} {'MB/s':>8}")
+    flat = time_call(lambda: SignalSecurity.compute_signal_hash(signal))
+    print(f"{'flat sha256':>20} {megabytes / flat:>8.1f}")
+    for workers in (1, 2, 4, 8):
+        elapsed = time_call(lambda: MerkleFingerprint.from_signal(signal, workers=workers))
+        print(f"{f'merkle, {workers} threads':>20} {megabytes / elapsed:>8.1f}")
+
+    fingerprint = MerkleFingerprint.from_signal(signal)
+    index = fingerprint.num_chunks // 2
+    chunk = signal[slice(*fingerprint.chunk_bounds(index))]
+    proof = fingerprint.proof(index)
+    elapsed = time_call(lambda: fingerprint.verify_chunk(chunk, index, proof), repeat=20)
+    print(f"\nverify one of {fingerprint.num_chunks} chunks: {elapsed * 1e3:.2f} ms")
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
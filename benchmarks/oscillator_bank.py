@@ -0,0 +1,36 @@
+"""
+Oscillator Bank Benchmark
+
+Times the 'direct' and 'phasor' OscillatorBank methods over a range of
+tone counts, to place the crossover used by method='auto'.
+
+Usage:
+    python benchmarks/oscillator_bank.py [num_samples]
+"""
+
+import sys
+import os
+import timeit
+import numpy as np
+
+# Add the src directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.generators.oscillator_bank import OscillatorBank
+
+def time_call(func, repeat=5):
+    """Return the best wall time of several runs, in milliseconds."""
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1e3
+
+def main(num_samples=1 << 16):
+    print(f"{num_samples} samples, times in ms")
+    print(f"{'tones':>6} {'direct':>9} {'phasor':>9}")
+    for num_tones in (1, 2, 4, 8, 16, 32, 64, 128, 256):
+        frequencies = np.linspace(100, 5000, num_tones)
+        direct = OscillatorBank(frequencies, method='direct')
+        phasor = OscillatorBank(frequencies, method='phasor')
+        print(f"{num_tones:>6} {time_call(lambda: direct.generate(num_samples)):>9.2f} "
+              f"{time_call(lambda: phasor.generate(num_samples)):>9.2f}")
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,64 @@
+"""
+Resampling Benchmark
+
+Compares the polyphase Resampler (one-shot and streaming) against naive
+resampling that zero-stuffs, filters at the full intermediate rate with the
+same anti-aliasing filter and then slices.
+
+Usage:
+    python benchmarks/resampling.py [num_samples]
+"""
+
+import sys
+import os
+import timeit
+import numpy as np
+from scipy import signal as sp_signal
+
+# Add the src directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.filters.resampling import Resampler
+
+# The naive path is skipped when the zero-stuffed signal would exceed this
+NAIVE_MAX_SAMPLES = 2e7
+
+def time_call(func, repeat=3):
+    """Return the best wall time of several runs, in milliseconds."""
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1e3
+
+def naive_resample(signal, resampler):
+    """Zero-stuff, low-pass at the intermediate rate, then keep every down-th sample."""
+    stuffed = np.zeros(len(signal) * resampler.up)
+    stuffed[::resampler.up] = signal
+    filtered = sp_signal.oaconvolve(stuffed, resampler.taps * resampler.up)
+    start = resampler.delay
+    return filtered[start:start + len(stuffed):resampler.down]
+
+def main(num_samples=960000):
+    rng = np.random.default_rng(0)
+    signal = rng.standard_normal(num_samples)
+
+    print(f"{num_samples} input samples, times in ms")
+    print(f"{'conversion':>16} {'naive':>9} {'polyphase':>10} {'stream/1024':>12} {'Msamples/s':>11}")
+    for input_rate, output_rate in ((48000, 8000), (96000, 48000), (48000, 44100), (44100, 48000)):
+        resampler = Resampler.from_rates(input_rate, output_rate)
+        if num_samples * resampler.up <= NAIVE_MAX_SAMPLES:
+            naive = f"{time_call(lambda: naive_resample(signal, resampler)):.1f}"
+        else:
+            naive = "skipped"
+        polyphase = time_call(lambda: resampler.resample(signal))
+
+        blocks = np.array_split(signal, num_samples // 1024)
+        def stream():
+            for block in blocks:
+                resampler.process(block)
+            resampler.flush()
+        streaming = time_call(stream, repeat=1)
+
+        label = f"{input_rate}->{output_rate}"
+        print(f"{label:>16} {naive:>9} {polyphase:>10.1f} {streaming:>12.1f} "
+              f"{num_samples / polyphase / 1e3:>11.1f}")
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
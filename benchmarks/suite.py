@@ -0,0 +1,237 @@
+"""
+Benchmark Suite
+
+Times and memory-profiles the public entry points of SignalGenerator,
+DigitalFilters, SignalTransforms and SignalSecurity over a sweep of signal
+lengths, dtypes and channel counts. Results can be saved as a JSON
+baseline and later runs compared against it; the script exits with status
+1 when any case is slower, or allocates more, than the baseline by more
+than the threshold.
+
+Each case is timed as the best of several repeats (each repeat calling it
+enough times to last at least 50 ms) and its peak traced allocation is
+measured in a separate run. Cases whose estimated peak memory exceeds half
+the available memory are skipped rather than run. The suite only needs
+the standard library, so it runs wherever the toolkit does, without
+pytest-benchmark or asv.
+
+Usage:
+    python benchmarks/suite.py [--sizes 1e3 1e4 1e5 1e6] [--dtypes float64 float32]
+                               [--channels 1 4] [--filter NAME] [--save FILE]
+                               [--compare FILE] [--threshold 0.25]
+"""
+
+import sys
+import os
+import argparse
+import json
+import platform
+import timeit
+import tracemalloc
+import numpy as np
+import scipy
+
+# Add the src directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.generators.signal_generator import SignalGenerator
+from src.filters.digital_filters import DigitalFilters
+from src.transforms.transforms import SignalTransforms
+from src.security.memory_budget import default_memory_budget
+from src.security.signal_security import SignalSecurity
+
+SAMPLING_RATE = 44100
+
+# Each timed repeat calls a case often enough to last at least this long
+MIN_REPEAT_SECONDS = 0.05
+
+def _signal(n, dtype, channels):
+    """Return a reproducible noise signal of shape (channels, n), or (n,) for one channel."""
+    rng = np.random.default_rng(0)
+    shape = (n,) if channels == 1 else (channels, n)
+    return rng.standard_normal(shape).astype(dtype)
+
+def generator_case(method, *args):
+    """Set up a SignalGenerator call producing n samples."""
+    def setup(n, dtype, channels):
+        generate = getattr(SignalGenerator, method)
+        return lambda: generate(*args, n / SAMPLING_RATE, SAMPLING_RATE, dtype=dtype)
+    return setup
+
+def signal_case(func):
+    """Set up a call taking a noise signal of the configured shape."""
+    def setup(n, dtype, channels):
+        signal = _signal(n, dtype, channels)
+        return lambda: func(signal)
+    return setup
+
+def ifft_setup(n, dtype, channels):
+    _, magnitudes, phases = SignalTransforms.fft(_signal(n, dtype, channels), SAMPLING_RATE)
+    return lambda: SignalTransforms.ifft(magnitudes, phases, n)
+
+def istft_setup(n, dtype, channels):
+    frames = SignalTransforms.stft(_signal(n, dtype, channels), center=True)
+    return lambda: SignalTransforms.istft(frames, 2048, 512, center=True, length=n)
+
+# name: (MemoryBudget operation or None, multichannel, setup(n, dtype, channels) -> callable)
+CASES = {
+    'SignalGenerator.sine_wave': ('sine_wave', False, generator_case('sine_wave', 440)),
+    'SignalGenerator.square_wave': ('square_wave', False, generator_case('square_wave', 440)),
+    'SignalGenerator.noise': ('noise', False, generator_case('noise')),
+    'SignalGenerator.chirp_signal': ('chirp_signal', False,
+                                     generator_case('chirp_signal', 20, 20000)),
+    'SignalGenerator.multi_tone': ('multi_tone', False,
+                                   generator_case('multi_tone', np.linspace(100, 10000, 32))),
+    'DigitalFilters.low_pass_filter': ('low_pass_filter', True, signal_case(
+        lambda x: DigitalFilters.low_pass_filter(x, 1000, SAMPLING_RATE))),
+    'DigitalFilters.high_pass_filter': ('high_pass_filter', True, signal_case(
+        lambda x: DigitalFilters.high_pass_filter(x, 1000, SAMPLING_RATE))),
+    'DigitalFilters.band_pass_filter': ('band_pass_filter', True, signal_case(
+        lambda x: DigitalFilters.band_pass_filter(x, 500, 5000, SAMPLING_RATE))),
+    'DigitalFilters.moving_average': ('moving_average', True, signal_case(
+        lambda x: DigitalFilters.moving_average(x, 64))),
+    'SignalTransforms.fft': ('fft', False, signal_case(
+        lambda x: SignalTransforms.fft(x, SAMPLING_RATE))),
+    'SignalTransforms.ifft': ('fft', False, ifft_setup),
+    'SignalTransforms.stft': ('stft', False, signal_case(
+        lambda x: SignalTransforms.stft(x, center=True))),
+    'SignalTransforms.istft': ('istft', False, istft_setup),
+    'SignalSecurity.compute_signal_hash': (None, True, signal_case(
+        SignalSecurity.compute_signal_hash)),
+    'SignalSecurity.validate_array_bounds': (None, True, signal_case(
+        SignalSecurity.validate_array_bounds)),
+    'SignalSecurity.secure_random_noise': (None, False, lambda n, dtype, channels: (
+        lambda: SignalSecurity.secure_random_noise(n, dtype=dtype))),
+}
+
+def case_key(name, n, dtype, channels):
+    """Return the result key of one benchmark configuration."""
+    return f"{name}|n={n}|{dtype}|ch={channels}"
+
+def fits_memory(operation, n, dtype, channels, budget):
+    """Check the case's estimated peak memory (input included) against the budget."""
+    itemsize = np.dtype(dtype).itemsize
+    estimate = 4 * n * channels * itemsize
+    if operation is not None:
+        estimate = n * channels * itemsize + budget.estimate(operation, n, dtype, channels)
+    return estimate <= budget.max_bytes
+
+def measure(func, repeat=3):
+    """Return (best seconds per call, peak traced bytes) for a benchmark callable."""
+    timer = timeit.Timer(func)
+    number = 1
+    while timer.timeit(number) < MIN_REPEAT_SECONDS:
+        number *= 2
+    seconds = min(timer.repeat(repeat=repeat, number=number)) / number
+    tracemalloc.start()
+    try:
+        func()
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return seconds, peak_bytes
+
+def run(sizes, dtypes, channels, name_filter=None, budget=None, report=print):
+    """
+    Run every selected case over the sweep.
+
+    Args:
+        sizes (list of int): Signal lengths in samples
+        dtypes (list of str): Sample dtypes
+        channels (list of int): Channel counts (single-channel APIs use 1 only)
+        name_filter (str, optional): Only run cases whose name contains this
+        budget (MemoryBudget, optional): Skip cases whose estimate exceeds it
+        report (callable): Called with a line of text per result
+
+    Returns:
+        dict: Case key to {'seconds': ..., 'peak_bytes': ...}
+    """
+    budget = budget or default_memory_budget()
+    results = {}
+    for name, (operation, multichannel, setup) in CASES.items():
+        if name_filter and name_filter not in name:
+            continue
+        for n in sizes:
+            for dtype in dtypes:
+                for c in (channels if multichannel else [1]):
+                    key = case_key(name, n, dtype, c)
+                    if not fits_memory(operation, n, dtype, c, budget):
+                        report(f"{key:<62} skipped (over memory budget)")
+                        continue
+                    seconds, peak_bytes = measure(setup(n, dtype, c))
+                    results[key] = {'seconds': seconds, 'peak_bytes': peak_bytes}
+                    report(f"{key:<62} {seconds * 1e3:>10.3f} ms {peak_bytes / 1e6:>9.2f} MB")
+    return results
+
+def environment():
+    """Describe the machine and library versions a result set was produced on."""
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'scipy': scipy.__version__,
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+    }
+
+def compare(results, baseline, threshold=0.25):
+    """
+    Find results that regressed against a baseline.
+
+    Args:
+        results (dict): Current results, as returned by run()
+        baseline (dict): Baseline results for the same keys
+        threshold (float): Allowed relative increase in time or peak memory
+
+    Returns:
+        list: (key, metric, baseline value, current value, ratio) for every regression
+    """
+    regressions = []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            continue
+        for metric in ('seconds', 'peak_bytes'):
+            # Ignore noise in allocations too small to matter
+            floor = 0 if metric == 'seconds' else 64 * 1024
+            if previous[metric] <= 0 or current[metric] <= floor:
+                continue
+            ratio = current[metric] / previous[metric]
+            if ratio > 1 + threshold:
+                regressions.append((key, metric, previous[metric], current[metric], ratio))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('--sizes', nargs='+', type=float, default=[1e3, 1e4, 1e5, 1e6],
+                        help='signal lengths in samples (up to 1e8)')
+    parser.add_argument('--dtypes', nargs='+', default=['float64', 'float32'])
+    parser.add_argument('--channels', nargs='+', type=int, default=[1, 4])
+    parser.add_argument('--filter', dest='name_filter', help='only run cases containing NAME')
+    parser.add_argument('--save', help='write results to a JSON baseline file')
+    parser.add_argument('--compare', help='compare against a JSON baseline file')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='allowed relative regression (default 0.25)')
+    args = parser.parse_args(argv)
+
+    print(f"{'case':<62} {'time':>13} {'peak':>12}")
+    results = run([int(n) for n in args.sizes], args.dtypes, args.channels, args.name_filter)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({'environment': environment(), 'results': results}, f, indent=1)
+        print(f"\nSaved {len(results)} results to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if baseline['environment'] != environment():
+            print(f"\nWarning: baseline was recorded on {baseline['environment']}")
+        regressions = compare(results, baseline['results'], args.threshold)
+        print(f"\n{len(regressions)} regressions over {args.threshold:.0%}")
+        for key, metric, previous, current, ratio in regressions:
+            print(f"  {key} {metric}: {previous:.4g} -> {current:.4g} ({ratio:.2f}x)")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -24,7 +24,7 @@ def spectral_noise_reduction(signal, noise_floor_percentile=30, reduction_factor
     """
     # Compute STFT
     transforms = SignalTransforms()
-    stft_matrix = transforms.stft(signal)
+    stft_matrix = transforms.stft(signal, center=True)
     
     # Estimate noise floor from magnitude spectrum
     magnitudes = np.abs(stft_matrix)
@@ -41,7 +41,7 @@ def spectral_noise_reduction(signal, noise_floor_percentile=30, reduction_factor
     stft_cleaned = noise_reduced * np.exp(1j * phases)
     
     # Inverse STFT
-    return transforms.istft(stft_cleaned)
+    return transforms.istft(stft_cleaned, center=True, length=len(signal))
 
 def main():
     # Parameters
@@ -50,11 +50,8 @@ def main():
     
     # Generate a complex test signal (mixture of frequencies)
     gen = SignalGenerator()
-    t, signal1 = gen.sine_wave(frequency=400, duration=duration, 
-                              sampling_rate=sampling_rate, amplitude=0.5)
-    _, signal2 = gen.sine_wave(frequency=800, duration=duration, 
-                              sampling_rate=sampling_rate, amplitude=0.3)
-    clean_signal = signal1 + signal2
+    t, clean_signal = gen.multi_tone(frequencies=[400, 800], duration=duration,
+                                     sampling_rate=sampling_rate, amplitudes=[0.5, 0.3])
     
     # Add significant noise
     _, noise = gen.noise(duration=duration, sampling_rate=sampling_rate, 
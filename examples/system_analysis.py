@@ -24,7 +24,7 @@ import matplotlib.pyplot as plt
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from src.generators.signal_generator import SignalGenerator
-from src.filters.digital_filters import DigitalFilters
+from src.filters.digital_filters import StreamingFilter
 from src.transforms.transforms import SignalTransforms
 
 def analyze_system_response():
@@ -36,24 +36,28 @@ def analyze_system_response():
     
     # Generate chirp signal
     gen = SignalGenerator()
-    t, chirp = gen.chirp_signal(start_freq, end_freq, duration, sampling_rate)
+    t, chirp = gen.chirp_signal(start_freq, end_freq, duration, sampling_rate,
+                                method='logarithmic')
     
-    # Create a system to analyze (bandpass filter)
-    filters = DigitalFilters()
-    filtered_chirp = filters.band_pass_filter(
-        chirp, 
+    # Create a system to analyze (causal bandpass filter); a zero-phase
+    # filtfilt is not causal, so its response would wrap around in time
+    system = StreamingFilter.band_pass(
         low_cutoff=1000,  # 1kHz
         high_cutoff=5000,  # 5kHz
         sampling_rate=sampling_rate
     )
+    filtered_chirp = system.filter(chirp)
     
     # Compute frequency response
     transforms = SignalTransforms()
     freq_in, mag_in, _ = transforms.fft(chirp, sampling_rate)
     freq_out, mag_out, _ = transforms.fft(filtered_chirp, sampling_rate)
     
-    # Calculate system response
-    system_response = mag_out / np.where(mag_in > 1e-10, mag_in, 1e-10)
+    # Calculate system response from the measured impulse response
+    impulse = gen.impulse_response(filtered_chirp, start_freq, end_freq, duration,
+                                   sampling_rate, method='logarithmic')
+    freq_sys, system_response, _ = transforms.fft(impulse, sampling_rate)
+    system_response = np.maximum(system_response, 1e-10)
     
     # Plotting
     plt.figure(figsize=(15, 10))
@@ -80,7 +84,7 @@ def analyze_system_response():
     
     # System frequency response
     plt.subplot(3, 1, 3)
-    plt.semilogx(freq_in, 20 * np.log10(system_response))
+    plt.semilogx(freq_sys, 20 * np.log10(system_response))
     plt.xlabel('Frequency (Hz)')
     plt.ylabel('Magnitude (dB)')
     plt.title('System Frequency Response')
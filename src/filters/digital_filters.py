@@ -1,78 +1,527 @@
+import functools
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 from scipy import signal
 
+
+# Weighted moving averages longer than this use FFT convolution
+_DIRECT_MAX_TAPS = 64
+
+
+def _moving_average_kernel(window_size, weights):
+    """Return a unit-sum kernel, or None for an unweighted boxcar."""
+    if int(window_size) != window_size or window_size < 1:
+        raise ValueError("Window size must be a positive integer")
+    if weights is None:
+        return None
+    kernel = np.asarray(weights, dtype=float)
+    if kernel.shape != (window_size,):
+        raise ValueError("Weights must have length window_size")
+    return kernel / kernel.sum()
+
+
+def _boxcar_valid(signal_array, window_size):
+    """Running mean over full windows along the last axis via cumulative sums."""
+    # Accumulate in float64 so the running sums do not drift on long inputs
+    shape = signal_array.shape[:-1] + (signal_array.shape[-1] + 1,)
+    cumulative = np.zeros(shape)
+    np.cumsum(signal_array, axis=-1, out=cumulative[..., 1:])
+    averaged = cumulative[..., window_size:] - cumulative[..., :-window_size]
+    averaged /= window_size
+    return averaged
+
+
+def _convolve_valid(signal_array, kernel, method, dtype):
+    """Convolve along the last axis, keeping only fully overlapped samples."""
+    signal_array = signal_array.astype(dtype, copy=False)
+    kernel = kernel.astype(dtype).reshape((1,) * (signal_array.ndim - 1) + (-1,))
+    if method == 'fft':
+        return signal.oaconvolve(signal_array, kernel, mode='valid', axes=-1)
+    return signal.convolve(signal_array, kernel, mode='valid', method='direct')
+
+
+def _moving_average_along_axis(signal_array, window_size, kernel, mode, method, dtype, axis):
+    """Pad for the edge mode and average along axis."""
+    signal_array = np.moveaxis(signal_array, axis, -1)
+    if mode != 'valid':
+        # Left pad window_size // 2 matches the centring of np.convolve(mode='same')
+        pad = [(0, 0)] * (signal_array.ndim - 1) + [(window_size // 2, (window_size - 1) // 2)]
+        signal_array = np.pad(signal_array, pad, mode='constant' if mode == 'same' else 'reflect')
+    if method == 'cumsum':
+        averaged = _boxcar_valid(signal_array, window_size)
+    else:
+        averaged = _convolve_valid(signal_array, kernel, method, dtype)
+    return np.moveaxis(averaged.astype(dtype, copy=False), -1, axis)
+
+
+class FilterDesignCache:
+    """
+    A thread-safe, LRU-bounded cache of Butterworth filter coefficients.
+
+    Designs are keyed on (filter type, order, normalized cutoffs, output
+    form), so repeated requests for the same filter become a dictionary
+    lookup instead of a call to scipy.signal.butter. Cached coefficient
+    arrays are read-only because they are shared between callers.
+    """
+
+    def __init__(self, maxsize=128):
+        """
+        Create an empty cache.
+
+        Args:
+            maxsize (int): Maximum number of designs kept before the least
+                recently used one is evicted
+        """
+        if maxsize < 1:
+            raise ValueError("Cache size must be at least 1")
+        self.maxsize = maxsize
+        self._designs = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def butter(self, order, normalized_cutoff, btype, output='ba'):
+        """
+        Return Butterworth coefficients, designing them on a cache miss.
+
+        Args:
+            order (int): Filter order
+            normalized_cutoff (float or sequence): Cutoff(s) relative to Nyquist
+            btype (str): Filter type ('low', 'high', 'band', 'bandstop')
+            output (str): Coefficient form ('ba' or 'sos')
+
+        Returns:
+            tuple or numpy.ndarray: (b, a) coefficients or SOS array
+        """
+        cutoffs = tuple(float(c) for c in np.atleast_1d(normalized_cutoff))
+        key = (btype, int(order), cutoffs, output)
+        with self._lock:
+            design = self._designs.get(key)
+            if design is not None:
+                self._designs.move_to_end(key)
+                self.hits += 1
+                return design
+            self.misses += 1
+
+        # Design outside the lock so slow designs do not block lookups
+        design = signal.butter(order, normalized_cutoff, btype=btype, output=output)
+        for coefficients in (design if output == 'ba' else (design,)):
+            coefficients.setflags(write=False)
+
+        with self._lock:
+            self._designs[key] = design
+            self._designs.move_to_end(key)
+            while len(self._designs) > self.maxsize:
+                self._designs.popitem(last=False)
+                self.evictions += 1
+        return design
+
+    def clear(self):
+        """Remove all cached designs and reset the counters."""
+        with self._lock:
+            self._designs.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self):
+        """
+        Return cache statistics.
+
+        Returns:
+            dict: Counts of hits, misses, evictions and cached designs
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._designs),
+                'maxsize': self.maxsize,
+            }
+
+    def __len__(self):
+        with self._lock:
+            return len(self._designs)
+
+
 class DigitalFilters:
     """A class implementing various digital filters."""
-    
+
+    # Coefficient cache shared by all filter methods
+    design_cache = FilterDesignCache()
+
+    @staticmethod
+    def _butter_filtfilt(signal_array, normalized_cutoff, btype, order, form, axis, workers):
+        """Design (or fetch) a Butterworth filter and apply it with zero phase."""
+        if form == 'sos':
+            sos = DigitalFilters.design_cache.butter(order, normalized_cutoff, btype, output='sos')
+            # sosfiltfilt needs writable coefficients; the cached copy is read-only
+            func = functools.partial(signal.sosfiltfilt, np.array(sos), axis=axis)
+        elif form == 'ba':
+            b, a = DigitalFilters.design_cache.butter(order, normalized_cutoff, btype)
+            func = functools.partial(signal.filtfilt, b, a, axis=axis)
+        else:
+            raise ValueError(f"Unsupported filter form: {form}")
+        return DigitalFilters._apply_along_channels(func, signal_array, axis, workers)
+
+    @staticmethod
+    def _apply_along_channels(func, signal_array, axis, workers):
+        """
+        Apply func to all channels, optionally splitting them across threads.
+
+        Without workers the whole N-D array goes through one scipy call.
+        With workers > 1 the array is split into channel blocks along the
+        first non-filtered axis and the blocks are filtered concurrently;
+        scipy releases the GIL inside its filtering loops.
+        """
+        signal_array = np.asarray(signal_array)
+        if workers is None or workers <= 1 or signal_array.ndim < 2:
+            return func(signal_array)
+        filter_axis = axis % signal_array.ndim
+        channel_axis = 1 if filter_axis == 0 else 0
+        n_blocks = min(workers, signal_array.shape[channel_axis])
+        if n_blocks <= 1:
+            return func(signal_array)
+        blocks = np.array_split(signal_array, n_blocks, axis=channel_axis)
+        with ThreadPoolExecutor(max_workers=n_blocks) as pool:
+            filtered = list(pool.map(func, blocks))
+        return np.concatenate(filtered, axis=channel_axis)
+
     @staticmethod
-    def low_pass_filter(signal_array, cutoff_freq, sampling_rate, order=4):
+    def low_pass_filter(signal_array, cutoff_freq, sampling_rate, order=4, form='sos',
+                        axis=-1, workers=None):
         """
         Apply a low-pass Butterworth filter to the signal.
         
         Args:
-            signal_array (numpy.ndarray): Input signal
+            signal_array (numpy.ndarray): Input signal (N-D for multichannel)
             cutoff_freq (float): Cutoff frequency in Hz
             sampling_rate (int): Sampling rate in Hz
             order (int): Filter order
+            form (str): Filter form, 'sos' (second-order sections, stable at
+                high orders) or 'ba' (transfer function, legacy behaviour)
+            axis (int): Axis of signal_array to filter along; all other axes
+                are treated as independent channels
+            workers (int, optional): Number of threads to split the channels
+                across; by default all channels go through one scipy call
             
         Returns:
             numpy.ndarray: Filtered signal
         """
         nyquist = sampling_rate / 2
         normalized_cutoff = cutoff_freq / nyquist
-        b, a = signal.butter(order, normalized_cutoff, btype='low')
-        return signal.filtfilt(b, a, signal_array)
+        return DigitalFilters._butter_filtfilt(signal_array, normalized_cutoff, 'low', order, form,
+                                               axis, workers)
     
     @staticmethod
-    def high_pass_filter(signal_array, cutoff_freq, sampling_rate, order=4):
+    def high_pass_filter(signal_array, cutoff_freq, sampling_rate, order=4, form='sos',
+                         axis=-1, workers=None):
         """
         Apply a high-pass Butterworth filter to the signal.
         
         Args:
-            signal_array (numpy.ndarray): Input signal
+            signal_array (numpy.ndarray): Input signal (N-D for multichannel)
             cutoff_freq (float): Cutoff frequency in Hz
             sampling_rate (int): Sampling rate in Hz
             order (int): Filter order
+            form (str): Filter form, 'sos' (second-order sections, stable at
+                high orders) or 'ba' (transfer function, legacy behaviour)
+            axis (int): Axis of signal_array to filter along; all other axes
+                are treated as independent channels
+            workers (int, optional): Number of threads to split the channels
+                across; by default all channels go through one scipy call
             
         Returns:
             numpy.ndarray: Filtered signal
         """
         nyquist = sampling_rate / 2
         normalized_cutoff = cutoff_freq / nyquist
-        b, a = signal.butter(order, normalized_cutoff, btype='high')
-        return signal.filtfilt(b, a, signal_array)
+        return DigitalFilters._butter_filtfilt(signal_array, normalized_cutoff, 'high', order, form,
+                                               axis, workers)
     
     @staticmethod
-    def band_pass_filter(signal_array, low_cutoff, high_cutoff, sampling_rate, order=4):
+    def band_pass_filter(signal_array, low_cutoff, high_cutoff, sampling_rate, order=4,
+                         form='sos', axis=-1, workers=None):
         """
         Apply a band-pass Butterworth filter to the signal.
         
         Args:
-            signal_array (numpy.ndarray): Input signal
+            signal_array (numpy.ndarray): Input signal (N-D for multichannel)
             low_cutoff (float): Lower cutoff frequency in Hz
             high_cutoff (float): Upper cutoff frequency in Hz
             sampling_rate (int): Sampling rate in Hz
             order (int): Filter order
+            form (str): Filter form, 'sos' (second-order sections, stable at
+                high orders) or 'ba' (transfer function, legacy behaviour)
+            axis (int): Axis of signal_array to filter along; all other axes
+                are treated as independent channels
+            workers (int, optional): Number of threads to split the channels
+                across; by default all channels go through one scipy call
             
         Returns:
             numpy.ndarray: Filtered signal
         """
         nyquist = sampling_rate / 2
         normalized_cutoffs = [low_cutoff / nyquist, high_cutoff / nyquist]
-        b, a = signal.butter(order, normalized_cutoffs, btype='band')
-        return signal.filtfilt(b, a, signal_array)
+        return DigitalFilters._butter_filtfilt(signal_array, normalized_cutoffs, 'band', order, form,
+                                               axis, workers)
     
     @staticmethod
-    def moving_average(signal_array, window_size):
+    def moving_average(signal_array, window_size, axis=-1, workers=None, mode='same',
+                       method='auto', weights=None, dtype=None):
         """
-        Apply a simple moving average filter.
+        Apply a moving average filter.
+
+        A plain boxcar is computed as a cumulative-sum running mean in O(N),
+        independent of the window size. Weighted kernels use direct
+        convolution when short and overlap-add FFT convolution otherwise.
         
         Args:
-            signal_array (numpy.ndarray): Input signal
+            signal_array (numpy.ndarray): Input signal (N-D for multichannel)
             window_size (int): Size of the moving average window
+            axis (int): Axis of signal_array to average along
+            workers (int, optional): Number of threads to split the channels across
+            mode (str): Edge handling: 'same' (zero-padded, centred like
+                np.convolve), 'valid' (only full windows) or 'reflect'
+                (reflect-padded, same length as the input)
+            method (str): 'auto', 'cumsum' (boxcar only), 'fft' or 'direct'
+            weights (numpy.ndarray, optional): Kernel of length window_size,
+                normalised to unit sum; a boxcar is used if omitted
+            dtype (numpy.dtype, optional): Output precision, e.g. np.float32;
+                defaults to the input's floating precision
             
         Returns:
             numpy.ndarray: Filtered signal
         """
-        window = np.ones(window_size) / window_size
-        return np.convolve(signal_array, window, mode='same')
+        signal_array = np.asarray(signal_array)
+        kernel = _moving_average_kernel(window_size, weights)
+        if dtype is None:
+            dtype = np.result_type(signal_array.dtype, np.float32)
+        if mode not in ('same', 'valid', 'reflect'):
+            raise ValueError(f"Unsupported edge mode: {mode}")
+        if method == 'auto':
+            if kernel is None:
+                method = 'cumsum'
+            else:
+                method = 'direct' if window_size <= _DIRECT_MAX_TAPS else 'fft'
+        if method not in ('cumsum', 'fft', 'direct'):
+            raise ValueError(f"Unsupported moving average method: {method}")
+        if method == 'cumsum' and kernel is not None:
+            raise ValueError("The cumulative-sum method only supports an unweighted window")
+        if mode == 'valid' and signal_array.shape[axis] < window_size:
+            raise ValueError("Signal is shorter than the averaging window")
+
+        func = functools.partial(_moving_average_along_axis, window_size=window_size,
+                                 kernel=kernel, mode=mode, method=method,
+                                 dtype=dtype, axis=axis)
+        return DigitalFilters._apply_along_channels(func, signal_array, axis, workers)
+
+
+class StreamingFilter:
+    """
+    A stateful Butterworth filter for block-by-block processing.
+
+    The filter is designed once as second-order sections and the sosfilt
+    state (zi) is carried across process() calls, so filtering a stream
+    block by block gives exactly the same output as filtering the
+    concatenated blocks in one go.
+    """
+
+    def __init__(self, sos, axis=-1):
+        """
+        Create a streaming filter from second-order sections.
+
+        Args:
+            sos (numpy.ndarray): Second-order sections of shape (n_sections, 6)
+            axis (int): Time axis of the blocks; all other axes are channels
+        """
+        # Own a writable copy: sosfilt rejects read-only (cached) arrays
+        sos = np.array(sos, dtype=float)
+        if sos.ndim != 2 or sos.shape[1] != 6:
+            raise ValueError("SOS coefficients must have shape (n_sections, 6)")
+        self.sos = sos
+        self.axis = axis
+        self.reset()
+
+    @classmethod
+    def low_pass(cls, cutoff_freq, sampling_rate, order=4, axis=-1):
+        """
+        Create a streaming low-pass Butterworth filter.
+
+        Args:
+            cutoff_freq (float): Cutoff frequency in Hz
+            sampling_rate (int): Sampling rate in Hz
+            order (int): Filter order
+            axis (int): Time axis of the blocks
+
+        Returns:
+            StreamingFilter: Filter with zeroed state
+        """
+        nyquist = sampling_rate / 2
+        sos = DigitalFilters.design_cache.butter(order, cutoff_freq / nyquist, 'low', output='sos')
+        return cls(sos, axis)
+
+    @classmethod
+    def high_pass(cls, cutoff_freq, sampling_rate, order=4, axis=-1):
+        """
+        Create a streaming high-pass Butterworth filter.
+
+        Args:
+            cutoff_freq (float): Cutoff frequency in Hz
+            sampling_rate (int): Sampling rate in Hz
+            order (int): Filter order
+            axis (int): Time axis of the blocks
+
+        Returns:
+            StreamingFilter: Filter with zeroed state
+        """
+        nyquist = sampling_rate / 2
+        sos = DigitalFilters.design_cache.butter(order, cutoff_freq / nyquist, 'high', output='sos')
+        return cls(sos, axis)
+
+    @classmethod
+    def band_pass(cls, low_cutoff, high_cutoff, sampling_rate, order=4, axis=-1):
+        """
+        Create a streaming band-pass Butterworth filter.
+
+        Args:
+            low_cutoff (float): Lower cutoff frequency in Hz
+            high_cutoff (float): Upper cutoff frequency in Hz
+            sampling_rate (int): Sampling rate in Hz
+            order (int): Filter order
+            axis (int): Time axis of the blocks
+
+        Returns:
+            StreamingFilter: Filter with zeroed state
+        """
+        nyquist = sampling_rate / 2
+        normalized_cutoffs = [low_cutoff / nyquist, high_cutoff / nyquist]
+        sos = DigitalFilters.design_cache.butter(order, normalized_cutoffs, 'band', output='sos')
+        return cls(sos, axis)
+
+    def reset(self, initial_value=None):
+        """
+        Reset the filter state.
+
+        The state is shaped lazily from the first block processed, so the
+        same filter works for any number of channels.
+
+        Args:
+            initial_value (float, optional): If given, start in the steady
+                state for a constant input of this value instead of at rest
+        """
+        self.zi = None
+        self._initial_value = initial_value
+
+    def _initial_state(self, block):
+        """Build the sosfilt state for the channel layout of block."""
+        axis = self.axis % block.ndim
+        shape = list(block.shape)
+        shape[axis] = 2
+        zi = np.zeros((len(self.sos), *shape))
+        if self._initial_value is not None:
+            steady = signal.sosfilt_zi(self.sos) * self._initial_value
+            zi += np.expand_dims(steady, tuple(range(1, axis + 1)) +
+                                 tuple(range(axis + 2, block.ndim + 1)))
+        return zi
+
+    def process(self, block):
+        """
+        Filter the next block of a stream, updating the filter state.
+
+        Args:
+            block (numpy.ndarray): Next block of input samples
+
+        Returns:
+            numpy.ndarray: Filtered block of the same shape
+        """
+        block = np.asarray(block)
+        if self.zi is None:
+            self.zi = self._initial_state(block)
+        filtered, self.zi = signal.sosfilt(self.sos, block, axis=self.axis, zi=self.zi)
+        return filtered
+
+    def filter(self, signal_array):
+        """
+        Causally filter a complete signal from rest, leaving the stream state untouched.
+
+        Args:
+            signal_array (numpy.ndarray): Input signal
+
+        Returns:
+            numpy.ndarray: Filtered signal
+        """
+        return signal.sosfilt(self.sos, signal_array, axis=self.axis)
+
+    def filtfilt(self, signal_array):
+        """
+        Apply the filter forwards and backwards for zero-phase offline filtering.
+
+        Args:
+            signal_array (numpy.ndarray): Input signal
+
+        Returns:
+            numpy.ndarray: Filtered signal
+        """
+        return signal.sosfiltfilt(self.sos, signal_array, axis=self.axis)
+
+
+class MovingAverage:
+    """
+    A stateful moving average for block-by-block processing.
+
+    The last window_size - 1 input samples are carried between process()
+    calls, so the concatenated output equals the causal moving average of
+    the whole stream, np.convolve(x, window)[:len(x)], starting from rest.
+    Memory is bounded by the window and block sizes.
+    """
+
+    def __init__(self, window_size, weights=None, axis=-1, dtype=None):
+        """
+        Create a streaming moving average.
+
+        Args:
+            window_size (int): Size of the moving average window
+            weights (numpy.ndarray, optional): Kernel of length window_size,
+                normalised to unit sum; a boxcar is used if omitted
+            axis (int): Time axis of the blocks
+            dtype (numpy.dtype, optional): Output precision
+        """
+        self.window_size = window_size
+        self.kernel = _moving_average_kernel(window_size, weights)
+        self.axis = axis
+        self.dtype = dtype
+        self.reset()
+
+    def reset(self):
+        """Clear the carried history so the next block starts from rest."""
+        self.history = None
+
+    def process(self, block):
+        """
+        Average the next block of a stream.
+
+        Args:
+            block (numpy.ndarray): Next block of input samples
+
+        Returns:
+            numpy.ndarray: Averaged block of the same shape
+        """
+        block = np.moveaxis(np.asarray(block), self.axis, -1)
+        dtype = self.dtype or np.result_type(block.dtype, np.float32)
+        if self.history is None:
+            self.history = np.zeros(block.shape[:-1] + (self.window_size - 1,), dtype=block.dtype)
+        extended = np.concatenate([self.history, block], axis=-1)
+        self.history = extended[..., extended.shape[-1] - (self.window_size - 1):].copy()
+
+        if self.kernel is None:
+            averaged = _boxcar_valid(extended, self.window_size)
+        else:
+            method = 'direct' if self.window_size <= _DIRECT_MAX_TAPS else 'fft'
+            averaged = _convolve_valid(extended, self.kernel, method, dtype)
+        return np.moveaxis(averaged.astype(dtype, copy=False), -1, self.axis)
@@ -0,0 +1,290 @@
+import functools
+
+import numpy as np
+from scipy import fft, signal
+
+# Largest number of FFT samples transformed per batch of segments
+_SEGMENT_BATCH_SAMPLES = 1 << 20
+
+# Kernel spectra kept per convolver for differently sized stream blocks
+_MAX_CACHED_SPECTRA = 8
+
+
+@functools.lru_cache(maxsize=64)
+def _firwin(num_taps, cutoffs, pass_zero, window):
+    """Return cached, read-only windowed-sinc taps."""
+    taps = signal.firwin(num_taps, cutoffs, pass_zero=pass_zero, window=window, fs=2.0)
+    taps.setflags(write=False)
+    return taps
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_convolver(num_taps, cutoffs, pass_zero, window):
+    """Return a shared convolver for a cached design (convolve() is stateless)."""
+    return OverlapSaveConvolver(_firwin(num_taps, cutoffs, pass_zero, window))
+
+
+def best_fft_size(num_taps):
+    """
+    Choose the overlap-save FFT size with the lowest cost per output sample.
+
+    Each segment of n samples costs about n * log2(n) operations and yields
+    n - num_taps + 1 output samples; the optimum is usually 4-8 times the
+    kernel length.
+
+    Args:
+        num_taps (int): Kernel length
+
+    Returns:
+        int: FFT size
+    """
+    best_size, best_cost = None, np.inf
+    size = fft.next_fast_len(2 * num_taps, real=True)
+    while size <= 64 * num_taps + 1024:
+        cost = size * np.log2(size) / (size - num_taps + 1)
+        if cost < best_cost:
+            best_size, best_cost = size, cost
+        size = fft.next_fast_len(size + 1, real=True)
+    return best_size
+
+
+class OverlapSaveConvolver:
+    """
+    Overlap-save FFT convolution for long FIR kernels.
+
+    The kernel spectrum is computed once for the chosen FFT size. Each
+    segment of the input is transformed, multiplied by it and transformed
+    back, keeping only the samples that do not wrap around. All segments
+    of a block are built as a strided view and transformed in one batch.
+    """
+
+    def __init__(self, taps, fft_size=None, axis=-1):
+        """
+        Create a convolver for a fixed kernel.
+
+        Args:
+            taps (numpy.ndarray): FIR filter coefficients
+            fft_size (int, optional): Segment FFT size; chosen for best
+                throughput if omitted
+            axis (int): Time axis of the input; all other axes are channels
+        """
+        taps = np.asarray(taps, dtype=float)
+        if taps.ndim != 1 or len(taps) == 0:
+            raise ValueError("Taps must be a non-empty one-dimensional array")
+        self.taps = taps
+        self.num_taps = len(taps)
+        if fft_size is None:
+            fft_size = best_fft_size(self.num_taps)
+        if fft_size < self.num_taps:
+            raise ValueError("FFT size must be at least the number of taps")
+        self.fft_size = fft_size
+        self.hop = fft_size - self.num_taps + 1
+        self._spectra = {}
+        self.kernel_spectrum = self._kernel_spectrum(fft_size)
+        self.axis = axis
+        self.reset()
+
+    def _kernel_spectrum(self, fft_size):
+        """Return the kernel spectrum for an FFT size, computing it only once."""
+        spectrum = self._spectra.get(fft_size)
+        if spectrum is None:
+            spectrum = fft.rfft(self.taps, fft_size)
+            spectrum.setflags(write=False)
+            if len(self._spectra) >= _MAX_CACHED_SPECTRA:
+                # Keep the main segment spectrum, drop the oldest block-sized one
+                oldest = next(size for size in self._spectra if size != self.fft_size)
+                del self._spectra[oldest]
+            self._spectra[fft_size] = spectrum
+        return spectrum
+
+    def reset(self):
+        """Clear the carried input history so the next block starts from rest."""
+        self.history = None
+
+    def _filter(self, buffer, n_out, workers, fft_size=None):
+        """Return the n_out valid convolution samples of buffer along the last axis."""
+        float_dtype = np.result_type(buffer.dtype, np.float32)
+        if n_out == 0:
+            return np.empty(buffer.shape[:-1] + (0,), dtype=float_dtype)
+        fft_size = fft_size or self.fft_size
+        hop = fft_size - self.num_taps + 1
+        n_segments = -(-n_out // hop)
+        needed = n_segments * hop + self.num_taps - 1
+        if buffer.shape[-1] < needed:
+            pad = [(0, 0)] * (buffer.ndim - 1) + [(0, needed - buffer.shape[-1])]
+            buffer = np.pad(buffer, pad)
+        segments = np.lib.stride_tricks.sliding_window_view(
+            buffer, fft_size, axis=-1)[..., ::hop, :][..., :n_segments, :]
+
+        spectrum = self._kernel_spectrum(fft_size).astype(
+            np.result_type(float_dtype, np.complex64), copy=False)
+        out = np.empty(buffer.shape[:-1] + (n_segments, hop), dtype=float_dtype)
+        batch = max(1, _SEGMENT_BATCH_SAMPLES // fft_size)
+        for start in range(0, n_segments, batch):
+            stop = min(start + batch, n_segments)
+            transformed = fft.rfft(segments[..., start:stop, :], axis=-1, workers=workers)
+            transformed *= spectrum
+            out[..., start:stop, :] = fft.irfft(transformed, fft_size, axis=-1,
+                                               workers=workers)[..., self.num_taps - 1:]
+        return out.reshape(buffer.shape[:-1] + (-1,))[..., :n_out]
+
+    def process(self, block, workers=None):
+        """
+        Filter the next block of a stream.
+
+        The last num_taps - 1 input samples are carried between calls, so the
+        concatenated output equals the causal convolution of the stream.
+        Blocks shorter than one segment are transformed as a single,
+        smaller segment to avoid padding them up to the full FFT size.
+
+        Args:
+            block (numpy.ndarray): Next block of input samples
+            workers (int, optional): Number of workers for scipy.fft
+
+        Returns:
+            numpy.ndarray: Filtered block of the same shape
+        """
+        block = np.moveaxis(np.asarray(block), self.axis, -1)
+        if self.history is None:
+            self.history = np.zeros(block.shape[:-1] + (self.num_taps - 1,), dtype=block.dtype)
+        buffer = np.concatenate([self.history, block], axis=-1)
+        self.history = buffer[..., buffer.shape[-1] - (self.num_taps - 1):].copy()
+        n_out = block.shape[-1]
+        fft_size = None
+        if n_out < self.hop:
+            fft_size = fft.next_fast_len(n_out + self.num_taps - 1, real=True)
+        filtered = self._filter(buffer, n_out, workers, fft_size)
+        return np.moveaxis(filtered, -1, self.axis)
+
+    def convolve(self, signal_array, mode='full', workers=None):
+        """
+        Convolve a complete signal with the kernel, leaving the stream state untouched.
+
+        Args:
+            signal_array (numpy.ndarray): Input signal
+            mode (str): 'full', 'same' or 'valid', as in np.convolve
+            workers (int, optional): Number of workers for scipy.fft
+
+        Returns:
+            numpy.ndarray: Convolved signal
+        """
+        signal_array = np.moveaxis(np.asarray(signal_array), self.axis, -1)
+        n = signal_array.shape[-1]
+        full_len = n + self.num_taps - 1
+        if mode == 'full':
+            start, stop = 0, full_len
+        elif mode == 'same':
+            start = (self.num_taps - 1) // 2
+            stop = start + n
+        elif mode == 'valid':
+            if n < self.num_taps:
+                raise ValueError("Signal is shorter than the kernel")
+            start, stop = self.num_taps - 1, n
+        else:
+            raise ValueError(f"Unsupported convolution mode: {mode}")
+
+        # Zero history in front, zero flush behind; only compute what is returned
+        pad = [(0, 0)] * (signal_array.ndim - 1) + [(self.num_taps - 1, 0)]
+        buffer = np.pad(signal_array, pad)[..., start:]
+        filtered = self._filter(buffer, stop - start, workers)
+        return np.moveaxis(filtered, -1, self.axis)
+
+
+class FIRFilters:
+    """A class implementing linear-phase FIR filters."""
+
+    @staticmethod
+    def design(num_taps, cutoff_freq, sampling_rate, btype='low', window='hamming'):
+        """
+        Design a linear-phase windowed-sinc FIR filter.
+
+        Args:
+            num_taps (int): Number of filter taps (odd for high-pass/band-pass)
+            cutoff_freq (float or tuple): Cutoff frequency in Hz, or
+                (low, high) for band-pass
+            sampling_rate (int): Sampling rate in Hz
+            btype (str): Filter type ('low', 'high' or 'band')
+            window (str): Window type ('hamming', 'hann', 'blackman', etc.)
+
+        Returns:
+            numpy.ndarray: Read-only filter taps
+        """
+        nyquist = sampling_rate / 2
+        cutoffs = tuple(float(c) / nyquist for c in np.atleast_1d(cutoff_freq))
+        if btype not in ('low', 'high', 'band'):
+            raise ValueError(f"Unsupported filter type: {btype}")
+        return _firwin(num_taps, cutoffs, btype == 'low', window)
+
+    @staticmethod
+    def _apply(signal_array, num_taps, cutoff_freq, sampling_rate, btype, window, axis, workers):
+        """Filter with a cached design, compensating the linear-phase delay."""
+        nyquist = sampling_rate / 2
+        cutoffs = tuple(float(c) / nyquist for c in np.atleast_1d(cutoff_freq))
+        convolver = _cached_convolver(num_taps, cutoffs, btype == 'low', window)
+        signal_array = np.moveaxis(np.asarray(signal_array), axis, -1)
+        filtered = convolver.convolve(signal_array, mode='same', workers=workers)
+        return np.moveaxis(filtered, -1, axis)
+
+    @staticmethod
+    def low_pass_filter(signal_array, cutoff_freq, sampling_rate, num_taps=1001,
+                        window='hamming', axis=-1, workers=None):
+        """
+        Apply a linear-phase low-pass FIR filter with its delay removed.
+
+        Args:
+            signal_array (numpy.ndarray): Input signal (N-D for multichannel)
+            cutoff_freq (float): Cutoff frequency in Hz
+            sampling_rate (int): Sampling rate in Hz
+            num_taps (int): Number of filter taps (odd for zero delay)
+            window (str): Window type
+            axis (int): Axis of signal_array to filter along
+            workers (int, optional): Number of workers for scipy.fft
+
+        Returns:
+            numpy.ndarray: Filtered signal
+        """
+        return FIRFilters._apply(signal_array, num_taps, cutoff_freq, sampling_rate,
+                                 'low', window, axis, workers)
+
+    @staticmethod
+    def high_pass_filter(signal_array, cutoff_freq, sampling_rate, num_taps=1001,
+                         window='hamming', axis=-1, workers=None):
+        """
+        Apply a linear-phase high-pass FIR filter with its delay removed.
+
+        Args:
+            signal_array (numpy.ndarray): Input signal (N-D for multichannel)
+            cutoff_freq (float): Cutoff frequency in Hz
+            sampling_rate (int): Sampling rate in Hz
+            num_taps (int): Number of filter taps (must be odd)
+            window (str): Window type
+            axis (int): Axis of signal_array to filter along
+            workers (int, optional): Number of workers for scipy.fft
+
+        Returns:
+            numpy.ndarray: Filtered signal
+        """
+        return FIRFilters._apply(signal_array, num_taps, cutoff_freq, sampling_rate,
+                                 'high', window, axis, workers)
+
+    @staticmethod
+    def band_pass_filter(signal_array, low_cutoff, high_cutoff, sampling_rate, num_taps=1001,
+                         window='hamming', axis=-1, workers=None):
+        """
+        Apply a linear-phase band-pass FIR filter with its delay removed.
+
+        Args:
+            signal_array (numpy.ndarray): Input signal (N-D for multichannel)
+            low_cutoff (float): Lower cutoff frequency in Hz
+            high_cutoff (float): Upper cutoff frequency in Hz
+            sampling_rate (int): Sampling rate in Hz
+            num_taps (int): Number of filter taps (must be odd)
+            window (str): Window type
+            axis (int): Axis of signal_array to filter along
+            workers (int, optional): Number of workers for scipy.fft
+
+        Returns:
+            numpy.ndarray: Filtered signal
+        """
+        return FIRFilters._apply(signal_array, num_taps, (low_cutoff, high_cutoff),
+                                 sampling_rate, 'band', window, axis, workers)
@@ -0,0 +1,227 @@
+import functools
+from math import gcd
+
+import numpy as np
+from scipy import signal
+
+# Number of window samples gathered per batch when streaming
+_STREAM_BATCH_SAMPLES = 1 << 20
+
+
+@functools.lru_cache(maxsize=32)
+def _anti_alias_filter(up, down, window):
+    """
+    Return the cached, read-only anti-aliasing low-pass for an up/down ratio.
+
+    The design matches scipy.signal.resample_poly: a windowed sinc with its
+    cutoff at the lower of the two Nyquist rates and 10 taps per phase on
+    each side.
+    """
+    max_rate = max(up, down)
+    if max_rate == 1:
+        taps = np.ones(1)
+        taps.setflags(write=False)
+        return taps
+    half_len = 10 * max_rate
+    taps = signal.firwin(2 * half_len + 1, 1.0 / max_rate, window=window)
+    taps.setflags(write=False)
+    return taps
+
+
+class Resampler:
+    """
+    Rational-factor polyphase resampler.
+
+    Changes the sampling rate by up / down using a cached anti-aliasing
+    filter. resample() handles complete signals through scipy's polyphase
+    upfirdn. process()/flush() handle streams block by block, emitting
+    each output sample as soon as its input is available. The concatenated
+    stream output is sample-for-sample the same as resample() on the whole
+    signal, including its ceil(len * up / down) length.
+    """
+
+    def __init__(self, up, down, window=('kaiser', 5.0), axis=-1):
+        """
+        Create a resampler for the ratio up / down.
+
+        Args:
+            up (int): Upsampling factor
+            down (int): Downsampling factor
+            window (str or tuple): Window used to design the anti-aliasing filter
+            axis (int): Time axis of the input; all other axes are channels
+        """
+        if int(up) != up or int(down) != down or up < 1 or down < 1:
+            raise ValueError("Resampling factors must be positive integers")
+        divisor = gcd(int(up), int(down))
+        self.up = int(up) // divisor
+        self.down = int(down) // divisor
+        self.window = window
+        self.axis = axis
+        self.taps = _anti_alias_filter(self.up, self.down, window)
+        self.delay = (len(self.taps) - 1) // 2
+
+        # Polyphase table: output with phase p is a dot product of the most
+        # recent input samples with scaled_taps[p::up], newest sample first
+        self.taps_per_phase = -(-len(self.taps) // self.up)
+        scaled = np.zeros(self.taps_per_phase * self.up)
+        scaled[:len(self.taps)] = self.taps * self.up
+        self._phases = np.ascontiguousarray(
+            scaled.reshape(self.taps_per_phase, self.up).T[:, ::-1])
+        # Channel axes of the latest stream, kept across resets
+        self._channel_shape = ()
+        self.reset()
+
+    @classmethod
+    def from_rates(cls, input_rate, output_rate, window=('kaiser', 5.0), axis=-1):
+        """
+        Create a resampler converting between two integer sampling rates.
+
+        Args:
+            input_rate (int): Input sampling rate in Hz
+            output_rate (int): Output sampling rate in Hz
+            window (str or tuple): Window used to design the anti-aliasing filter
+            axis (int): Time axis of the input
+
+        Returns:
+            Resampler: Resampler for output_rate / input_rate
+        """
+        return cls(output_rate, input_rate, window, axis)
+
+    def output_length(self, input_length):
+        """
+        Return the number of output samples produced for a given input length.
+
+        Args:
+            input_length (int): Number of input samples
+
+        Returns:
+            int: ceil(input_length * up / down)
+        """
+        return -(-input_length * self.up // self.down)
+
+    def resample(self, signal_array):
+        """
+        Resample a complete signal.
+
+        Args:
+            signal_array (numpy.ndarray): Input signal
+
+        Returns:
+            numpy.ndarray: Resampled signal
+        """
+        return signal.resample_poly(signal_array, self.up, self.down, axis=self.axis,
+                                    window=np.array(self.taps))
+
+    def reset(self):
+        """Discard buffered input so the next block starts a new stream."""
+        self._buffer = None
+        self._buffer_start = 0
+        self._received = 0
+        self._emitted = 0
+
+    def _window_end(self, output_index):
+        """Return the newest input index contributing to an output sample."""
+        return (output_index * self.down + self.delay) // self.up
+
+    def _emit(self, stop):
+        """Compute outputs [emitted, stop) from the buffer and drop spent input."""
+        start = self._emitted
+        count = max(0, stop - start)
+        out = np.empty(self._buffer.shape[:-1] + (count,))
+        if count == 0:
+            return out
+        windows = np.lib.stride_tricks.sliding_window_view(
+            self._buffer, self.taps_per_phase, axis=-1)
+
+        if count < 32 * self.up:
+            # Few outputs per phase: gather every window and its phase at once
+            positions = np.arange(start, stop) * self.down + self.delay
+            first = positions // self.up - self.taps_per_phase + 1 - self._buffer_start
+            out[...] = np.einsum('...mk,mk->...m', windows[..., first, :],
+                                 self._phases[positions % self.up])
+        else:
+            # Outputs up apart share a phase and step down input samples
+            # apart, so each phase is a strided view times one table row
+            for offset in range(self.up):
+                index = start + offset
+                phase = (index * self.down + self.delay) % self.up
+                first = self._window_end(index) - self.taps_per_phase + 1 - self._buffer_start
+                n_phase = len(range(offset, count, self.up))
+                batch = max(1, _STREAM_BATCH_SAMPLES // self.taps_per_phase)
+                for b in range(0, n_phase, batch):
+                    n = min(batch, n_phase - b)
+                    lo = first + b * self.down
+                    view = windows[..., lo:lo + (n - 1) * self.down + 1:self.down, :]
+                    out[..., offset + b * self.up:offset + (b + n) * self.up:self.up] = (
+                        view @ self._phases[phase])
+
+        self._emitted = max(start, stop)
+        keep_from = self._window_end(self._emitted) - self.taps_per_phase + 1
+        drop = keep_from - self._buffer_start
+        if drop > 0:
+            self._buffer = self._buffer[..., drop:]
+            self._buffer_start = keep_from
+        return out
+
+    def process(self, block):
+        """
+        Resample the next block of a stream.
+
+        Outputs are delayed by half the filter length relative to the input,
+        so early calls may return fewer samples; flush() returns the rest.
+
+        Args:
+            block (numpy.ndarray): Next block of input samples
+
+        Returns:
+            numpy.ndarray: Output samples that are now complete
+        """
+        block = np.moveaxis(np.asarray(block, dtype=float), self.axis, -1)
+        if self._buffer is None:
+            self._channel_shape = block.shape[:-1]
+            # Zeros standing in for the samples before the stream starts
+            self._buffer = np.zeros(block.shape[:-1] + (self.taps_per_phase - 1,))
+            self._buffer_start = -(self.taps_per_phase - 1)
+        self._buffer = np.concatenate([self._buffer, block], axis=-1)
+        self._received += block.shape[-1]
+        ready = (self._received * self.up - 1 - self.delay) // self.down + 1
+        return np.moveaxis(self._emit(ready), -1, self.axis)
+
+    def flush(self):
+        """
+        Finish the stream, returning the remaining output samples.
+
+        The stream is reset afterwards, so the resampler can be reused.
+        A stream that received no blocks yields no samples, with the channel
+        axes of the previous stream (none if there was no previous stream).
+
+        Returns:
+            numpy.ndarray: Remaining output samples
+        """
+        if self._buffer is None:
+            return np.moveaxis(np.empty(self._channel_shape + (0,)), -1, self.axis)
+        total = self.output_length(self._received)
+        # Zeros standing in for the samples after the stream ends
+        end = self._window_end(total - 1) + 1 if total > 0 else 0
+        missing = end - (self._buffer_start + self._buffer.shape[-1])
+        if missing > 0:
+            pad = [(0, 0)] * (self._buffer.ndim - 1) + [(0, missing)]
+            self._buffer = np.pad(self._buffer, pad)
+        out = self._emit(total)
+        self.reset()
+        return np.moveaxis(out, -1, self.axis)
+
+    @staticmethod
+    def decimate(signal_array, factor, axis=-1):
+        """
+        Low-pass filter and downsample a signal by an integer factor.
+
+        Args:
+            signal_array (numpy.ndarray): Input signal
+            factor (int): Downsampling factor
+            axis (int): Axis of signal_array to decimate along
+
+        Returns:
+            numpy.ndarray: Decimated signal of length ceil(len / factor)
+        """
+        return Resampler(1, factor, axis=axis).resample(signal_array)
@@ -0,0 +1,143 @@
+"""
+Colored Noise Module
+
+Streaming generation of white, pink, brown, blue and violet noise. Each
+color is Gaussian white noise shaped by a small IIR filter whose state is
+carried between blocks, so memory per block is O(1) and the power spectral
+density does not depend on how long the stream runs.
+"""
+
+import functools
+
+import numpy as np
+from scipy import signal
+
+# Pole of the leaky integrator used for brown noise (corner near 0.0003 fs)
+_BROWN_POLE = 0.998
+
+# Samples of impulse response used to compute each filter's noise gain
+_GAIN_LENGTH = 1 << 16
+
+# Three-pole, three-zero 1/f approximation (J. O. Smith), within about
+# 0.3 dB of a -10 dB/decade slope over the upper nine octaves
+_PINK_B = (0.049922035, -0.095993537, 0.050612699, -0.004408786)
+_PINK_A = (1.0, -2.494956002, 2.017265875, -0.522189400)
+
+_COLOR_FILTERS = {
+    'white': ((1.0,), (1.0,)),
+    'pink': (_PINK_B, _PINK_A),
+    'brown': ((1.0,), (1.0, -_BROWN_POLE)),
+    # Differencing multiplies the PSD by |2 sin(pi f / fs)|^2, roughly f^2
+    'blue': (tuple(np.convolve(_PINK_B, (1.0, -1.0))), _PINK_A),
+    'violet': ((1.0, -1.0), (1.0,)),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _unit_filter(color):
+    """
+    Return (b, a, warmup) for a color, scaled to unit output variance.
+
+    warmup is the number of samples needed for the filter state to forget
+    its zero start, used to begin every stream in the steady state.
+    """
+    b, a = (np.array(c) for c in _COLOR_FILTERS[color])
+    impulse = np.zeros(_GAIN_LENGTH)
+    impulse[0] = 1.0
+    gain = np.sqrt(np.sum(signal.lfilter(b, a, impulse) ** 2))
+    b = b / gain
+
+    poles = np.abs(np.roots(a)) if len(a) > 1 else np.zeros(1)
+    slowest = poles.max()
+    warmup = 0 if slowest == 0 else int(np.ceil(np.log(1e-6) / np.log(slowest)))
+    # FIR shaping only needs its delay line filled
+    warmup = max(warmup, max(len(a), len(b)) - 1)
+    b.setflags(write=False)
+    a.setflags(write=False)
+    return b, a, warmup
+
+
+class ColoredNoise:
+    """
+    Unbounded stream of colored noise with a fixed power spectral density.
+
+    Supported colors and their PSD slopes: white (flat), pink (1/f),
+    brown (1/f^2 above a low corner), blue (f) and violet (f^2). Output is
+    scaled so its RMS level equals amplitude from the first sample on.
+    """
+
+    COLORS = tuple(_COLOR_FILTERS)
+
+    def __init__(self, color='pink', amplitude=1.0, rng=None):
+        """
+        Create a noise stream.
+
+        Args:
+            color (str): Noise color ('white', 'pink', 'brown', 'blue', 'violet')
+            amplitude (float): RMS level of the noise
+            rng (numpy.random.Generator or int, optional): Random generator or
+                seed, for reproducible streams
+        """
+        color = color.lower()
+        if color not in _COLOR_FILTERS:
+            raise ValueError(f"Unsupported noise type: {color}")
+        self.color = color
+        self.amplitude = amplitude
+        self.rng = np.random.default_rng(rng)
+        self._b, self._a, self._warmup = _unit_filter(color)
+        self.reset()
+
+    def reset(self):
+        """Restart the filter in its steady state, continuing the random stream."""
+        order = max(len(self._a), len(self._b)) - 1
+        self._zi = np.zeros(order)
+        if order:
+            _, self._zi = signal.lfilter(self._b, self._a,
+                                         self.rng.standard_normal(self._warmup), zi=self._zi)
+
+    def generate(self, num_samples, dtype=np.float64, out=None):
+        """
+        Generate the next block of the stream.
+
+        Args:
+            num_samples (int): Number of samples
+            dtype (numpy.dtype): Output dtype (float64 or float32)
+            out (numpy.ndarray, optional): Buffer of length num_samples to
+                write the block into
+
+        Returns:
+            numpy.ndarray: Noise block
+        """
+        white = self.rng.standard_normal(num_samples)
+        if len(self._zi):
+            shaped, self._zi = signal.lfilter(self._b, self._a, white, zi=self._zi)
+        else:
+            shaped = white
+        shaped *= self.amplitude
+        if out is None:
+            return shaped.astype(dtype, copy=False)
+        if out.shape != (num_samples,):
+            raise ValueError(f"Output buffer must have shape {(num_samples,)}")
+        out[...] = shaped
+        return out
+
+    def blocks(self, block_size=4096, num_samples=None, dtype=np.float64):
+        """
+        Yield fixed-size blocks of the stream.
+
+        Args:
+            block_size (int): Number of samples per block (the last may be shorter)
+            num_samples (int, optional): Total number of samples; unbounded if None
+            dtype (numpy.dtype): Output dtype (float64 or float32)
+
+        Yields:
+            numpy.ndarray: Next noise block
+        """
+        if block_size <= 0:
+            raise ValueError("Block size must be a positive integer")
+        remaining = num_samples
+        while remaining is None or remaining > 0:
+            n = block_size if remaining is None else min(block_size, remaining)
+            yield self.generate(n, dtype)
+            if remaining is not None:
+                remaining -= n
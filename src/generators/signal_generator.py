@@ -16,11 +16,241 @@ Key Features:
 - Precise frequency generation (self-implemented algorithms)
 - Multiple waveform types (expanded beyond course material)
 - Customizable noise generation with security features
+- Streaming colored noise (pink, brown, blue, violet)
+- Multi-tone synthesis with an oscillator bank
 - Amplitude control with validation
 - Secure random number generation for noise
 """
 
+from fractions import Fraction
+import functools
+import threading
+
 import numpy as np
+from scipy import fft
+
+from .colored_noise import ColoredNoise
+from .oscillator_bank import OscillatorBank
+
+# Samples generated per chunk when filling an output buffer
+_CHUNK_SIZE = 1 << 14
+
+# Sample offsets 0.._CHUNK_SIZE-1, shifted per chunk to build time values
+_RAMP = np.arange(_CHUNK_SIZE, dtype=np.float64)
+_RAMP.setflags(write=False)
+
+_scratch = threading.local()
+
+
+def _scratch_buffers():
+    """Return this thread's pair of reusable float64 chunk buffers."""
+    buffers = getattr(_scratch, 'buffers', None)
+    if buffers is None:
+        buffers = _scratch.buffers = (np.empty(_CHUNK_SIZE), np.empty(_CHUNK_SIZE))
+    return buffers
+
+
+def _generate_into(out, step, start, kernel):
+    """
+    Fill out with kernel applied to the time values (start + k) * step.
+
+    The work is done chunk by chunk in place: float64 buffers are written
+    directly and other dtypes go through a per-thread float64 scratch chunk,
+    so steady-state generation into a reused buffer allocates nothing.
+    kernel(t, tmp) must overwrite t with the signal, using tmp (same size)
+    as scratch if it needs a second array.
+    """
+    time_chunk, tmp_chunk = _scratch_buffers()
+    direct = out.dtype == np.float64
+    for offset in range(0, len(out), _CHUNK_SIZE):
+        n = min(_CHUNK_SIZE, len(out) - offset)
+        t = out[offset:offset + n] if direct else time_chunk[:n]
+        np.add(_RAMP[:n], start + offset, out=t)
+        t *= step
+        kernel(t, tmp_chunk[:n])
+        if not direct:
+            out[offset:offset + n] = t
+
+
+def _output_buffer(num_samples, dtype, out):
+    """Validate a caller-supplied buffer or allocate a new one."""
+    if out is None:
+        dtype = np.dtype(dtype)
+        if dtype not in (np.float32, np.float64):
+            raise ValueError("dtype must be float32 or float64")
+        return np.empty(num_samples, dtype=dtype)
+    if out.shape != (num_samples,):
+        raise ValueError(f"Output buffer must have shape {(num_samples,)}")
+    if out.dtype not in (np.float32, np.float64) or not out.flags.c_contiguous:
+        raise ValueError("Output buffer must be a contiguous float32 or float64 array")
+    return out
+
+
+def _time_axis(duration, num_samples, time_axis):
+    """Return the time array, a lazy SampleTimes, or None."""
+    if time_axis == 'array':
+        return np.linspace(0, duration, num_samples, False)
+    if time_axis == 'lazy':
+        return SampleTimes(num_samples, duration / num_samples if num_samples else 0.0)
+    if time_axis is None:
+        return None
+    raise ValueError(f"Unsupported time axis mode: {time_axis}")
+
+
+class SampleTimes:
+    """
+    Lazy time axis equivalent to np.linspace(0, duration, num_samples, False).
+
+    Values are computed on indexing or conversion with np.asarray, so
+    callers that never look at the time axis never pay for it.
+    """
+
+    def __init__(self, num_samples, step):
+        self.num_samples = num_samples
+        self.step = step
+
+    @property
+    def shape(self):
+        return (self.num_samples,)
+
+    @property
+    def dtype(self):
+        return np.dtype(np.float64)
+
+    def __len__(self):
+        return self.num_samples
+
+    def __getitem__(self, index):
+        indices = range(self.num_samples)[index]
+        if isinstance(indices, range):
+            return np.arange(indices.start, indices.stop, indices.step, dtype=float) * self.step
+        return indices * self.step
+
+    def __array__(self, dtype=None, copy=None):
+        times = np.arange(self.num_samples, dtype=float) * self.step
+        return times if dtype is None else times.astype(dtype)
+
+
+def _sine_kernel(frequency, amplitude):
+    def kernel(t, _):
+        t *= 2 * np.pi * frequency
+        np.sin(t, out=t)
+        t *= amplitude
+    kernel.frequency = frequency
+    return kernel
+
+
+def _square_kernel(frequency, amplitude, duty_cycle):
+    def kernel(t, _):
+        t *= frequency
+        np.remainder(t, 1, out=t)
+        np.less(t, duty_cycle, out=t)
+        t *= 2
+        t -= 1
+        t *= amplitude
+    kernel.frequency = frequency
+    return kernel
+
+
+def _white_noise_kernel(amplitude, rng):
+    def kernel(t, _):
+        if rng is None:
+            t[...] = np.random.random(len(t))
+        else:
+            rng.random(out=t)
+        t *= 2
+        t -= 1
+        t *= amplitude
+    return kernel
+
+
+_CHIRP_METHODS = ('linear', 'quadratic', 'logarithmic', 'hyperbolic')
+
+
+def _chirp_phase(start_freq, end_freq, duration, method):
+    """
+    Return an in-place function mapping time to phase in cycles.
+
+    The phase is the integral of the instantaneous frequency, which sweeps
+    from start_freq at t = 0 to end_freq at t = duration following the
+    given law (the same laws as scipy.signal.chirp, with the quadratic
+    vertex at t = 0).
+    """
+    f0, f1, d = start_freq, end_freq, duration
+    if method not in _CHIRP_METHODS:
+        raise ValueError(f"Unsupported chirp method: {method}")
+    if method in ('logarithmic', 'hyperbolic') and f0 * f1 <= 0:
+        raise ValueError(f"A {method} chirp needs nonzero frequencies of the same sign")
+
+    if f0 == f1:
+        def phase(t, _):
+            t *= f0
+    elif method == 'linear':
+        def phase(t, tmp):
+            # f0 t + (f1 - f0) t^2 / 2d
+            np.multiply(t, (f1 - f0) / (2 * d), out=tmp)
+            tmp += f0
+            t *= tmp
+    elif method == 'quadratic':
+        def phase(t, tmp):
+            # f0 t + (f1 - f0) t^3 / 3d^2
+            np.multiply(t, t, out=tmp)
+            tmp *= (f1 - f0) / (3 * d * d)
+            tmp += f0
+            t *= tmp
+    elif method == 'logarithmic':
+        rate = np.log(f1 / f0) / d
+
+        def phase(t, _):
+            # f0 (exp(rate t) - 1) / rate
+            t *= rate
+            np.expm1(t, out=t)
+            t *= f0 / rate
+    else:
+        # The frequency f0 f1 d / ((f0 - f1) t + f1 d) has a pole at t = pole
+        pole = f1 * d / (f1 - f0)
+
+        def phase(t, _):
+            # -f0 pole ln(1 - t / pole)
+            t *= -1 / pole
+            np.log1p(t, out=t)
+            t *= -f0 * pole
+    return phase
+
+
+def _chirp_kernel(start_freq, end_freq, duration, amplitude, method='linear'):
+    phase = _chirp_phase(start_freq, end_freq, duration, method)
+
+    def kernel(t, tmp):
+        phase(t, tmp)
+        # Wrap to one cycle so late samples of long sweeps keep sin() accurate
+        np.remainder(t, 1, out=t)
+        t *= 2 * np.pi
+        np.sin(t, out=t)
+        t *= amplitude
+    return kernel
+
+
+@functools.lru_cache(maxsize=16)
+def _chirp_inverse_spectrum(start_freq, end_freq, duration, sampling_rate, method, n_fft,
+                            regularization):
+    """
+    Return the cached, read-only regularized inverse of a unit chirp's spectrum.
+
+    The inverse is conj(X) / (|X|^2 + regularization * max|X|^2), which
+    equals 1 / X wherever the sweep has energy and falls to zero outside
+    the swept band instead of amplifying noise there.
+    """
+    num_samples = int(sampling_rate * duration)
+    sweep = np.empty(num_samples)
+    _generate_into(sweep, duration / num_samples if num_samples else 0.0, 0,
+                   _chirp_kernel(start_freq, end_freq, duration, 1.0, method))
+    spectrum = fft.rfft(sweep, n_fft)
+    power = spectrum.real ** 2 + spectrum.imag ** 2
+    inverse = np.conj(spectrum) / (power + regularization * power.max())
+    inverse.setflags(write=False)
+    return inverse
+
 
 class SignalGenerator:
     """
@@ -32,7 +262,8 @@ class SignalGenerator:
     """
     
     @staticmethod
-    def sine_wave(frequency, duration, sampling_rate=44100, amplitude=1.0):
+    def sine_wave(frequency, duration, sampling_rate=44100, amplitude=1.0,
+                  time_axis='array', dtype=np.float64, out=None):
         """
         Generate a sine wave.
         
@@ -41,16 +272,24 @@ class SignalGenerator:
             duration (float): Duration of the signal in seconds
             sampling_rate (int): Number of samples per second
             amplitude (float): Peak amplitude of the sine wave
+            time_axis (str or None): 'array' for a time array, 'lazy' for a
+                SampleTimes computed on demand, None to skip it
+            dtype (numpy.dtype): Output dtype (float64 or float32)
+            out (numpy.ndarray, optional): Buffer to generate into; its dtype
+                takes precedence over dtype
             
         Returns:
             tuple: (time_array, signal_array)
         """
-        t = np.linspace(0, duration, int(sampling_rate * duration), False)
-        signal = amplitude * np.sin(2 * np.pi * frequency * t)
-        return t, signal
+        num_samples = int(sampling_rate * duration)
+        signal = _output_buffer(num_samples, dtype, out)
+        _generate_into(signal, duration / num_samples if num_samples else 0.0, 0,
+                       _sine_kernel(frequency, amplitude))
+        return _time_axis(duration, num_samples, time_axis), signal
     
     @staticmethod
-    def square_wave(frequency, duration, sampling_rate=44100, amplitude=1.0, duty_cycle=0.5):
+    def square_wave(frequency, duration, sampling_rate=44100, amplitude=1.0, duty_cycle=0.5,
+                    time_axis='array', dtype=np.float64, out=None):
         """
         Generate a square wave.
         
@@ -60,54 +299,75 @@ class SignalGenerator:
             sampling_rate (int): Number of samples per second
             amplitude (float): Peak amplitude of the square wave
             duty_cycle (float): Duty cycle of the square wave (0 to 1)
+            time_axis (str or None): 'array', 'lazy' or None, as in sine_wave()
+            dtype (numpy.dtype): Output dtype (float64 or float32)
+            out (numpy.ndarray, optional): Buffer to generate into
             
         Returns:
             tuple: (time_array, signal_array)
         """
-        t = np.linspace(0, duration, int(sampling_rate * duration), False)
-        signal = amplitude * (((frequency * t) % 1) < duty_cycle).astype(float) * 2 - 1
-        return t, signal
+        num_samples = int(sampling_rate * duration)
+        signal = _output_buffer(num_samples, dtype, out)
+        _generate_into(signal, duration / num_samples if num_samples else 0.0, 0,
+                       _square_kernel(frequency, amplitude, duty_cycle))
+        return _time_axis(duration, num_samples, time_axis), signal
     
     @staticmethod
-    def noise(duration, sampling_rate=44100, amplitude=1.0, noise_type='white'):
+    def noise(duration, sampling_rate=44100, amplitude=1.0, noise_type='white',
+              time_axis='array', dtype=np.float64, out=None, rng=None):
         """
         Generate noise signal.
+
+        Pink noise comes from the same 1/f filter as ColoredNoise, run over
+        the output buffer a chunk at a time, and is then scaled so its peak
+        equals amplitude. Only the peak scaling needs the whole signal; use
+        noise_blocks() for an RMS-levelled stream of any length.
         
         Args:
             duration (float): Duration of the signal in seconds
             sampling_rate (int): Number of samples per second
             amplitude (float): Peak amplitude of the noise
             noise_type (str): Type of noise ('white' or 'pink')
+            time_axis (str or None): 'array', 'lazy' or None, as in sine_wave()
+            dtype (numpy.dtype): Output dtype (float64 or float32)
+            out (numpy.ndarray, optional): Buffer to generate into
+            rng (numpy.random.Generator, optional): Random generator to draw
+                from; defaults to the global NumPy random state
             
         Returns:
             tuple: (time_array, signal_array)
         """
         num_samples = int(sampling_rate * duration)
-        t = np.linspace(0, duration, num_samples, False)
         
         if noise_type.lower() == 'white':
-            signal = amplitude * (2 * np.random.random(num_samples) - 1)
+            signal = _output_buffer(num_samples, dtype, out)
+            _generate_into(signal, 0.0, 0, _white_noise_kernel(amplitude, rng))
         elif noise_type.lower() == 'pink':
-            # Generate pink noise using 1/f spectrum
-            signal = np.random.random(num_samples)
-            spectrum = np.fft.fft(signal)
-            frequencies = np.fft.fftfreq(len(spectrum))
-            frequencies[0] = 1e-6  # Avoid divide by zero
-            spectrum /= np.sqrt(np.abs(frequencies))
-            signal = np.real(np.fft.ifft(spectrum))
-            signal *= amplitude / np.max(np.abs(signal))
+            # Shape chunk by chunk with the streaming 1/f filter, then scale
+            # to the requested peak in place
+            signal = _output_buffer(num_samples, dtype, out)
+            stream = ColoredNoise('pink', rng=rng if rng is not None else np.random.randint(1 << 31))
+            for offset in range(0, num_samples, _CHUNK_SIZE):
+                n = min(_CHUNK_SIZE, num_samples - offset)
+                stream.generate(n, out=signal[offset:offset + n])
+            if num_samples:
+                signal *= amplitude / max(signal.max(), -signal.min())
         else:
             raise ValueError(f"Unsupported noise type: {noise_type}")
             
-        return t, signal
+        return _time_axis(duration, num_samples, time_axis), signal
     
     @staticmethod
-    def chirp_signal(start_freq, end_freq, duration, sampling_rate=44100, amplitude=1.0):
+    def chirp_signal(start_freq, end_freq, duration, sampling_rate=44100, amplitude=1.0,
+                     time_axis='array', dtype=np.float64, out=None, method='linear'):
         """
         Generate a chirp signal (frequency sweep).
         
         I added this method because chirp signals are crucial for system identification
         and testing, which I learned while working on my course project.
+
+        The phase is the integral of the instantaneous frequency, so the sweep
+        really ends at end_freq.
         
         Args:
             start_freq (float): Starting frequency in Hz
@@ -115,13 +375,277 @@ class SignalGenerator:
             duration (float): Duration of the signal in seconds
             sampling_rate (int): Number of samples per second
             amplitude (float): Peak amplitude of the chirp
+            time_axis (str or None): 'array', 'lazy' or None, as in sine_wave()
+            dtype (numpy.dtype): Output dtype (float64 or float32)
+            out (numpy.ndarray, optional): Buffer to generate into
+            method (str): Sweep law ('linear', 'quadratic', 'logarithmic'
+                or 'hyperbolic')
             
         Returns:
             tuple: (time_array, signal_array)
         """
-        t = np.linspace(0, duration, int(sampling_rate * duration), False)
-        # Linear frequency sweep
-        freq = start_freq + (end_freq - start_freq) * t / duration
-        phase = 2 * np.pi * freq * t
-        signal = amplitude * np.sin(phase)
-        return t, signal
+        num_samples = int(sampling_rate * duration)
+        kernel = _chirp_kernel(start_freq, end_freq, duration, amplitude, method)
+        signal = _output_buffer(num_samples, dtype, out)
+        _generate_into(signal, duration / num_samples if num_samples else 0.0, 0, kernel)
+        return _time_axis(duration, num_samples, time_axis), signal
+
+    @staticmethod
+    def multi_tone(frequencies, duration, sampling_rate=44100, amplitudes=None, phases=None,
+                   method='auto', time_axis='array', dtype=np.float64, out=None):
+        """
+        Generate a sum of sine waves in one pass with an OscillatorBank.
+
+        Equivalent to summing one sine_wave() per tone, without an np.sin
+        over the full signal for every tone.
+
+        Args:
+            frequencies (array_like): Tone frequencies in Hz
+            duration (float): Duration of the signal in seconds
+            sampling_rate (int): Number of samples per second
+            amplitudes (array_like, optional): Peak amplitude of each tone (default 1.0)
+            phases (array_like, optional): Initial phase of each tone in radians (default 0.0)
+            method (str): 'direct', 'phasor' or 'auto', as in OscillatorBank
+            time_axis (str or None): 'array', 'lazy' or None, as in sine_wave()
+            dtype (numpy.dtype): Output dtype (float64 or float32)
+            out (numpy.ndarray, optional): Buffer to generate into
+
+        Returns:
+            tuple: (time_array, signal_array)
+        """
+        num_samples = int(sampling_rate * duration)
+        signal = _output_buffer(num_samples, dtype, out)
+        bank = OscillatorBank(frequencies, amplitudes, phases, sampling_rate, method)
+        bank.generate(num_samples, out=signal)
+        return _time_axis(duration, num_samples, time_axis), signal
+
+    @staticmethod
+    def _blocks(kernel, duration, sampling_rate, block_size, dtype, start=0):
+        """
+        Yield successive blocks of kernel applied to the one-shot time axis.
+
+        Sample k is at k * (duration / num_samples), exactly as in
+        np.linspace(0, duration, num_samples, False), so the blocks
+        concatenate to the one-shot signal. Without a duration the stream
+        is unbounded with a step of 1 / sampling_rate.
+
+        In an unbounded stream of a periodic kernel (one with a frequency
+        attribute) each block's first sample index is reduced modulo the
+        period in exact rational arithmetic, so the time values, and hence
+        the phase precision, stay the same however long the stream runs.
+        """
+        if block_size <= 0:
+            raise ValueError("Block size must be a positive integer")
+        if duration is None:
+            num_samples, step = None, 1 / sampling_rate
+        else:
+            num_samples = int(sampling_rate * duration)
+            step = duration / num_samples if num_samples else 0.0
+        period = None
+        frequency = getattr(kernel, 'frequency', 0)
+        if num_samples is None and frequency:
+            # Samples per period
+            period = Fraction(sampling_rate) / abs(Fraction(frequency))
+        while num_samples is None or start < num_samples:
+            stop = start + block_size
+            if num_samples is not None:
+                stop = min(stop, num_samples)
+            block = _output_buffer(stop - start, dtype, None)
+            origin = float(Fraction(start) % period) if period is not None else start
+            _generate_into(block, step, origin, kernel)
+            yield block
+            start = stop
+
+    @staticmethod
+    def sine_wave_blocks(frequency, duration=None, sampling_rate=44100, amplitude=1.0,
+                         block_size=4096, dtype=np.float64):
+        """
+        Generate a sine wave as a stream of fixed-size blocks.
+
+        Phase is continuous across blocks and the concatenated blocks equal
+        sine_wave() for the same duration, while memory stays constant.
+        
+        Args:
+            frequency (float): Frequency of the sine wave in Hz
+            duration (float, optional): Duration in seconds; unbounded if None
+            sampling_rate (int): Number of samples per second
+            amplitude (float): Peak amplitude of the sine wave
+            block_size (int): Number of samples per block (the last may be shorter)
+            dtype (numpy.dtype): Output dtype (float64 or float32)
+            
+        Yields:
+            numpy.ndarray: Next block of the signal
+        """
+        return SignalGenerator._blocks(_sine_kernel(frequency, amplitude), duration,
+                                       sampling_rate, block_size, dtype)
+
+    @staticmethod
+    def square_wave_blocks(frequency, duration=None, sampling_rate=44100, amplitude=1.0,
+                           duty_cycle=0.5, block_size=4096, dtype=np.float64):
+        """
+        Generate a square wave as a stream of fixed-size blocks.
+        
+        Args:
+            frequency (float): Frequency of the square wave in Hz
+            duration (float, optional): Duration in seconds; unbounded if None
+            sampling_rate (int): Number of samples per second
+            amplitude (float): Peak amplitude of the square wave
+            duty_cycle (float): Duty cycle of the square wave (0 to 1)
+            block_size (int): Number of samples per block (the last may be shorter)
+            dtype (numpy.dtype): Output dtype (float64 or float32)
+            
+        Yields:
+            numpy.ndarray: Next block of the signal
+        """
+        return SignalGenerator._blocks(_square_kernel(frequency, amplitude, duty_cycle), duration,
+                                       sampling_rate, block_size, dtype)
+
+    @staticmethod
+    def noise_blocks(duration=None, sampling_rate=44100, amplitude=1.0, noise_type='white',
+                     block_size=4096, dtype=np.float64, rng=None):
+        """
+        Generate noise as a stream of fixed-size blocks.
+
+        White noise is drawn in order from rng (or the global NumPy random
+        state), so with the same seed the blocks concatenate to the output of
+        noise(). Colored noise comes from a ColoredNoise stream: its
+        amplitude is an RMS level, because a peak-normalised level would
+        depend on the stream length.
+        
+        Args:
+            duration (float, optional): Duration in seconds; unbounded if None
+            sampling_rate (int): Number of samples per second
+            amplitude (float): Peak amplitude of white noise, RMS level of colored noise
+            noise_type (str): Type of noise ('white', 'pink', 'brown', 'blue' or 'violet')
+            block_size (int): Number of samples per block (the last may be shorter)
+            dtype (numpy.dtype): Output dtype (float64 or float32)
+            rng (numpy.random.Generator or int, optional): Random generator to
+                draw from (or a seed, for colored noise)
+            
+        Yields:
+            numpy.ndarray: Next block of the signal
+        """
+        noise_type = noise_type.lower()
+        if noise_type == 'white':
+            return SignalGenerator._blocks(_white_noise_kernel(amplitude, rng), duration,
+                                           sampling_rate, block_size, dtype)
+        if noise_type not in ColoredNoise.COLORS:
+            raise ValueError(f"Unsupported noise type for block generation: {noise_type}")
+        num_samples = None if duration is None else int(sampling_rate * duration)
+        stream = ColoredNoise(noise_type, amplitude, rng)
+        return stream.blocks(block_size, num_samples, dtype)
+
+    @staticmethod
+    def chirp_signal_blocks(start_freq, end_freq, duration, sampling_rate=44100, amplitude=1.0,
+                            block_size=4096, dtype=np.float64, method='linear'):
+        """
+        Generate a chirp signal as a stream of fixed-size blocks.
+
+        Every block evaluates the integrated phase at its absolute sample
+        times, so phase is continuous and the blocks equal chirp_signal().
+        
+        Args:
+            start_freq (float): Starting frequency in Hz
+            end_freq (float): Ending frequency in Hz
+            duration (float): Duration of the sweep in seconds
+            sampling_rate (int): Number of samples per second
+            amplitude (float): Peak amplitude of the chirp
+            block_size (int): Number of samples per block (the last may be shorter)
+            dtype (numpy.dtype): Output dtype (float64 or float32)
+            method (str): Sweep law, as in chirp_signal()
+            
+        Yields:
+            numpy.ndarray: Next block of the signal
+        """
+        kernel = _chirp_kernel(start_freq, end_freq, duration, amplitude, method)
+        return SignalGenerator._blocks(kernel, duration, sampling_rate, block_size, dtype)
+
+    @staticmethod
+    def chirp_inverse_filter(start_freq, end_freq, duration, sampling_rate=44100,
+                             method='linear', n_fft=None, regularization=1e-6):
+        """
+        Return the inverse filter of a unit-amplitude chirp.
+
+        Circularly convolving a chirp_signal() with the returned filter at
+        n_fft points gives a unit impulse at sample 0, band-limited to the
+        swept range. The filter spectrum
+        is cached, so repeated measurements with the same sweep only pay for
+        the transforms of the recorded response.
+
+        Args:
+            start_freq (float): Starting frequency in Hz
+            end_freq (float): Ending frequency in Hz
+            duration (float): Duration of the sweep in seconds
+            sampling_rate (int): Number of samples per second
+            method (str): Sweep law, as in chirp_signal()
+            n_fft (int, optional): Filter length; defaults to twice the sweep
+            regularization (float): Inverse power floor relative to the sweep's peak power
+
+        Returns:
+            numpy.ndarray: Read-only inverse filter of length n_fft
+        """
+        if n_fft is None:
+            n_fft = fft.next_fast_len(2 * int(sampling_rate * duration), real=True)
+        inverse = fft.irfft(_chirp_inverse_spectrum(start_freq, end_freq, duration, sampling_rate,
+                                                    method, n_fft, regularization), n_fft)
+        inverse.setflags(write=False)
+        return inverse
+
+    @staticmethod
+    def impulse_response(response, start_freq, end_freq, duration, sampling_rate=44100,
+                         amplitude=1.0, method='linear', length=None, regularization=1e-6,
+                         workers=None):
+        """
+        Measure a system's impulse response by deconvolving its chirp response.
+
+        Args:
+            response (numpy.ndarray): System output for the chirp, including
+                any decay tail after the sweep
+            start_freq (float): Starting frequency of the sweep in Hz
+            end_freq (float): Ending frequency of the sweep in Hz
+            duration (float): Duration of the sweep in seconds
+            sampling_rate (int): Number of samples per second
+            amplitude (float): Peak amplitude the sweep was played at
+            method (str): Sweep law, as in chirp_signal()
+            length (int, optional): Number of impulse response samples to
+                return; defaults to the full response length
+            regularization (float): Inverse power floor relative to the sweep's peak power
+            workers (int, optional): Number of workers for scipy.fft
+
+        Returns:
+            numpy.ndarray: Impulse response, band-limited to the swept range
+        """
+        response = np.asarray(response, dtype=float)
+        num_samples = int(sampling_rate * duration)
+        # At least the linear convolution length, so nothing wraps around
+        n_fft = fft.next_fast_len(max(response.shape[-1], num_samples), real=True)
+        inverse = _chirp_inverse_spectrum(start_freq, end_freq, duration, sampling_rate,
+                                          method, n_fft, regularization)
+        spectrum = fft.rfft(response, n_fft, workers=workers)
+        spectrum *= inverse
+        spectrum /= amplitude
+        impulse = fft.irfft(spectrum, n_fft, workers=workers)
+        return impulse[..., :response.shape[-1] if length is None else length]
+
+    @staticmethod
+    def multi_tone_blocks(frequencies, duration=None, sampling_rate=44100, amplitudes=None,
+                          phases=None, method='auto', block_size=4096, dtype=np.float64):
+        """
+        Generate a sum of sine waves as a stream of fixed-size blocks.
+
+        Args:
+            frequencies (array_like): Tone frequencies in Hz
+            duration (float, optional): Duration in seconds; unbounded if None
+            sampling_rate (int): Number of samples per second
+            amplitudes (array_like, optional): Peak amplitude of each tone (default 1.0)
+            phases (array_like, optional): Initial phase of each tone in radians (default 0.0)
+            method (str): 'direct', 'phasor' or 'auto', as in OscillatorBank
+            block_size (int): Number of samples per block (the last may be shorter)
+            dtype (numpy.dtype): Output dtype (float64 or float32)
+
+        Yields:
+            numpy.ndarray: Next block of the signal
+        """
+        num_samples = None if duration is None else int(sampling_rate * duration)
+        bank = OscillatorBank(frequencies, amplitudes, phases, sampling_rate, method)
+        return bank.blocks(block_size, num_samples, dtype)
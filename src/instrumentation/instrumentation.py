@@ -0,0 +1,315 @@
+"""
+Instrumentation Module
+
+Opt-in per-call metrics for the public methods of the toolkit's classes in
+generators, filters, transforms and security. Enabling instrumentation
+replaces each public method with a timing wrapper; disabling it puts the
+original methods back, so the toolkit runs at full speed when metrics are
+off.
+
+Recorded per method: call and error counts, wall and CPU time, the number
+of array elements passed in and, optionally, the peak bytes allocated
+during the call (via tracemalloc). Times and bytes are inclusive: a method
+that calls another instrumented method is charged for both. Methods that
+return generators, such as the *_blocks methods, are only charged for
+creating the generator, not for iterating it. Metrics export to JSON or
+the Prometheus text exposition format.
+
+Peak memory tracking needs tracemalloc.reset_peak(), added in Python 3.9.
+tracemalloc keeps one peak for the whole process, so with memory tracing
+on, instrumented calls from different threads are serialized under a lock
+and one thread at a time runs an outermost instrumented call. Allocations
+made meanwhile by other threads outside instrumented methods still count
+towards that call's peak, so peaks are per-call figures only while nothing
+else allocates concurrently. Leave tracing off when measuring
+multithreaded throughput.
+"""
+
+import functools
+import json
+import threading
+import time
+import tracemalloc
+
+import numpy as np
+
+from ..filters import digital_filters, fir_filters, resampling
+from ..generators import colored_noise, oscillator_bank, signal_generator
+from ..security import memory_budget, merkle, signal_security
+from ..transforms import transforms
+
+INSTRUMENTED_MODULES = (
+    signal_generator, colored_noise, oscillator_bank,
+    digital_filters, fir_filters, resampling,
+    transforms,
+    signal_security, merkle, memory_budget,
+)
+
+# Metric name, Prometheus type and help text for each exported field
+_PROMETHEUS_METRICS = (
+    ('calls', 'counter', 'Number of calls'),
+    ('errors', 'counter', 'Number of calls that raised an exception'),
+    ('wall_seconds', 'counter', 'Wall-clock time spent in calls'),
+    ('cpu_seconds', 'counter', 'Process CPU time spent in calls'),
+    ('input_elements', 'counter', 'Array elements passed in as arguments'),
+    ('peak_allocated_bytes', 'gauge', 'Largest peak of bytes allocated during one call'),
+)
+
+
+class MethodMetrics:
+    """Accumulated metrics of one instrumented method."""
+
+    __slots__ = ('calls', 'errors', 'wall_seconds', 'cpu_seconds', 'input_elements',
+                 'max_input_elements', 'peak_allocated_bytes')
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.input_elements = 0
+        self.max_input_elements = 0
+        self.peak_allocated_bytes = 0
+
+    def as_dict(self):
+        """Return the metrics as a plain dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class MetricsRegistry:
+    """Thread-safe store of per-method metrics, keyed by 'Class.method'."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics = {}
+
+    def record(self, name, wall_seconds, cpu_seconds, input_elements, allocated_bytes, failed):
+        """Add one call to the metrics of a method."""
+        with self._lock:
+            metrics = self._metrics.get(name)
+            if metrics is None:
+                metrics = self._metrics[name] = MethodMetrics()
+            metrics.calls += 1
+            metrics.errors += failed
+            metrics.wall_seconds += wall_seconds
+            metrics.cpu_seconds += cpu_seconds
+            metrics.input_elements += input_elements
+            metrics.max_input_elements = max(metrics.max_input_elements, input_elements)
+            metrics.peak_allocated_bytes = max(metrics.peak_allocated_bytes, allocated_bytes)
+
+    def clear(self):
+        """Forget all recorded metrics."""
+        with self._lock:
+            self._metrics.clear()
+
+    def snapshot(self):
+        """
+        Return a copy of the metrics.
+
+        Returns:
+            dict: Method name to a dictionary of its metrics, sorted by name
+        """
+        with self._lock:
+            return {name: self._metrics[name].as_dict() for name in sorted(self._metrics)}
+
+    def to_json(self, indent=None):
+        """
+        Export the metrics as JSON.
+
+        Args:
+            indent (int, optional): Indentation passed to json.dumps
+
+        Returns:
+            str: JSON object of method name to metrics
+        """
+        return json.dumps(self.snapshot(), indent=indent)
+
+    def to_prometheus(self, prefix='dsptoolkit'):
+        """
+        Export the metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix (str): Metric name prefix
+
+        Returns:
+            str: One metric family per field, labelled by method
+        """
+        snapshot = self.snapshot()
+        lines = []
+        for field, kind, help_text in _PROMETHEUS_METRICS:
+            metric = f"{prefix}_{field}_total" if kind == 'counter' else f"{prefix}_{field}"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            for name, values in snapshot.items():
+                lines.append(f'{metric}{{method="{name}"}} {values[field]}')
+        return '\n'.join(lines) + '\n'
+
+
+registry = MetricsRegistry()
+
+_state = threading.local()
+# Held by the thread running an outermost memory-traced call
+_trace_lock = threading.Lock()
+_patch_lock = threading.Lock()
+_patches = []
+
+
+def _input_elements(args, kwargs):
+    """Count the array elements among a call's arguments."""
+    count = 0
+    for value in args:
+        if isinstance(value, np.ndarray):
+            count += value.size
+    for value in kwargs.values():
+        if isinstance(value, np.ndarray):
+            count += value.size
+    return count
+
+
+def _wrap(func, name, target, trace_memory):
+    """Return func wrapped to record its calls in target."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if trace_memory:
+            # Nested calls reset the tracemalloc peak, so each frame keeps
+            # the highest peak seen so far and hands it to its caller
+            stack = getattr(_state, 'frames', None)
+            if stack is None:
+                stack = _state.frames = []
+            if not stack:
+                _trace_lock.acquire()
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:
+                stack[-1][1] = max(stack[-1][1], peak)
+            frame = [current, 0]
+            stack.append(frame)
+            tracemalloc.reset_peak()
+        failed = True
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            result = func(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            wall = time.perf_counter() - wall
+            cpu = time.process_time() - cpu
+            allocated = 0
+            if trace_memory:
+                stack.pop()
+                peak = max(frame[1], tracemalloc.get_traced_memory()[1])
+                allocated = max(0, peak - frame[0])
+                if stack:
+                    stack[-1][1] = max(stack[-1][1], peak)
+                else:
+                    _trace_lock.release()
+            target.record(name, wall, cpu, _input_elements(args, kwargs), allocated, failed)
+    wrapper.__wrapped_by_instrumentation__ = True
+    return wrapper
+
+
+def _public_classes(module):
+    """Yield the public classes defined in a module."""
+    for name, value in vars(module).items():
+        if isinstance(value, type) and not name.startswith('_') and \
+                value.__module__ == module.__name__:
+            yield value
+
+
+def is_enabled():
+    """
+    Report whether instrumentation is active.
+
+    Returns:
+        bool: True between enable() and disable()
+    """
+    return bool(_patches)
+
+
+def enable(target=None, trace_memory=False, modules=INSTRUMENTED_MODULES):
+    """
+    Start recording metrics for every public method of the given modules' classes.
+
+    Args:
+        target (MetricsRegistry, optional): Registry to record into;
+            defaults to the module-level registry
+        trace_memory (bool): Also record peak allocated bytes per call;
+            starts tracemalloc if needed, which slows all allocations, and
+            serializes instrumented calls across threads (see the module
+            docstring). Requires Python 3.9 or later
+        modules (tuple): Modules whose classes are instrumented
+
+    Returns:
+        MetricsRegistry: The registry being recorded into
+
+    Raises:
+        RuntimeError: If instrumentation is already enabled, or memory
+            tracing is requested on Python 3.8
+    """
+    if trace_memory and not hasattr(tracemalloc, 'reset_peak'):
+        raise RuntimeError("Tracing memory per call requires Python 3.9 or later")
+    target = registry if target is None else target
+    with _patch_lock:
+        if _patches:
+            raise RuntimeError("Instrumentation is already enabled")
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _patches.append((None, 'tracemalloc', None))
+        for module in modules:
+            for cls in _public_classes(module):
+                for attr, value in list(vars(cls).items()):
+                    if attr.startswith('_'):
+                        continue
+                    name = f"{cls.__name__}.{attr}"
+                    if isinstance(value, staticmethod):
+                        wrapped = staticmethod(_wrap(value.__func__, name, target, trace_memory))
+                    elif isinstance(value, classmethod):
+                        wrapped = classmethod(_wrap(value.__func__, name, target, trace_memory))
+                    elif callable(value) and not isinstance(value, type):
+                        wrapped = _wrap(value, name, target, trace_memory)
+                    else:
+                        continue
+                    setattr(cls, attr, wrapped)
+                    _patches.append((cls, attr, value))
+    return target
+
+
+def disable():
+    """Stop recording and restore the original methods; recorded metrics are kept."""
+    with _patch_lock:
+        while _patches:
+            cls, attr, original = _patches.pop()
+            if cls is None:
+                tracemalloc.stop()
+            else:
+                setattr(cls, attr, original)
+
+
+class instrument:
+    """
+    Context manager that records metrics for the duration of a block.
+
+    Example:
+        with instrument() as metrics:
+            DigitalFilters.low_pass_filter(signal, 1000, 44100)
+        print(metrics.to_prometheus())
+    """
+
+    def __init__(self, target=None, trace_memory=False, modules=INSTRUMENTED_MODULES):
+        """
+        Args:
+            target (MetricsRegistry, optional): Registry to record into;
+                defaults to a new, empty registry
+            trace_memory (bool): Also record peak allocated bytes per call,
+                serializing instrumented calls across threads
+            modules (tuple): Modules whose classes are instrumented
+        """
+        self.target = MetricsRegistry() if target is None else target
+        self.trace_memory = trace_memory
+        self.modules = modules
+
+    def __enter__(self):
+        return enable(self.target, self.trace_memory, self.modules)
+
+    def __exit__(self, *exc_info):
+        disable()
+        return False
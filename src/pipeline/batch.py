@@ -0,0 +1,224 @@
+"""
+Batch Processing Module
+
+Runs one function over many independent signals (clips, files) on a pool
+of worker processes. Arrays reach the workers through shared memory
+instead of being pickled, filter designs can be warmed once per worker,
+at most a fixed number of chunks are in flight at a time, and results
+come back in input order.
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+import os
+import pickle
+import traceback
+
+import numpy as np
+
+from ..filters.digital_filters import DigitalFilters
+
+# Arrays are placed in a chunk's shared memory block at this alignment
+_ALIGNMENT = 64
+
+
+def _init_worker(designs, initializer, initargs):
+    """Warm the filter design cache of a new worker, then run the user initializer."""
+    for design in designs:
+        DigitalFilters.design_cache.butter(*design)
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _run_chunk(func, name, layout):
+    """
+    Worker side: apply func to every item of one chunk.
+
+    Results may hold views of the shared memory, so they are pickled while
+    it is still mapped and returned as bytes.
+    """
+    shm = SharedMemory(name=name) if name is not None else None
+    try:
+        results = []
+        for offset, item in layout:
+            if offset is not None:
+                shape, dtype = item
+                item = np.ndarray(shape, dtype, buffer=shm.buf, offset=offset)
+            results.append(func(item))
+        return pickle.dumps(results, pickle.HIGHEST_PROTOCOL)
+    except BaseException as error:
+        # The traceback's frames would keep views of the shared memory alive
+        traceback.clear_frames(error.__traceback__)
+        raise
+    finally:
+        item = results = None
+        if shm is not None:
+            shm.close()
+
+
+def _pack(items):
+    """
+    Copy the arrays of one chunk into a new shared memory block.
+
+    Returns:
+        tuple: (SharedMemory or None, layout), where layout holds
+            (offset, (shape, dtype)) for arrays and (None, item) for
+            anything else, which is pickled as usual
+    """
+    layout = []
+    arrays = []
+    size = 0
+    for item in items:
+        if isinstance(item, np.ndarray) and not item.dtype.hasobject:
+            layout.append((size, (item.shape, item.dtype.str)))
+            arrays.append((size, item))
+            size += -(-item.nbytes // _ALIGNMENT) * _ALIGNMENT
+        else:
+            layout.append((None, item))
+    if not arrays:
+        return None, layout
+    shm = SharedMemory(create=True, size=max(size, 1))
+    for offset, array in arrays:
+        np.ndarray(array.shape, array.dtype, buffer=shm.buf, offset=offset)[...] = array
+    return shm, layout
+
+
+def _release(shm):
+    if shm is not None:
+        shm.close()
+        shm.unlink()
+
+
+class BatchProcessor:
+    """
+    Process pool that maps a function over many signals.
+
+    Signals are grouped into chunks of chunk_size items, one task per
+    chunk. The arrays of a chunk are copied into one shared memory block
+    that the worker maps, so func receives a private array without any
+    pickling of sample data; other items (such as file paths for func to
+    load itself) are pickled as usual, and so are the results, which may
+    hold views of their input. At most max_pending chunks, and so their
+    shared memory, exist at any time, which bounds memory however long the
+    input is.
+
+    func, and the initializer if any, must be picklable, i.e. defined at
+    module level (functools.partial of one works too).
+    """
+
+    def __init__(self, func, workers=None, chunk_size=8, max_pending=None, designs=(),
+                 initializer=None, initargs=()):
+        """
+        Start the worker pool.
+
+        Args:
+            func (callable): Function applied to each signal
+            workers (int, optional): Number of worker processes; defaults to
+                the number of CPUs
+            chunk_size (int): Signals per task
+            max_pending (int, optional): Chunks submitted but not yet
+                returned; defaults to twice the number of workers
+            designs (sequence): Argument tuples of
+                FilterDesignCache.butter(order, normalized_cutoff, btype, output)
+                designed once in every worker before its first task
+            initializer (callable, optional): Further per-worker setup
+            initargs (tuple): Arguments of the initializer
+        """
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be a positive integer")
+        if max_pending is not None and max_pending <= 0:
+            raise ValueError("Maximum pending chunks must be a positive integer")
+        self.func = func
+        self.chunk_size = chunk_size
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or 2 * self.workers
+        # Workers must share the parent's resource tracker, or their own
+        # trackers would unlink blocks the parent still owns when they exit
+        resource_tracker.ensure_running()
+        self._executor = ProcessPoolExecutor(
+            self.workers, initializer=_init_worker,
+            initargs=(tuple(designs), initializer, tuple(initargs)))
+
+    def _chunks(self, signals):
+        chunk = []
+        for item in signals:
+            chunk.append(item)
+            if len(chunk) == self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def map(self, signals):
+        """
+        Apply func to every signal.
+
+        Input is consumed lazily, only as fast as results are taken, so
+        signals can be a generator reading files one at a time.
+
+        Args:
+            signals (iterable): Arrays, or other picklable items
+
+        Yields:
+            object: func(signal) for each signal, in input order
+
+        Raises:
+            Exception: The first exception raised by func, in input order
+        """
+        pending = deque()
+        try:
+            for chunk in self._chunks(signals):
+                if len(pending) >= self.max_pending:
+                    yield from self._finish(pending.popleft())
+                shm, layout = _pack(chunk)
+                try:
+                    future = self._executor.submit(
+                        _run_chunk, self.func, shm and shm.name, layout)
+                except BaseException:
+                    _release(shm)
+                    raise
+                pending.append((future, shm))
+            while pending:
+                yield from self._finish(pending.popleft())
+        finally:
+            # Stopped early or failed: let running tasks finish before
+            # their shared memory is unlinked
+            for future, shm in pending:
+                try:
+                    if not future.cancel():
+                        future.exception()
+                finally:
+                    _release(shm)
+
+    @staticmethod
+    def _finish(task):
+        future, shm = task
+        try:
+            return pickle.loads(future.result())
+        finally:
+            _release(shm)
+
+    def process(self, signals):
+        """
+        Apply func to every signal and collect the results.
+
+        Args:
+            signals (iterable): Arrays, or other picklable items
+
+        Returns:
+            list: func(signal) for each signal, in input order
+        """
+        return list(self.map(signals))
+
+    def close(self):
+        """Shut down the worker processes."""
+        self._executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
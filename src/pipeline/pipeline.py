@@ -0,0 +1,423 @@
+"""
+Block Pipeline Module
+
+A pipeline of stages that pass fixed-size blocks of samples to each other,
+so generators, filters, transforms and security checks can be chained
+without a full-length intermediate array at every step. Stages that need a
+fixed block size are fed through preallocated ring buffers, consecutive
+stages can be fused into one call, and every stage keeps latency and
+throughput statistics. The same pipeline runs offline over a file or an
+array, or live on blocks pushed one at a time.
+
+The last axis of every block is time; leading axes are channels.
+"""
+
+import functools
+import time
+
+import numpy as np
+
+
+class RingBuffer:
+    """
+    Preallocated circular buffer of samples along the last axis.
+
+    Storage is allocated on the first write, from the block's channel shape
+    and dtype, and only grows if a single write exceeds the free space.
+    """
+
+    def __init__(self, capacity):
+        """
+        Create an empty ring buffer.
+
+        Args:
+            capacity (int): Initial capacity in samples
+        """
+        if capacity <= 0:
+            raise ValueError("Capacity must be a positive integer")
+        self.capacity = capacity
+        self._data = None
+        self._start = 0
+        self.available = 0
+
+    @property
+    def space(self):
+        """Number of samples that can be written without growing."""
+        return self.capacity - self.available
+
+    def clear(self):
+        """Discard all buffered samples, keeping the storage."""
+        self._start = 0
+        self.available = 0
+
+    def _grow(self, capacity):
+        """Reallocate to a larger capacity, keeping the buffered samples in order."""
+        data = np.empty(self._data.shape[:-1] + (capacity,), dtype=self._data.dtype)
+        self.read(self.available, out=data[..., :self.available], consume=False)
+        self._data, self._start, self.capacity = data, 0, capacity
+
+    def write(self, block):
+        """
+        Append samples to the buffer.
+
+        Args:
+            block (numpy.ndarray): Samples to append
+        """
+        block = np.asarray(block)
+        n = block.shape[-1]
+        if self._data is None:
+            self._data = np.empty(block.shape[:-1] + (self.capacity,), dtype=block.dtype)
+        if n > self.space:
+            self._grow(max(2 * self.capacity, self.available + n))
+        end = (self._start + self.available) % self.capacity
+        first = min(n, self.capacity - end)
+        self._data[..., end:end + first] = block[..., :first]
+        self._data[..., :n - first] = block[..., first:]
+        self.available += n
+
+    def read(self, n, out=None, consume=True):
+        """
+        Take the oldest samples from the buffer.
+
+        Args:
+            n (int): Number of samples, at most available
+            out (numpy.ndarray, optional): Buffer to copy the samples into
+            consume (bool): Remove the samples from the buffer
+
+        Returns:
+            numpy.ndarray: The samples
+        """
+        if n > self.available:
+            raise ValueError(f"Only {self.available} samples available, {n} requested")
+        if out is None:
+            out = np.empty(self._data.shape[:-1] + (n,), dtype=self._data.dtype)
+        first = min(n, self.capacity - self._start)
+        out[..., :first] = self._data[..., self._start:self._start + first]
+        out[..., first:] = self._data[..., :n - first]
+        if consume:
+            self._start = (self._start + n) % self.capacity
+            self.available -= n
+        return out
+
+
+class Stage:
+    """
+    One processing step of a pipeline.
+
+    A stage maps a block to an output block (which may have another length,
+    or be None to emit nothing). A passthrough stage only inspects each
+    block, for checks such as validation or hashing, and forwards it
+    unchanged. A stage with a block_size always receives exactly that many
+    samples, except for the last, shorter block when the stream ends.
+    """
+
+    def __init__(self, process, name=None, block_size=None, flush=None, passthrough=False,
+                 reset=None):
+        """
+        Create a stage.
+
+        Args:
+            process (callable): Function called with each block
+            name (str, optional): Name used in statistics; defaults to the
+                function's name
+            block_size (int, optional): Exact input block size, if required
+            flush (callable, optional): Called once at the end of a stream;
+                returns the final output block or None
+            passthrough (bool): Forward the input instead of the return value
+            reset (callable, optional): Called when the pipeline is reset
+        """
+        if block_size is not None and block_size <= 0:
+            raise ValueError("Block size must be a positive integer")
+        self.process = process
+        self.name = name or getattr(process, '__qualname__', None) or repr(process)
+        self.block_size = block_size
+        self.flush = flush
+        self.passthrough = passthrough
+        self.reset = reset
+        self.reset_stats()
+
+    @classmethod
+    def wrap(cls, processor, name=None, block_size=None):
+        """
+        Create a stage from a stateful block processor.
+
+        Works with any object with a process(block) method, such as
+        StreamingFilter, MovingAverage, OverlapSaveConvolver or Resampler;
+        its flush() and reset() methods are used if present.
+
+        Args:
+            processor (object): Block processor
+            name (str, optional): Stage name; defaults to the class name
+            block_size (int, optional): Exact input block size, if required
+
+        Returns:
+            Stage: Stage calling processor.process
+        """
+        return cls(processor.process, name or type(processor).__name__, block_size,
+                   getattr(processor, 'flush', None), reset=getattr(processor, 'reset', None))
+
+    @classmethod
+    def check(cls, func, name=None, block_size=None, axis=-1):
+        """
+        Create a passthrough stage that inspects every block.
+
+        Suitable for StreamingValidator.validate or SignalHasher.update,
+        which raise or record but do not change the signal. They are told
+        that the last axis is time, so multichannel blocks are joined and
+        reported by sample position.
+
+        Args:
+            func (callable): Function called as func(block, axis=axis)
+            name (str, optional): Stage name; defaults to func's name
+            block_size (int, optional): Exact input block size, if required
+            axis (int, optional): Time axis passed to func; None calls
+                func(block) alone
+
+        Returns:
+            Stage: Passthrough stage
+        """
+        name = name or getattr(func, '__qualname__', None) or repr(func)
+        if axis is not None:
+            func = functools.partial(func, axis=axis)
+        return cls(func, name, block_size, passthrough=True)
+
+    def reset_stats(self):
+        """Zero the call count, sample counts and time."""
+        self.calls = 0
+        self.samples_in = 0
+        self.samples_out = 0
+        self.seconds = 0.0
+
+    def apply(self, block):
+        """Process a block without recording statistics."""
+        out = self.process(block)
+        return block if self.passthrough else out
+
+    def __call__(self, block):
+        start = time.perf_counter()
+        out = self.apply(block)
+        self.seconds += time.perf_counter() - start
+        self.calls += 1
+        self.samples_in += block.shape[-1]
+        if out is not None:
+            self.samples_out += np.shape(out)[-1]
+        return out
+
+    def stats(self):
+        """
+        Return the stage's latency and throughput.
+
+        Returns:
+            dict: calls, samples_in, samples_out, seconds, mean latency per
+                call in milliseconds and input throughput in samples per second
+        """
+        return {
+            'calls': self.calls,
+            'samples_in': self.samples_in,
+            'samples_out': self.samples_out,
+            'seconds': self.seconds,
+            'latency_ms': 1e3 * self.seconds / self.calls if self.calls else 0.0,
+            'throughput': self.samples_in / self.seconds if self.seconds else 0.0,
+        }
+
+
+def _fuse(stages):
+    """
+    Combine consecutive stages into one stage that calls them in turn.
+
+    The parts are applied directly, without buffering or per-part timing,
+    so the fused stage is reported as a whole.
+    """
+    if len(stages) == 1:
+        return stages[0]
+
+    def run_from(index, block):
+        for stage in stages[index:]:
+            if block is None or np.shape(block)[-1] == 0:
+                return None
+            block = stage.apply(block)
+        return block
+
+    def flush():
+        tails = []
+        for index, stage in enumerate(stages):
+            if stage.flush is not None:
+                tail = run_from(index + 1, stage.flush())
+                if tail is not None and np.shape(tail)[-1]:
+                    tails.append(tail)
+        return np.concatenate(tails, axis=-1) if tails else None
+
+    def reset():
+        for stage in stages:
+            if stage.reset is not None:
+                stage.reset()
+
+    return Stage(lambda block: run_from(0, block), '+'.join(stage.name for stage in stages),
+                 stages[0].block_size, flush, reset=reset)
+
+
+class Pipeline:
+    """
+    A chain of stages exchanging blocks.
+
+    Blocks pushed with process() or supplied by a source in run() flow
+    through the stages in order. A stage with a block_size is fed from a
+    ring buffer holding at most one block plus the incoming samples, so
+    memory is bounded by the block sizes rather than the signal length.
+    """
+
+    def __init__(self, stages, fuse=False):
+        """
+        Create a pipeline.
+
+        Args:
+            stages (list): Stage objects, or callables wrapped as stages
+            fuse (bool): Fuse each stage that does not need its own block
+                size into the stage before it, trading per-stage statistics
+                for one dispatch and one timing per block
+        """
+        stages = [stage if isinstance(stage, Stage) else Stage(stage) for stage in stages]
+        if fuse:
+            groups = []
+            for stage in stages:
+                if groups and stage.block_size is None:
+                    groups[-1].append(stage)
+                else:
+                    groups.append([stage])
+            stages = [_fuse(group) for group in groups]
+        self.stages = stages
+        self._buffers = [RingBuffer(2 * stage.block_size) if stage.block_size else None
+                         for stage in stages]
+        self._scratch = [None] * len(stages)
+        self._outputs = []
+
+    def _push(self, index, block):
+        """Feed a block to stage index and everything after it."""
+        if block is None or np.shape(block)[-1] == 0:
+            return
+        if index == len(self.stages):
+            self._outputs.append(block)
+            return
+        stage, ring = self.stages[index], self._buffers[index]
+        if ring is None:
+            self._push(index + 1, stage(block))
+            return
+        ring.write(block)
+        while ring.available >= stage.block_size:
+            scratch = self._scratch[index]
+            if scratch is None:
+                scratch = ring.read(stage.block_size)
+                self._scratch[index] = scratch
+            else:
+                ring.read(stage.block_size, out=scratch)
+            out = stage(scratch)
+            # The scratch buffer is refilled for the next block, so an output
+            # that is (a view of) it must not travel on as it is
+            if out is not None and np.shares_memory(out, scratch):
+                out = np.array(out)
+            self._push(index + 1, out)
+
+    def _collect(self):
+        outputs, self._outputs = self._outputs, []
+        return outputs
+
+    def process(self, block):
+        """
+        Push one block through the pipeline.
+
+        Args:
+            block (numpy.ndarray): Next input block
+
+        Returns:
+            list: Output blocks completed by this input (possibly none);
+                they may share memory with the pipeline's buffers, so copy
+                any block that must outlive the next call
+        """
+        self._push(0, np.asarray(block))
+        return self._collect()
+
+    def flush(self):
+        """
+        End the stream, passing on buffered samples and stage tails.
+
+        The pipeline's buffers are cleared afterwards, so it can be reused.
+
+        Returns:
+            list: Remaining output blocks
+        """
+        for index, stage in enumerate(self.stages):
+            ring = self._buffers[index]
+            if ring is not None and ring.available:
+                self._push(index + 1, stage(ring.read(ring.available)))
+            if stage.flush is not None:
+                self._push(index + 1, stage.flush())
+        for ring in self._buffers:
+            if ring is not None:
+                ring.clear()
+        return self._collect()
+
+    def run(self, source, sink=None):
+        """
+        Run the pipeline over a whole stream.
+
+        Args:
+            source (iterable): Input blocks, e.g. a *_blocks() generator or
+                Pipeline.array_source()
+            sink (callable, optional): Called with every output block; if
+                omitted the output is concatenated and returned
+
+        Returns:
+            numpy.ndarray or None: The output signal when no sink is given
+        """
+        collected = []
+        emit = sink if sink is not None else (lambda block: collected.append(np.array(block)))
+        for block in source:
+            for out in self.process(block):
+                emit(out)
+        for out in self.flush():
+            emit(out)
+        if sink is None:
+            return np.concatenate(collected, axis=-1) if collected else np.empty(0)
+        return None
+
+    @staticmethod
+    def array_source(signal_array, block_size=4096):
+        """
+        Yield consecutive blocks of an array, e.g. a np.load(..., mmap_mode='r') file.
+
+        Args:
+            signal_array (numpy.ndarray): Input signal, time along the last axis
+            block_size (int): Number of samples per block
+
+        Yields:
+            numpy.ndarray: Next block (a view of the input)
+        """
+        if block_size <= 0:
+            raise ValueError("Block size must be a positive integer")
+        for start in range(0, signal_array.shape[-1], block_size):
+            yield signal_array[..., start:start + block_size]
+
+    def reset(self):
+        """Clear buffers, stage state and statistics for a new stream."""
+        for ring in self._buffers:
+            if ring is not None:
+                ring.clear()
+        for stage in self.stages:
+            if stage.reset is not None:
+                stage.reset()
+            stage.reset_stats()
+        self._outputs = []
+
+    def stats(self):
+        """
+        Return latency and throughput statistics per stage.
+
+        Returns:
+            dict: Stage name to Stage.stats() dictionary, in pipeline order;
+                repeated names get a #position suffix
+        """
+        report = {}
+        for index, stage in enumerate(self.stages):
+            name = stage.name if stage.name not in report else f"{stage.name}#{index}"
+            report[name] = stage.stats()
+        return report
@@ -0,0 +1,269 @@
+"""
+Real-Time Streaming Module
+
+An asyncio front end for live block streams. Each stage runs as its own
+task and does its work on a thread pool (numpy and scipy release the GIL),
+stages are connected by bounded queues so a slow stage holds back the ones
+before it, and every block carries a deadline so late output is counted
+instead of going unnoticed. FakeDevice stands in for an audio input,
+producing SignalGenerator blocks at the pace a sound card would.
+
+Sources are async iterables of blocks (plain iterables are accepted too);
+a hardware input such as a sounddevice stream can be adapted by pushing
+its callback blocks into an asyncio.Queue with loop.call_soon_threadsafe
+and iterating that queue.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import inspect
+
+import numpy as np
+
+from ..generators.signal_generator import SignalGenerator
+from .pipeline import Stage
+
+# Marks the end of the stream in the stage queues
+_END = object()
+
+
+class FakeDevice:
+    """
+    Async block source that replays blocks at a real-time pace.
+
+    Each block is released once the time it would take to capture it has
+    passed since the stream started, like a sound card delivering input
+    buffers. With realtime=False blocks are released as fast as they are
+    taken, for tests and offline runs.
+    """
+
+    def __init__(self, blocks, sampling_rate=44100, realtime=True):
+        """
+        Create a device.
+
+        Args:
+            blocks (iterable): Blocks to deliver, time along the last axis
+            sampling_rate (int): Sampling rate in Hz
+            realtime (bool): Pace delivery by the sampling rate
+        """
+        self.blocks = blocks
+        self.sampling_rate = sampling_rate
+        self.realtime = realtime
+
+    @classmethod
+    def sine(cls, frequency, duration=None, sampling_rate=44100, amplitude=1.0, noise=0.0,
+             block_size=1024, realtime=True):
+        """
+        Create a device delivering a sine wave, optionally with white noise.
+
+        Args:
+            frequency (float): Sine frequency in Hz
+            duration (float, optional): Stream length in seconds; endless if None
+            sampling_rate (int): Sampling rate in Hz
+            amplitude (float): Sine amplitude
+            noise (float): White noise amplitude
+            block_size (int): Samples per block
+            realtime (bool): Pace delivery by the sampling rate
+
+        Returns:
+            FakeDevice: Device streaming the generated signal
+        """
+        blocks = SignalGenerator.sine_wave_blocks(frequency, duration, sampling_rate, amplitude,
+                                                  block_size)
+        if noise:
+            noise_blocks = SignalGenerator.noise_blocks(duration, sampling_rate, noise,
+                                                        block_size=block_size)
+            blocks = (tone + hiss for tone, hiss in zip(blocks, noise_blocks))
+        return cls(blocks, sampling_rate, realtime)
+
+    async def __aiter__(self):
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        captured = 0
+        for block in self.blocks:
+            captured += block.shape[-1]
+            delay = start + captured / self.sampling_rate - loop.time() if self.realtime else 0.0
+            # Always yield to the event loop, as a device waiting for input would
+            await asyncio.sleep(max(0.0, delay))
+            yield block
+
+
+async def _iterate(source):
+    """Iterate an async or plain iterable asynchronously."""
+    if hasattr(source, '__aiter__'):
+        async for block in source:
+            yield block
+    else:
+        for block in source:
+            yield block
+            await asyncio.sleep(0)
+
+
+class AsyncPipeline:
+    """
+    Chain of stages run concurrently on an asyncio event loop.
+
+    Blocks move between stages through bounded queues of queue_size
+    blocks. With overflow='wait' a full first queue makes the source wait
+    (backpressure); with overflow='drop' the block is dropped and counted as
+    an overrun, which is what a real-time input that cannot be paused would
+    suffer. A block delivered to the sink more than `deadline` seconds after
+    it was captured is counted as an underrun: an output device fed by the
+    pipeline would have run out of samples.
+    """
+
+    OVERFLOW_POLICIES = ('wait', 'drop')
+
+    def __init__(self, stages, queue_size=4, deadline=None, overflow='wait', workers=None):
+        """
+        Create a pipeline.
+
+        Args:
+            stages (list): Stage objects, or callables wrapped as stages;
+                stages with a block_size are not supported here, since the
+                blocks' size is set by the source
+            queue_size (int): Capacity of each queue, in blocks
+            deadline (float, optional): Allowed seconds from capture to
+                delivery, typically the block duration; None disables
+                underrun tracking
+            overflow (str): What happens to a source block when the first
+                queue is full ('wait' or 'drop')
+            workers (int, optional): Threads running the stages; defaults to
+                one per stage
+        """
+        stages = [stage if isinstance(stage, Stage) else Stage(stage) for stage in stages]
+        if any(stage.block_size is not None for stage in stages):
+            raise ValueError("Stages with a fixed block size are not supported; "
+                             "produce blocks of that size at the source instead")
+        if queue_size <= 0:
+            raise ValueError("Queue size must be a positive integer")
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"Unsupported overflow policy: {overflow}")
+        self.stages = stages
+        self.queue_size = queue_size
+        self.deadline = deadline
+        self.overflow = overflow
+        self.workers = workers or max(1, len(stages))
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Zero the block counters, latencies and stage statistics."""
+        self.blocks_in = 0
+        self.blocks_out = 0
+        self.overruns = 0
+        self.underruns = 0
+        self.max_latency = 0.0
+        self._timed_blocks = 0
+        self._total_latency = 0.0
+        for stage in self.stages:
+            stage.reset_stats()
+
+    async def _feed(self, source, queue, loop):
+        async for block in _iterate(source):
+            self.blocks_in += 1
+            item = (loop.time(), np.asarray(block))
+            if self.overflow == 'drop':
+                if queue.full():
+                    self.overruns += 1
+                    continue
+                queue.put_nowait(item)
+            else:
+                await queue.put(item)
+        await queue.put(_END)
+
+    async def _run_stage(self, stage, inbox, outbox, loop, executor):
+        while True:
+            item = await inbox.get()
+            if item is _END:
+                if stage.flush is not None:
+                    tail = await loop.run_in_executor(executor, stage.flush)
+                    if tail is not None and np.shape(tail)[-1]:
+                        # Tails have no capture time and so no deadline
+                        await outbox.put((None, tail))
+                await outbox.put(_END)
+                return
+            captured, block = item
+            out = await loop.run_in_executor(executor, stage, block)
+            if out is not None and np.shape(out)[-1]:
+                await outbox.put((captured, out))
+
+    async def _drain(self, queue, sink, loop):
+        while True:
+            item = await queue.get()
+            if item is _END:
+                return
+            captured, block = item
+            if captured is not None:
+                latency = loop.time() - captured
+                self._timed_blocks += 1
+                self._total_latency += latency
+                self.max_latency = max(self.max_latency, latency)
+                if self.deadline is not None and latency > self.deadline:
+                    self.underruns += 1
+            self.blocks_out += 1
+            result = sink(block)
+            if inspect.isawaitable(result):
+                await result
+
+    async def run(self, source, sink=None):
+        """
+        Stream a source through the stages until it ends.
+
+        Args:
+            source (iterable): Async iterable of blocks, e.g. a FakeDevice,
+                or a plain iterable
+            sink (callable, optional): Called with every output block; may
+                be a coroutine function. If omitted the output is
+                concatenated and returned
+
+        Returns:
+            numpy.ndarray or None: The output signal when no sink is given
+
+        Raises:
+            Exception: The first exception raised by a stage or the sink;
+                the other tasks are cancelled
+        """
+        loop = asyncio.get_running_loop()
+        collected = []
+        emit = sink if sink is not None else (lambda block: collected.append(np.array(block)))
+        queues = [asyncio.Queue(self.queue_size) for _ in range(len(self.stages) + 1)]
+        with ThreadPoolExecutor(self.workers) as executor:
+            tasks = [asyncio.ensure_future(self._feed(source, queues[0], loop))]
+            tasks += [asyncio.ensure_future(self._run_stage(stage, queues[i], queues[i + 1],
+                                                            loop, executor))
+                      for i, stage in enumerate(self.stages)]
+            tasks.append(asyncio.ensure_future(self._drain(queues[-1], emit, loop)))
+            try:
+                await asyncio.gather(*tasks)
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+        if sink is None:
+            return np.concatenate(collected, axis=-1) if collected else np.empty(0)
+        return None
+
+    def stats(self):
+        """
+        Return stream and per-stage statistics.
+
+        Returns:
+            dict: blocks_in, blocks_out, overruns, underruns, mean and
+                maximum capture-to-delivery latency in milliseconds, and
+                'stages' mapping stage names to Stage.stats() dictionaries,
+                as in Pipeline.stats()
+        """
+        stages = {}
+        for index, stage in enumerate(self.stages):
+            name = stage.name if stage.name not in stages else f"{stage.name}#{index}"
+            stages[name] = stage.stats()
+        timed = self._timed_blocks
+        return {
+            'blocks_in': self.blocks_in,
+            'blocks_out': self.blocks_out,
+            'overruns': self.overruns,
+            'underruns': self.underruns,
+            'latency_ms': 1e3 * self._total_latency / timed if timed > 0 else 0.0,
+            'max_latency_ms': 1e3 * self.max_latency,
+            'stages': stages,
+        }
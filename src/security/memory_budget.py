@@ -0,0 +1,235 @@
+"""
+Memory Budget Module
+
+Peak-memory estimates for the toolkit's one-shot generator, filter and
+transform calls, and a budget policy that recommends the streaming
+equivalent of a call instead of rejecting it when the one-shot version
+would not fit.
+"""
+
+from collections import namedtuple
+import functools
+import os
+from typing import Optional
+
+import numpy as np
+
+# Fraction of available memory a default budget may use
+_DEFAULT_FRACTION = 0.5
+
+# Smallest block size a streaming recommendation will suggest
+_MIN_BLOCK_SIZE = 1024
+
+# Work arrays bounded by the batch sizes used in the filters and transforms
+_FIR_BATCH_BYTES = (1 << 20) * 24
+_STFT_BATCH_BYTES = (1 << 20) * 16
+_PINK_CHUNK_BYTES = (1 << 14) * 16
+
+
+def _time_bytes(n, params):
+    """Bytes of a float64 time array, unless it is lazy or skipped."""
+    return 8 * n if params.get('time_axis', 'array') == 'array' else 0
+
+
+def _noise_bytes(n, c, s, params):
+    if params.get('noise_type', 'white').lower() == 'pink':
+        # White and shaped float64 chunks of the streaming filter
+        return c * n * s + _PINK_CHUNK_BYTES + _time_bytes(n, params)
+    return c * n * s + _time_bytes(n, params)
+
+
+def _stft_bytes(n, c, s, params):
+    window_size = params.get('window_size', 2048)
+    hop_length = params.get('hop_length', 512)
+    frames = max(0, n - window_size) // hop_length + 1
+    return c * frames * (window_size // 2 + 1) * 2 * s + _STFT_BATCH_BYTES
+
+
+# Peak bytes of each one-shot call as a function of samples per channel n,
+# channels c, output item size s and the call's keyword parameters,
+# including the output and its large temporaries
+_PEAK_BYTES = {
+    'sine_wave': lambda n, c, s, p: c * n * s + _time_bytes(n, p),
+    'square_wave': lambda n, c, s, p: c * n * s + _time_bytes(n, p),
+    'chirp_signal': lambda n, c, s, p: c * n * s + _time_bytes(n, p),
+    'noise': _noise_bytes,
+    'multi_tone': lambda n, c, s, p: (c * n * s + _time_bytes(n, p)
+                                      + 32 * 1024 * p.get('num_tones', 1)),
+    # sosfiltfilt: padded input, forward pass and backward pass
+    'low_pass_filter': lambda n, c, s, p: 3 * c * n * 8,
+    'high_pass_filter': lambda n, c, s, p: 3 * c * n * 8,
+    'band_pass_filter': lambda n, c, s, p: 3 * c * n * 8,
+    # Padded input, float64 running sum and output
+    'moving_average': lambda n, c, s, p: c * n * (2 * s + 8),
+    # Zero-padded input, segment output and result, plus one batch of spectra
+    'fir_filter': lambda n, c, s, p: 3 * c * n * s + _FIR_BATCH_BYTES,
+    # Float64 input copy and output
+    'resample': lambda n, c, s, p: c * n * 8 * (1 + p.get('up', 1) / p.get('down', 1)),
+    # Complex spectrum, frequencies, magnitudes and phases of n // 2 + 1 bins
+    'fft': lambda n, c, s, p: c * (n // 2 + 1) * 40,
+    'stft': _stft_bytes,
+    # Output, overlap-add rows and one batch of inverse transforms
+    'istft': lambda n, c, s, p: 2 * c * n * 8 + _STFT_BATCH_BYTES,
+}
+
+# Block-based equivalent of each call, where one exists
+_STREAMING_APIS = {
+    'sine_wave': 'SignalGenerator.sine_wave_blocks',
+    'square_wave': 'SignalGenerator.square_wave_blocks',
+    'chirp_signal': 'SignalGenerator.chirp_signal_blocks',
+    'noise': 'SignalGenerator.noise_blocks',
+    'multi_tone': 'SignalGenerator.multi_tone_blocks',
+    'low_pass_filter': 'StreamingFilter.low_pass',
+    'high_pass_filter': 'StreamingFilter.high_pass',
+    'band_pass_filter': 'StreamingFilter.band_pass',
+    'moving_average': 'MovingAverage',
+    'fir_filter': 'OverlapSaveConvolver.process',
+    'resample': 'Resampler.process',
+}
+
+BudgetPlan = namedtuple('BudgetPlan', [
+    'operation',       # Operation name
+    'peak_bytes',      # Estimated peak bytes of the one-shot call
+    'budget_bytes',    # Budget it was checked against
+    'recommendation',  # 'one-shot', 'stream' or 'reject'
+    'streaming_api',   # Block-based equivalent, if any
+    'block_size',      # Largest power-of-two block that fits, when streaming
+])
+
+
+def _available_memory():
+    """
+    Return the physical memory available for new allocations, in bytes.
+
+    Uses MemAvailable from /proc/meminfo, which counts reclaimable page
+    cache, where it exists, and the free page count elsewhere.
+    """
+    try:
+        with open('/proc/meminfo') as meminfo:
+            for line in meminfo:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, ValueError, OSError):
+        return 1 << 32
+
+
+@functools.lru_cache(maxsize=1024)
+def _plan(budget_bytes, operation, num_samples, itemsize, channels, params):
+    """Return the cached BudgetPlan for one set of call parameters."""
+    params = dict(params)
+    peak_bytes = int(_PEAK_BYTES[operation](num_samples, channels, itemsize, params))
+    if peak_bytes <= budget_bytes:
+        return BudgetPlan(operation, peak_bytes, budget_bytes, 'one-shot', None, None)
+
+    api = _STREAMING_APIS.get(operation)
+    block_size = None
+    if api is not None:
+        size = 1 << max(0, num_samples - 1).bit_length()
+        while size >= _MIN_BLOCK_SIZE:
+            if _PEAK_BYTES[operation](size, channels, itemsize, params) <= budget_bytes:
+                block_size = min(size, num_samples)
+                break
+            size //= 2
+    if block_size is None:
+        return BudgetPlan(operation, peak_bytes, budget_bytes, 'reject', api, None)
+    return BudgetPlan(operation, peak_bytes, budget_bytes, 'stream', api, block_size)
+
+
+class MemoryBudget:
+    """
+    Memory budget policy for one-shot signal operations.
+
+    plan() estimates the peak bytes a call will allocate, temporaries
+    included, and recommends running it in one shot, streaming it in
+    blocks of a given size through its block-based equivalent, or
+    rejecting it. Plans are cached per parameter set.
+    """
+
+    OPERATIONS = tuple(_PEAK_BYTES)
+
+    def __init__(self, max_bytes: Optional[int] = None, fraction: float = _DEFAULT_FRACTION):
+        """
+        Create a budget.
+
+        Args:
+            max_bytes (int, optional): Budget in bytes; defaults to a
+                fraction of the memory available when the budget is created
+            fraction (float): Fraction of available memory used when max_bytes is None
+        """
+        if max_bytes is None:
+            max_bytes = int(_available_memory() * fraction)
+        if max_bytes <= 0:
+            raise ValueError("Memory budget must be positive")
+        self.max_bytes = int(max_bytes)
+
+    def estimate(
+        self,
+        operation: str,
+        num_samples: int,
+        dtype: np.dtype = np.float64,
+        channels: int = 1,
+        **params
+    ) -> int:
+        """
+        Estimate the peak bytes of a one-shot call.
+
+        Args:
+            operation (str): Method name, one of MemoryBudget.OPERATIONS
+            num_samples (int): Samples per channel
+            dtype (numpy.dtype): Output dtype
+            channels (int): Number of channels
+            **params: Call parameters the estimate depends on (time_axis,
+                noise_type, num_tones, window_size, hop_length, up, down)
+
+        Returns:
+            int: Estimated peak bytes
+        """
+        return self.plan(operation, num_samples, dtype, channels, **params).peak_bytes
+
+    def plan(
+        self,
+        operation: str,
+        num_samples: int,
+        dtype: np.dtype = np.float64,
+        channels: int = 1,
+        **params
+    ) -> BudgetPlan:
+        """
+        Recommend how to run a call within the budget.
+
+        Args:
+            operation (str): Method name, one of MemoryBudget.OPERATIONS
+            num_samples (int): Samples per channel
+            dtype (numpy.dtype): Output dtype
+            channels (int): Number of channels
+            **params: Call parameters, as in estimate()
+
+        Returns:
+            BudgetPlan: Estimate and recommendation
+
+        Raises:
+            ValueError: If the operation is unknown
+        """
+        if operation not in _PEAK_BYTES:
+            raise ValueError(f"Unknown operation for memory estimate: {operation}")
+        return _plan(self.max_bytes, operation, int(num_samples), np.dtype(dtype).itemsize,
+                     int(channels), tuple(sorted(params.items())))
+
+
+@functools.lru_cache(maxsize=None)
+def default_memory_budget() -> MemoryBudget:
+    """
+    Return the process-wide default budget.
+
+    It is sized from the memory available on first use and then kept, so
+    the same parameters get the same plan on every call and the plan
+    cache is shared between calls.
+
+    Returns:
+        MemoryBudget: Default budget
+    """
+    return MemoryBudget()
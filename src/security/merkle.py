@@ -0,0 +1,255 @@
+"""
+Merkle Fingerprint Module
+
+Merkle-tree fingerprints of signals split into fixed-size chunks of
+samples. Leaves are hashed in parallel on a thread pool (hashlib releases
+the GIL on large buffers), and any single chunk can later be checked
+against the fingerprint, or a corrupted region located, without hashing
+the whole signal again.
+
+Leaves and interior nodes use the RFC 6962 domain separation prefixes
+(0x00 and 0x01), so a chunk can never be passed off as an interior node.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .signal_security import _hash_array
+
+_LEAF_PREFIX = b'\x00'
+_NODE_PREFIX = b'\x01'
+_HEADER_PREFIX = b'\x02'
+
+
+class MerkleFingerprint:
+    """
+    Merkle tree over consecutive chunks of a signal's first axis.
+
+    The fingerprint (root) binds the tree root to the signal's dtype,
+    shape and chunk size. levels[0] holds the leaf hashes, each following
+    level the hashes of pairs from the one below; an unpaired last node is
+    promoted unchanged, which gives the same tree as RFC 6962.
+    """
+
+    ALGORITHMS = ('sha256', 'blake2b')
+
+    def __init__(
+        self,
+        leaves: Sequence[bytes],
+        chunk_size: int,
+        dtype: np.dtype,
+        shape: Tuple[int, ...],
+        algorithm: str = 'sha256'
+    ):
+        """
+        Build the tree from precomputed leaf hashes.
+
+        Args:
+            leaves (sequence of bytes): Leaf hash of each chunk, in order
+            chunk_size (int): Number of samples (rows) per chunk
+            dtype (numpy.dtype): Signal dtype
+            shape (tuple): Signal shape
+            algorithm (str): Hash algorithm ('sha256' or 'blake2b')
+        """
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be a positive integer")
+        self.algorithm = algorithm
+        self.chunk_size = chunk_size
+        self.dtype = np.dtype(dtype)
+        self.shape = tuple(shape)
+
+        level = list(leaves)
+        self.levels = [level]
+        while len(level) > 1:
+            level = [self._node(level[i], level[i + 1]) if i + 1 < len(level) else level[i]
+                     for i in range(0, len(level), 2)]
+            self.levels.append(level)
+        # An empty signal has no leaves; its tree root is the hash of nothing
+        self.tree_root = level[0] if level else self._hash(b'')
+
+        header = f"{self.dtype.str}|{','.join(map(str, self.shape))}|{chunk_size}".encode()
+        self.root = self._hash(_HEADER_PREFIX + header + self.tree_root)
+
+    @classmethod
+    def from_signal(
+        cls,
+        signal: np.ndarray,
+        chunk_size: int = 1 << 16,
+        algorithm: str = 'sha256',
+        workers: Optional[int] = None
+    ) -> 'MerkleFingerprint':
+        """
+        Fingerprint a signal, hashing its chunks on a thread pool.
+
+        Args:
+            signal (numpy.ndarray): Input signal, chunked along its first axis
+            chunk_size (int): Number of samples (rows) per chunk
+            algorithm (str): Hash algorithm ('sha256' or 'blake2b')
+            workers (int, optional): Number of hashing threads; defaults to
+                the ThreadPoolExecutor default
+
+        Returns:
+            MerkleFingerprint: Fingerprint of the signal
+        """
+        signal = np.atleast_1d(np.asarray(signal))
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be a positive integer")
+        n_chunks = -(-len(signal) // chunk_size)
+
+        def hash_chunk(index):
+            return cls._leaf(algorithm, signal[index * chunk_size:(index + 1) * chunk_size])
+
+        if n_chunks <= 1 or workers == 1:
+            leaves = [hash_chunk(index) for index in range(n_chunks)]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                leaves = list(executor.map(hash_chunk, range(n_chunks)))
+        return cls(leaves, chunk_size, signal.dtype, signal.shape, algorithm)
+
+    @staticmethod
+    def _leaf(algorithm: str, chunk: np.ndarray) -> bytes:
+        """Hash one chunk of samples as a leaf."""
+        digest = hashlib.new(algorithm)
+        digest.update(_LEAF_PREFIX)
+        _hash_array(digest, chunk)
+        return digest.digest()
+
+    def _hash(self, data: bytes) -> bytes:
+        return hashlib.new(self.algorithm, data).digest()
+
+    def _node(self, left: bytes, right: bytes) -> bytes:
+        return self._hash(_NODE_PREFIX + left + right)
+
+    @property
+    def num_chunks(self) -> int:
+        """Number of chunks (leaves) in the tree."""
+        return len(self.levels[0])
+
+    def hexdigest(self) -> str:
+        """
+        Return the fingerprint as a hexadecimal string.
+
+        Returns:
+            str: Hexadecimal root hash
+        """
+        return self.root.hex()
+
+    def chunk_bounds(self, index: int) -> Tuple[int, int]:
+        """
+        Return the sample range covered by a chunk.
+
+        Args:
+            index (int): Chunk index
+
+        Returns:
+            tuple: (start, stop) along the first axis
+        """
+        start = index * self.chunk_size
+        return start, min(start + self.chunk_size, self.shape[0])
+
+    def proof(self, index: int) -> List[Tuple[bytes, bool]]:
+        """
+        Return the audit path from a chunk's leaf to the tree root.
+
+        Args:
+            index (int): Chunk index
+
+        Returns:
+            list: (sibling_hash, sibling_is_left) pairs from the leaf upwards;
+                levels where the node is promoted unpaired are skipped
+        """
+        if not 0 <= index < self.num_chunks:
+            raise ValueError(f"Chunk index {index} out of range")
+        path = []
+        for level in self.levels[:-1]:
+            sibling = index ^ 1
+            if sibling < len(level):
+                path.append((level[sibling], sibling < index))
+            index //= 2
+        return path
+
+    def verify_chunk(
+        self,
+        chunk: np.ndarray,
+        index: int,
+        proof: Optional[List[Tuple[bytes, bool]]] = None
+    ) -> bool:
+        """
+        Check one chunk of samples against the fingerprint.
+
+        Only the chunk itself is hashed; the audit path supplies the rest of
+        the tree. Without an explicit proof the path is taken from this tree.
+
+        Args:
+            chunk (numpy.ndarray): Samples chunk_bounds(index) of the signal
+            index (int): Chunk index
+            proof (list, optional): Audit path, as returned by proof()
+
+        Returns:
+            bool: True if the chunk matches
+
+        Raises:
+            ValueError: If the index is not a chunk of the signal
+        """
+        if not 0 <= index < self.num_chunks:
+            raise ValueError(f"Chunk index {index} out of range")
+        chunk = np.atleast_1d(np.asarray(chunk))
+        start, stop = self.chunk_bounds(index)
+        if chunk.dtype != self.dtype or chunk.shape != (stop - start,) + self.shape[1:]:
+            return False
+        node = self._leaf(self.algorithm, chunk)
+        for sibling, sibling_is_left in (self.proof(index) if proof is None else proof):
+            node = self._node(sibling, node) if sibling_is_left else self._node(node, sibling)
+        return node == self.tree_root
+
+    def verify_chunks(self, signal: np.ndarray, indices: Sequence[int]) -> List[int]:
+        """
+        Check selected chunks of a signal, reading only those chunks.
+
+        Works on memory-mapped arrays without touching the rest of the file.
+
+        Args:
+            signal (numpy.ndarray): Signal to check
+            indices (sequence of int): Chunk indices to check
+
+        Returns:
+            list: Indices of the chunks that do not match
+        """
+        return [index for index in indices
+                if not self.verify_chunk(signal[slice(*self.chunk_bounds(index))], index)]
+
+    def diff(self, other: 'MerkleFingerprint') -> List[int]:
+        """
+        Locate the chunks where another fingerprint of the same layout differs.
+
+        The trees are compared from the root down, descending only into
+        subtrees whose hashes differ, so k corrupted chunks cost about
+        k * log2(num_chunks) comparisons.
+
+        Args:
+            other (MerkleFingerprint): Fingerprint of the suspect copy
+
+        Returns:
+            list: Indices of the differing chunks, in order
+
+        Raises:
+            ValueError: If the fingerprints do not describe the same layout
+        """
+        if (other.algorithm, other.chunk_size, other.dtype, other.shape) != (
+                self.algorithm, self.chunk_size, self.dtype, self.shape):
+            raise ValueError("Fingerprints differ in algorithm, chunk size, dtype or shape")
+        if self.num_chunks == 0:
+            return []
+        suspects = [0]
+        for depth in range(len(self.levels) - 1, 0, -1):
+            mine, theirs = self.levels[depth], other.levels[depth]
+            suspects = [index for index in suspects if mine[index] != theirs[index]]
+            below = len(self.levels[depth - 1])
+            suspects = [child for index in suspects
+                        for child in (2 * index, 2 * index + 1) if child < below]
+        return [index for index in suspects if self.levels[0][index] != other.levels[0][index]]
@@ -9,10 +9,383 @@ signal processing applications.
 """
 
 import numpy as np
-from typing import Union, Tuple, Optional
+from typing import Iterator, Union, Tuple, Optional
 import hashlib
+import hmac
 import secrets
 
+try:
+    import blake3
+except ImportError:  # optional, faster keyed hashing
+    blake3 = None
+
+from .memory_budget import BudgetPlan, MemoryBudget, default_memory_budget
+
+# Bytes copied per chunk when hashing a non-contiguous array
+_HASH_CHUNK_BYTES = 1 << 22
+
+# Elements checked per chunk when validating finiteness
+_VALIDATE_CHUNK_ELEMENTS = 1 << 18
+
+# Random bytes drawn per refill of a SecureNoise pool
+_SECURE_POOL_BYTES = 1 << 16
+
+# Samples converted per chunk, bounding the integer temporaries
+_SECURE_CHUNK_SAMPLES = 1 << 17
+
+# Random word type, discarded low bits and scale for each output precision:
+# the top 53 (or 24) bits of a word are exactly representable, and
+# k * 2**-52 - 1 (or k * 2**-23 - 1) is uniform over [-1, 1)
+_UNIFORM_FORMATS = {
+    np.dtype(np.float64): (np.uint64, 11, 2.0 ** -52),
+    np.dtype(np.float32): (np.uint32, 8, 2.0 ** -23),
+}
+
+
+class SecureNoise:
+    """
+    Stream of uniform noise drawn from the operating system's CSPRNG.
+
+    Random bytes come from secrets.token_bytes in large batches: requests
+    smaller than the pool are served from a buffered batch, larger ones are
+    drawn directly. With pool_bytes=0 every request is drawn directly, so a
+    one-shot call reads exactly the bytes it needs. The top bits of each random word are mapped to an
+    evenly spaced float, so every value is finite and the noise is exactly
+    uniform over [-amplitude, amplitude).
+    """
+
+    def __init__(self, amplitude: float = 1.0, pool_bytes: int = _SECURE_POOL_BYTES):
+        """
+        Create a secure noise stream.
+
+        Args:
+            amplitude (float): Noise amplitude
+            pool_bytes (int): Size of the buffered batch of random bytes;
+                0 disables buffering
+        """
+        if pool_bytes < 0:
+            raise ValueError("Pool size must not be negative")
+        self.amplitude = amplitude
+        self.pool_bytes = pool_bytes
+        self._pool = memoryview(b'')
+
+    def _random_bytes(self, num_bytes: int) -> memoryview:
+        """Return num_bytes fresh random bytes, refilling the pool as needed."""
+        if num_bytes >= self.pool_bytes:
+            return memoryview(secrets.token_bytes(num_bytes))
+        if len(self._pool) < num_bytes:
+            self._pool = memoryview(secrets.token_bytes(self.pool_bytes))
+        chunk, self._pool = self._pool[:num_bytes], self._pool[num_bytes:]
+        return chunk
+
+    def generate(
+        self,
+        num_samples: int,
+        dtype: np.dtype = np.float64,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Generate the next samples of the stream.
+
+        Args:
+            num_samples (int): Number of samples
+            dtype (numpy.dtype): Output dtype (float64 or float32)
+            out (numpy.ndarray, optional): Buffer of length num_samples to
+                write the samples into
+
+        Returns:
+            numpy.ndarray: Secure random noise signal
+        """
+        if out is None:
+            out = np.empty(num_samples, dtype=dtype)
+        elif out.shape != (num_samples,):
+            raise ValueError(f"Output buffer must have shape {(num_samples,)}")
+        if out.dtype not in _UNIFORM_FORMATS:
+            raise ValueError("dtype must be float32 or float64")
+        word, shift, scale = _UNIFORM_FORMATS[out.dtype]
+        word_size = np.dtype(word).itemsize
+
+        for start in range(0, num_samples, _SECURE_CHUNK_SAMPLES):
+            chunk = out[start:start + _SECURE_CHUNK_SAMPLES]
+            bits = np.frombuffer(self._random_bytes(len(chunk) * word_size), dtype=word)
+            chunk[...] = bits >> shift
+            chunk *= scale
+            chunk -= 1
+            chunk *= self.amplitude
+        return out
+
+    def blocks(
+        self,
+        block_size: int = 4096,
+        num_samples: Optional[int] = None,
+        dtype: np.dtype = np.float64
+    ) -> Iterator[np.ndarray]:
+        """
+        Yield fixed-size blocks of the stream.
+
+        Args:
+            block_size (int): Number of samples per block (the last may be shorter)
+            num_samples (int, optional): Total number of samples; unbounded if None
+            dtype (numpy.dtype): Output dtype (float64 or float32)
+
+        Yields:
+            numpy.ndarray: Next noise block
+        """
+        if block_size <= 0:
+            raise ValueError("Block size must be a positive integer")
+        remaining = num_samples
+        while remaining is None or remaining > 0:
+            n = block_size if remaining is None else min(block_size, remaining)
+            yield self.generate(n, dtype)
+            if remaining is not None:
+                remaining -= n
+
+
+def _hash_array(hash_object, array: np.ndarray) -> None:
+    """
+    Feed the C-order bytes of array to a hash object.
+
+    C-contiguous arrays are hashed through a zero-copy byte view; other
+    layouts are copied a few megabytes at a time along the first axis.
+    """
+    if array.dtype.hasobject:
+        raise ValueError("Arrays of Python objects cannot be hashed")
+    if array.flags.c_contiguous:
+        hash_object.update(memoryview(array.reshape(-1).view(np.uint8)))
+        return
+    row_bytes = max(1, array[:1].nbytes)
+    rows = max(1, _HASH_CHUNK_BYTES // row_bytes)
+    for start in range(0, len(array), rows):
+        chunk = np.ascontiguousarray(array[start:start + rows])
+        hash_object.update(memoryview(chunk.reshape(-1).view(np.uint8)))
+
+
+class SignalHasher:
+    """
+    Incremental integrity hash of a signal fed block by block.
+
+    Blocks are treated as consecutive pieces of one array joined along
+    their sample axis (the first by default), and must share its dtype and
+    the shape of the other axes. The digest covers the samples in order,
+    each sample's channels in C order, followed by a header with the dtype
+    (including byte order) and the final shape with the sample axis first,
+    so it is identical whether the signal is fed in one piece or in blocks,
+    but differs for the same bytes read with another dtype or shape.
+    """
+
+    ALGORITHMS = ('sha256', 'blake2b', 'blake3')
+
+    def __init__(
+        self,
+        algorithm: str = 'sha256',
+        key: Optional[bytes] = None,
+        digest_size: Optional[int] = None
+    ):
+        """
+        Create an empty hasher.
+
+        Args:
+            algorithm (str): 'sha256' (HMAC-SHA256 when keyed), 'blake2b' or
+                'blake3' (requires the blake3 package)
+            key (bytes, optional): Secret key for a keyed digest (32 bytes for blake3)
+            digest_size (int, optional): Digest length in bytes for blake2b
+                (up to 64) or blake3
+
+        Raises:
+            ValueError: If the algorithm is unknown or unavailable
+        """
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+        if digest_size is not None and algorithm == 'sha256':
+            raise ValueError("sha256 has a fixed digest size")
+        self.algorithm = algorithm
+        self.digest_size = digest_size
+
+        if algorithm == 'sha256':
+            self._hash = hmac.new(key, digestmod='sha256') if key else hashlib.sha256()
+        elif algorithm == 'blake2b':
+            self._hash = hashlib.blake2b(key=key or b'', digest_size=digest_size or 64)
+        else:
+            if blake3 is None:
+                raise ValueError("blake3 hashing requires the blake3 package")
+            self._hash = blake3.blake3(key=key) if key else blake3.blake3()
+
+        self.dtype = None
+        self.shape = None
+
+    def update(self, block: np.ndarray, axis: int = 0) -> 'SignalHasher':
+        """
+        Add the next block of the signal.
+
+        Args:
+            block (numpy.ndarray): Next block; scalars and 1-D blocks extend a 1-D signal
+            axis (int): Sample axis of the block; -1 for (channels, time) blocks
+
+        Returns:
+            SignalHasher: self, so calls can be chained
+
+        Raises:
+            ValueError: If the block's dtype or channel shape does not match
+        """
+        block = np.moveaxis(np.atleast_1d(np.asarray(block)), axis, 0)
+        if self.dtype is None:
+            self.dtype = block.dtype
+            self.shape = (0,) + block.shape[1:]
+        elif block.dtype != self.dtype or block.shape[1:] != self.shape[1:]:
+            raise ValueError(
+                f"Block of dtype {block.dtype} and shape {block.shape} does not extend "
+                f"a signal of dtype {self.dtype} and shape {self.shape}")
+        _hash_array(self._hash, block)
+        self.shape = (self.shape[0] + block.shape[0],) + self.shape[1:]
+        return self
+
+    def digest(self) -> bytes:
+        """
+        Return the digest of the signal fed so far.
+
+        More blocks may be added afterwards.
+
+        Returns:
+            bytes: Digest of the data and its dtype and shape
+        """
+        dtype = '' if self.dtype is None else self.dtype.str
+        header = f"|{dtype}|{','.join(str(n) for n in self.shape or ())}".encode()
+        final = self._hash.copy()
+        final.update(header)
+        final.update(len(header).to_bytes(8, 'little'))
+        if self.algorithm == 'blake3':
+            return final.digest(self.digest_size or 32)
+        return final.digest()
+
+    def hexdigest(self) -> str:
+        """
+        Return the digest as a hexadecimal string.
+
+        Returns:
+            str: Hexadecimal digest
+        """
+        return self.digest().hex()
+
+
+def _first_non_finite(array: np.ndarray) -> Optional[int]:
+    """
+    Return the flat C-order index of the first NaN or inf, or None.
+
+    The array is walked in fixed-size chunks. Each chunk is reduced with a
+    sum, which is NaN or inf if any element is; only then, or if the sum
+    merely overflowed, is an elementwise isfinite run on that chunk alone.
+    No full-size temporary is ever allocated.
+    """
+    if array.dtype.kind not in 'fc':
+        return None
+    # Half precision overflows its own sums far too easily
+    accumulator = np.float32 if array.dtype == np.float16 else None
+    offset = 0
+    chunks = np.nditer(array, flags=['external_loop', 'buffered', 'zerosize_ok'],
+                       order='C', buffersize=_VALIDATE_CHUNK_ELEMENTS)
+    with np.errstate(over='ignore', invalid='ignore'):
+        for chunk in chunks:
+            if not np.isfinite(np.sum(chunk, dtype=accumulator)):
+                bad = np.flatnonzero(~np.isfinite(chunk))
+                if len(bad):
+                    return offset + int(bad[0])
+            offset += len(chunk)
+    return None
+
+
+def _check_layout(
+    array: np.ndarray,
+    dtype: Optional[Union[np.dtype, Tuple[np.dtype, ...]]],
+    require_contiguous: bool
+) -> None:
+    """Raise ValueError if array has a disallowed dtype or is not C-contiguous."""
+    if dtype is not None:
+        allowed = tuple(np.dtype(d) for d in (dtype if isinstance(dtype, tuple) else (dtype,)))
+        if array.dtype not in allowed:
+            raise ValueError(f"Array dtype {array.dtype} is not one of "
+                             f"{', '.join(str(d) for d in allowed)}")
+    if require_contiguous and not array.flags.c_contiguous:
+        raise ValueError("Array must be C-contiguous")
+
+
+class StreamingValidator:
+    """
+    Validator for a stream of blocks joined along their sample axis.
+
+    Checks every block for dtype, layout and finiteness, and keeps the
+    dtype, channel shape and sample count across blocks, so errors name
+    the offending sample's position in the whole stream and the stream
+    can be capped at a total length.
+    """
+
+    def __init__(
+        self,
+        max_samples: Optional[int] = None,
+        dtype: Optional[Union[np.dtype, Tuple[np.dtype, ...]]] = None,
+        require_contiguous: bool = False,
+        check_finite: bool = True
+    ):
+        """
+        Create a validator for a new stream.
+
+        Args:
+            max_samples (int, optional): Maximum total samples (sample-axis length)
+            dtype (numpy.dtype or tuple, optional): Allowed dtype(s)
+            require_contiguous (bool): Require C-contiguous blocks
+            check_finite (bool): Reject NaN and inf values
+        """
+        self.max_samples = max_samples
+        self.dtype = dtype
+        self.require_contiguous = require_contiguous
+        self.check_finite = check_finite
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the stream so far."""
+        self.samples_seen = 0
+        self._block_dtype = None
+        self._trailing_shape = None
+
+    def validate(self, block: np.ndarray, axis: int = 0) -> bool:
+        """
+        Validate the next block of the stream.
+
+        Args:
+            block (numpy.ndarray): Next block
+            axis (int): Sample axis of the block; -1 for (channels, time) blocks
+
+        Returns:
+            bool: True if the block is valid
+
+        Raises:
+            ValueError: If the block is invalid; a non-finite value is
+                reported by its sample index in the stream
+        """
+        if not isinstance(block, np.ndarray):
+            raise ValueError("Input must be a numpy array")
+        block = block.reshape(1) if block.ndim == 0 else block
+        _check_layout(block, self.dtype, self.require_contiguous)
+        shape, block = block.shape, np.moveaxis(block, axis, 0)
+        if self._block_dtype is None:
+            self._block_dtype, self._trailing_shape = block.dtype, block.shape[1:]
+        elif block.dtype != self._block_dtype or block.shape[1:] != self._trailing_shape:
+            raise ValueError(
+                f"Block of dtype {block.dtype} and shape {shape} does not match "
+                f"the stream's dtype {self._block_dtype} and channel shape {self._trailing_shape}")
+        if self.max_samples is not None and self.samples_seen + len(block) > self.max_samples:
+            raise ValueError(f"Stream length exceeds maximum of {self.max_samples} samples")
+
+        if self.check_finite:
+            bad = _first_non_finite(block)
+            if bad is not None:
+                position = np.unravel_index(bad, block.shape)
+                sample = self.samples_seen + int(position[0])
+                channel = f" (channel {tuple(int(i) for i in position[1:])})" if block.ndim > 1 else ""
+                raise ValueError(f"Non-finite value at sample {sample}{channel}")
+        self.samples_seen += len(block)
+        return True
+
+
 class SignalSecurity:
     """
     Security utilities for signal processing operations.
@@ -24,22 +397,46 @@ class SignalSecurity:
         frequency: float,
         duration: float,
         sampling_rate: int,
-        amplitude: float
-    ) -> bool:
+        amplitude: float,
+        memory_budget: Optional[MemoryBudget] = None,
+        operation: str = 'sine_wave',
+        dtype: np.dtype = np.float64,
+        channels: int = 1,
+        max_samples: Optional[int] = None
+    ) -> BudgetPlan:
         """
         Validate signal parameters to prevent invalid operations.
+
+        The peak memory of the operation is estimated against a memory
+        budget, by default half of the memory available when the default
+        budget is first used, and the resulting plan is returned: a call
+        that does not fit in one shot comes back with a streaming
+        recommendation rather than an error. The plan is a namedtuple and
+        always truthy, but it is no longer the True returned by earlier
+        versions, so callers testing the result with `is True` must test
+        its truth value instead.
         
         Args:
             frequency (float): Signal frequency
             duration (float): Signal duration
             sampling_rate (int): Sampling rate
             amplitude (float): Signal amplitude
+            memory_budget (MemoryBudget, optional): Budget to plan against;
+                defaults to default_memory_budget()
+            operation (str): Operation the parameters are for, one of
+                MemoryBudget.OPERATIONS
+            dtype (numpy.dtype): Output dtype
+            channels (int): Number of channels
+            max_samples (int, optional): Fixed cap on the number of samples
+                per channel, for callers that want a hard limit regardless
+                of memory
             
         Returns:
-            bool: True if parameters are valid
+            BudgetPlan: Peak memory estimate and recommendation
             
         Raises:
-            ValueError: If parameters are invalid
+            ValueError: If parameters are invalid, exceed max_samples, or no
+                path fits the budget
         """
         if not isinstance(frequency, (int, float)) or frequency <= 0:
             raise ValueError("Frequency must be a positive number")
@@ -58,37 +455,68 @@ class SignalSecurity:
             raise ValueError("Frequency violates Nyquist criterion")
             
         # Check memory constraints
-        if duration * sampling_rate > 1e8:  # 100 million samples limit
-            raise ValueError("Signal length exceeds memory constraints")
-            
-        return True
+        num_samples = int(duration * sampling_rate)
+        if max_samples is not None and num_samples > max_samples:
+            raise ValueError(f"Signal length of {num_samples} samples exceeds the limit "
+                             f"of {max_samples}")
+        if memory_budget is None:
+            memory_budget = default_memory_budget()
+        plan = memory_budget.plan(operation, num_samples, dtype, channels)
+        if plan.recommendation == 'reject':
+            raise ValueError(f"{operation} needs about {plan.peak_bytes} bytes, over the "
+                             f"budget of {plan.budget_bytes} bytes, and cannot be streamed")
+        return plan
     
     @staticmethod
     def secure_random_noise(
         size: int,
-        amplitude: float = 1.0
+        amplitude: float = 1.0,
+        dtype: np.dtype = np.float64
     ) -> np.ndarray:
         """
         Generate cryptographically secure random noise.
         
         Args:
             size (int): Number of samples
-            amplitude (float): Noise amplitude
+            amplitude (float): Noise amplitude; samples are uniform over
+                [-amplitude, amplitude)
+            dtype (numpy.dtype): Output dtype (float64 or float32)
             
         Returns:
             numpy.ndarray: Secure random noise signal
         """
-        # Use secrets module for cryptographic randomness
-        random_bytes = secrets.token_bytes(size * 8)  # 8 bytes per float64
-        # Convert to array of floats between -1 and 1
-        noise = np.frombuffer(random_bytes, dtype='float64')
-        noise = (noise / np.max(np.abs(noise))) * amplitude
-        return noise[:size]  # Ensure exact size
+        # A one-shot call has no later requests to serve from a pool
+        return SecureNoise(amplitude, pool_bytes=0).generate(size, dtype)
+
+    @staticmethod
+    def secure_noise_blocks(
+        block_size: int = 4096,
+        num_samples: Optional[int] = None,
+        amplitude: float = 1.0,
+        dtype: np.dtype = np.float64
+    ) -> Iterator[np.ndarray]:
+        """
+        Generate cryptographically secure random noise as a stream of blocks.
+        
+        Args:
+            block_size (int): Number of samples per block (the last may be shorter)
+            num_samples (int, optional): Total number of samples; unbounded if None
+            amplitude (float): Noise amplitude
+            dtype (numpy.dtype): Output dtype (float64 or float32)
+            
+        Yields:
+            numpy.ndarray: Next noise block
+        """
+        return SecureNoise(amplitude).blocks(block_size, num_samples, dtype)
     
     @staticmethod
     def compute_signal_hash(signal: np.ndarray) -> str:
         """
         Compute cryptographic hash of signal data for integrity verification.
+
+        The digest covers the raw bytes only, hashed without copying
+        contiguous arrays; use SignalHasher to also bind the dtype and shape,
+        or to hash a stream block by block.
         
         Args:
             signal (numpy.ndarray): Input signal
@@ -96,25 +524,38 @@ class SignalSecurity:
         Returns:
             str: SHA-256 hash of the signal data
         """
-        return hashlib.sha256(signal.tobytes()).hexdigest()
+        digest = hashlib.sha256()
+        _hash_array(digest, np.asarray(signal))
+        return digest.hexdigest()
     
     @staticmethod
     def validate_array_bounds(
         array: np.ndarray,
-        max_size: Optional[int] = None
+        max_size: Optional[int] = None,
+        dtype: Optional[Union[np.dtype, Tuple[np.dtype, ...]]] = None,
+        require_contiguous: bool = False,
+        check_finite: bool = True
     ) -> bool:
         """
         Validate array bounds to prevent buffer overflows.
+
+        Finiteness is checked chunk by chunk without copying the array or
+        allocating a full-size mask; use StreamingValidator for blocks of a
+        stream.
         
         Args:
             array (numpy.ndarray): Input array
             max_size (int, optional): Maximum allowed size
+            dtype (numpy.dtype or tuple, optional): Allowed dtype(s)
+            require_contiguous (bool): Require a C-contiguous array
+            check_finite (bool): Reject NaN and inf values
             
         Returns:
             bool: True if array is valid
             
         Raises:
-            ValueError: If array bounds are invalid
+            ValueError: If array bounds are invalid; a non-finite value is
+                reported with the index of the first one
         """
         if not isinstance(array, np.ndarray):
             raise ValueError("Input must be a numpy array")
@@ -124,8 +565,14 @@ class SignalSecurity:
             
         if max_size and array.size > max_size:
             raise ValueError(f"Array size exceeds maximum allowed size of {max_size}")
+
+        _check_layout(array, dtype, require_contiguous)
             
-        if not np.isfinite(array).all():
-            raise ValueError("Array contains non-finite values")
+        if check_finite:
+            bad = _first_non_finite(array)
+            if bad is not None:
+                index = np.unravel_index(bad, array.shape)
+                index = int(index[0]) if array.ndim == 1 else tuple(int(i) for i in index)
+                raise ValueError(f"Array contains non-finite values (first at index {index})")
             
         return True
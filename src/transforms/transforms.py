@@ -1,107 +1,284 @@
+import functools
+
 import numpy as np
 from scipy import fft
 
+# Number of windowed samples transformed per batch in stft()
+_STFT_BATCH_SAMPLES = 1 << 20
+
+
+@functools.lru_cache(maxsize=32)
+def _get_window(window, window_size):
+    """Return a cached, read-only analysis window."""
+    if window == 'hann':
+        window_func = np.hanning(window_size)
+    elif window == 'hamming':
+        window_func = np.hamming(window_size)
+    elif window == 'blackman':
+        window_func = np.blackman(window_size)
+    else:
+        raise ValueError(f"Unsupported window type: {window}")
+    window_func.setflags(write=False)
+    return window_func
+
+
+@functools.lru_cache(maxsize=32)
+def _overlap_envelopes(window, window_size, hop_length):
+    """
+    Return cached inverse squared-window overlap sums for istft().
+
+    With the output viewed as rows of hop_length samples, every row away
+    from the ends sees all window segments, while the first and last
+    n_segments - 1 rows see a prefix or suffix of them. The three profiles
+    therefore only depend on (window, window_size, hop_length).
+    """
+    window_func = _get_window(window, window_size)
+    n_segments = -(-window_size // hop_length)
+    squared = np.zeros(n_segments * hop_length)
+    squared[:window_size] = window_func ** 2
+    segments = squared.reshape(n_segments, hop_length)
+    cumulative = np.cumsum(segments, axis=0)
+    head = cumulative[:-1]
+    interior = cumulative[-1]
+    tail = interior - cumulative[:-1]
+
+    tiny = np.finfo(np.float64).tiny
+    profiles = []
+    for envelope in (head, interior, tail):
+        inverse = np.zeros_like(envelope)
+        np.divide(1.0, envelope, out=inverse, where=envelope > tiny)
+        inverse.setflags(write=False)
+        profiles.append(inverse)
+    return tuple(profiles)
+
+
+def _normalize_overlap(rows, window, window_size, hop_length, n_frames):
+    """Divide overlap-added rows by the squared-window envelope in place."""
+    n_segments = -(-window_size // hop_length)
+    if n_frames < n_segments - 1:
+        # Too few frames for the cached profiles; build the envelope directly
+        squared = np.zeros(n_segments * hop_length)
+        squared[:window_size] = _get_window(window, window_size) ** 2
+        segments = squared.reshape(n_segments, hop_length)
+        envelope = np.zeros(rows.shape)
+        for k in range(n_segments):
+            envelope[k:k + n_frames] += segments[k]
+        inverse = np.zeros_like(envelope)
+        np.divide(1.0, envelope, out=inverse, where=envelope > np.finfo(np.float64).tiny)
+        rows *= inverse
+        return
+    head, interior, tail = _overlap_envelopes(window, window_size, hop_length)
+    rows[:n_segments - 1] *= head
+    rows[n_segments - 1:n_frames] *= interior
+    rows[n_frames:] *= tail
+
+
 class SignalTransforms:
     """A class implementing various signal transformations."""
     
     @staticmethod
-    def fft(signal_array, sampling_rate):
+    def fft(signal_array, sampling_rate, workers=None, fast_length=False,
+            magnitudes_only=False):
         """
         Compute the Fast Fourier Transform of a signal.
+
+        Real input uses a real FFT, which computes only the non-negative
+        frequencies (including Nyquist for even lengths) instead of the full
+        spectrum followed by a masked copy.
         
         Args:
             signal_array (numpy.ndarray): Input signal
             sampling_rate (int): Sampling rate in Hz
+            workers (int, optional): Number of workers for scipy.fft
+            fast_length (bool): Zero-pad to the next fast FFT length
+            magnitudes_only (bool): Skip the phases and compute the magnitudes
+                in place in the spectrum buffer
             
         Returns:
-            tuple: (frequencies, magnitudes, phases)
+            tuple: (frequencies, magnitudes, phases), or
+            (frequencies, magnitudes) if magnitudes_only is set
         """
+        signal_array = np.asarray(signal_array)
         n = len(signal_array)
-        frequencies = fft.fftfreq(n, d=1/sampling_rate)
-        spectrum = fft.fft(signal_array)
-        magnitudes = np.abs(spectrum)
-        phases = np.angle(spectrum)
-        
-        # Only return positive frequencies
-        positive_mask = frequencies >= 0
-        return (frequencies[positive_mask], 
-                magnitudes[positive_mask],
-                phases[positive_mask])
+        if fast_length:
+            n = fft.next_fast_len(n, real=not np.iscomplexobj(signal_array))
+
+        if np.iscomplexobj(signal_array):
+            # Complex input has no Hermitian symmetry; keep the full transform
+            spectrum = fft.fft(signal_array, n=n, workers=workers)[:n // 2 + 1]
+            frequencies = np.abs(fft.fftfreq(n, d=1/sampling_rate)[:n // 2 + 1])
+        else:
+            spectrum = fft.rfft(signal_array, n=n, workers=workers)
+            frequencies = fft.rfftfreq(n, d=1/sampling_rate)
+
+        if magnitudes_only:
+            magnitudes = spectrum.real
+            np.hypot(spectrum.real, spectrum.imag, out=magnitudes)
+            return frequencies, magnitudes
+        return frequencies, np.abs(spectrum), np.angle(spectrum)
     
     @staticmethod
-    def ifft(magnitudes, phases):
+    def ifft(magnitudes, phases, n=None, workers=None, onesided=True):
         """
         Compute the Inverse Fast Fourier Transform.
+
+        By default the spectrum is the one-sided output of fft() and is
+        inverted with an inverse real FFT.
         
         Args:
             magnitudes (numpy.ndarray): Magnitude spectrum
             phases (numpy.ndarray): Phase spectrum
+            n (int, optional): Length of the output signal; needed to recover
+                odd-length signals, defaults to 2 * (len(magnitudes) - 1)
+            workers (int, optional): Number of workers for scipy.fft
+            onesided (bool): Set to False for a full two-sided spectrum
             
         Returns:
             numpy.ndarray: Reconstructed time-domain signal
         """
-        spectrum = magnitudes * np.exp(1j * phases)
-        return np.real(fft.ifft(spectrum))
+        spectrum = magnitudes * np.exp(1j * np.asarray(phases))
+        if onesided:
+            return fft.irfft(spectrum, n=n, workers=workers)
+        return np.real(fft.ifft(spectrum, n=n, workers=workers))
     
     @staticmethod
-    def stft(signal_array, window_size=2048, hop_length=512, window='hann'):
+    def stft(signal_array, window_size=2048, hop_length=512, window='hann',
+             center=False, pad_end=False, workers=None, out=None):
         """
         Compute the Short-Time Fourier Transform.
-        
+
+        Frames are taken as a zero-copy strided view of the input, windowed
+        with a single broadcast multiply and transformed with one batched
+        real FFT, so only the non-negative frequency bins are returned.
+
         Args:
-            signal_array (numpy.ndarray): Input signal
+            signal_array (numpy.ndarray): Real input signal
             window_size (int): Size of the analysis window
             hop_length (int): Number of samples between successive windows
             window (str): Window type ('hann', 'hamming', 'blackman', etc.)
-            
+            center (bool): Reflect-pad the signal by window_size // 2 on both
+                sides so that frame k is centred on sample k * hop_length
+            pad_end (bool): Zero-pad the end of the signal so that the
+                trailing samples are covered by a final frame
+            workers (int, optional): Number of workers for scipy.fft
+            out (numpy.ndarray, optional): Complex buffer of shape
+                (n_frames, window_size // 2 + 1) to write the result into,
+                complex64 for float32 input and complex128 otherwise
+
         Returns:
-            numpy.ndarray: Complex STFT matrix
+            numpy.ndarray: Complex STFT matrix of shape
+            (n_frames, window_size // 2 + 1)
+
+        Raises:
+            ValueError: If the signal is complex or not one-dimensional, or
+                out has the wrong shape or dtype
         """
-        if window == 'hann':
-            window_func = np.hanning(window_size)
-        elif window == 'hamming':
-            window_func = np.hamming(window_size)
-        elif window == 'blackman':
-            window_func = np.blackman(window_size)
-        else:
-            raise ValueError(f"Unsupported window type: {window}")
-            
-        return np.array([
-            fft.fft(signal_array[i:i+window_size] * window_func)
-            for i in range(0, len(signal_array) - window_size, hop_length)
-        ])
-    
+        signal_array = np.asarray(signal_array)
+        if signal_array.ndim != 1:
+            raise ValueError("Input signal must be one-dimensional")
+        if np.iscomplexobj(signal_array):
+            raise ValueError("Input signal must be real; the STFT keeps only "
+                             "non-negative frequencies")
+        if hop_length <= 0:
+            raise ValueError("Hop length must be a positive integer")
+        window_func = _get_window(window, window_size)
+
+        if center:
+            pad = window_size // 2
+            mode = 'reflect' if len(signal_array) > pad else 'constant'
+            signal_array = np.pad(signal_array, pad, mode=mode)
+        if pad_end:
+            n_frames = -(-max(len(signal_array) - window_size, 0) // hop_length) + 1
+            padded_len = (n_frames - 1) * hop_length + window_size
+            signal_array = np.pad(signal_array, (0, padded_len - len(signal_array)))
+        if len(signal_array) < window_size:
+            raise ValueError("Signal is shorter than the analysis window")
+
+        frames = np.lib.stride_tricks.sliding_window_view(
+            signal_array, window_size)[::hop_length]
+        n_frames = len(frames)
+        float_dtype = np.result_type(signal_array.dtype, np.float32)
+        complex_dtype = np.result_type(float_dtype, np.complex64)
+        window_func = window_func.astype(float_dtype, copy=False)
+
+        shape = (n_frames, window_size // 2 + 1)
+        if out is None:
+            out = np.empty(shape, dtype=complex_dtype)
+        elif out.shape != shape:
+            raise ValueError(f"Output buffer must have shape {shape}")
+        elif out.dtype != complex_dtype:
+            raise ValueError(f"Output buffer must have dtype {complex_dtype}")
+
+        # Transform in batches so the windowed copy stays cache-sized
+        batch = max(1, _STFT_BATCH_SAMPLES // window_size)
+        for start in range(0, n_frames, batch):
+            stop = min(start + batch, n_frames)
+            windowed = frames[start:stop] * window_func
+            out[start:stop] = fft.rfft(windowed, axis=-1, overwrite_x=True,
+                                       workers=workers)
+        return out
+
     @staticmethod
-    def istft(stft_matrix, window_size=2048, hop_length=512, window='hann'):
+    def istft(stft_matrix, window_size=2048, hop_length=512, window='hann',
+              center=False, length=None, workers=None, out=None):
         """
         Compute the Inverse Short-Time Fourier Transform.
-        
+
+        All frames are inverted with one batched inverse real FFT and
+        overlap-added with hop-aligned vectorized sums. The result is
+        divided by the squared-window overlap envelope, so stft() followed
+        by istft() reconstructs the input.
+
         Args:
-            stft_matrix (numpy.ndarray): STFT matrix
+            stft_matrix (numpy.ndarray): One-sided STFT matrix from stft()
             window_size (int): Size of the analysis window
             hop_length (int): Number of samples between successive windows
             window (str): Window type ('hann', 'hamming', 'blackman', etc.)
-            
+            center (bool): Trim the window_size // 2 padding added by
+                stft(center=True)
+            length (int, optional): Exact output length; the signal is
+                trimmed or zero-padded to it
+            workers (int, optional): Number of workers for scipy.fft
+            out (numpy.ndarray, optional): Buffer to write the result into
+
         Returns:
             numpy.ndarray: Reconstructed time-domain signal
         """
-        if window == 'hann':
-            window_func = np.hanning(window_size)
-        elif window == 'hamming':
-            window_func = np.hamming(window_size)
-        elif window == 'blackman':
-            window_func = np.blackman(window_size)
-        else:
-            raise ValueError(f"Unsupported window type: {window}")
-            
-        # Initialize output array
+        stft_matrix = np.asarray(stft_matrix)
+        if hop_length <= 0:
+            raise ValueError("Hop length must be a positive integer")
+        window_func = _get_window(window, window_size)
+        float_dtype = np.float32 if stft_matrix.dtype == np.complex64 else np.float64
+        window_func = window_func.astype(float_dtype, copy=False)
+
+        # Overlap-add into hop-sized rows: frame i, segment k lands on row i + k
         n_frames = len(stft_matrix)
-        expected_signal_len = (n_frames - 1) * hop_length + window_size
-        reconstructed = np.zeros(expected_signal_len)
-        
-        # Reconstruct signal
-        for i, frame in enumerate(stft_matrix):
-            start = i * hop_length
-            reconstructed[start:start+window_size] += np.real(fft.ifft(frame)) * window_func
-            
-        return reconstructed
+        n_segments = -(-window_size // hop_length)
+        rows = np.zeros((n_frames + n_segments - 1, hop_length), dtype=float_dtype)
+        batch = max(1, _STFT_BATCH_SAMPLES // window_size)
+        for start in range(0, n_frames, batch):
+            stop = min(start + batch, n_frames)
+            frames = fft.irfft(stft_matrix[start:stop], n=window_size, axis=-1,
+                               workers=workers)
+            frames *= window_func
+            if n_segments * hop_length != window_size:
+                frames = np.pad(frames, ((0, 0), (0, n_segments * hop_length - window_size)))
+            segments = frames.reshape(stop - start, n_segments, hop_length)
+            for k in range(n_segments):
+                rows[start + k:stop + k] += segments[:, k]
+
+        _normalize_overlap(rows, window, window_size, hop_length, n_frames)
+        reconstructed = rows.reshape(-1)[:(n_frames - 1) * hop_length + window_size]
+
+        offset = window_size // 2 if center else 0
+        if length is None:
+            length = len(reconstructed) - 2 * offset
+        available = max(0, min(length, len(reconstructed) - offset))
+        if out is None:
+            out = np.zeros(length, dtype=float_dtype)
+        elif out.shape != (length,):
+            raise ValueError(f"Output buffer must have shape {(length,)}")
+        else:
+            out[available:] = 0
+        out[:available] = reconstructed[offset:offset + available]
+        return out
@@ -0,0 +1,95 @@
+import sys
+import os
+import functools
+from collections import namedtuple
+import numpy as np
+import pytest
+
+# Add the src directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.filters.digital_filters import DigitalFilters
+from src.pipeline.batch import BatchProcessor
+from src.transforms.transforms import SignalTransforms
+
+def band_pass_spectrum(clip):
+    filtered = DigitalFilters.band_pass_filter(clip, 500, 5000, 44100)
+    return SignalTransforms.fft(filtered, 44100)[1]
+
+def band_pass_cache_stats(clip):
+    cache = DigitalFilters.design_cache
+    before = (cache.hits, cache.misses)
+    DigitalFilters.band_pass_filter(clip, 500, 5000, 44100)
+    return before, (cache.hits, cache.misses)
+
+Summary = namedtuple('Summary', ['head', 'peak'])
+
+def head_dict(clip):
+    return {'head': clip[:2]}
+
+def head_summary(clip):
+    return Summary(clip[:2], clip.max())
+
+def fail_on_negative(clip):
+    if clip[0] < 0:
+        raise ValueError("negative clip")
+    return clip
+
+def test_batch_matches_serial_loop_in_order():
+    """Test that results equal a serial loop, in input order, across chunks."""
+    rng = np.random.default_rng(0)
+    clips = [rng.standard_normal(n) for n in rng.integers(1000, 3000, 11)]
+    clips.append(rng.standard_normal((2, 1500)).astype(np.float32))
+    with BatchProcessor(band_pass_spectrum, workers=2, chunk_size=3, max_pending=2) as batch:
+        results = batch.process(iter(clips))
+    assert len(results) == len(clips)
+    for clip, result in zip(clips, results):
+        assert np.allclose(result, band_pass_spectrum(clip), rtol=1e-6, atol=1e-6)
+
+def test_batch_returns_identity_results_and_passes_other_items():
+    """Test that returned views of shared memory are copied out and non-arrays pickled."""
+    clips = [np.arange(5.0) + i for i in range(5)]
+    with BatchProcessor(fail_on_negative, workers=1, chunk_size=2) as batch:
+        results = batch.process(clips)
+        assert np.array_equal(np.stack(results), np.stack(clips))
+        assert batch.process([[1, 2], (3,)]) == [[1, 2], (3,)]
+
+def test_batch_results_holding_views_survive_unmapping():
+    """Test that dicts and namedtuples holding views of the input come back intact."""
+    clips = [np.arange(5.0) + i for i in range(4)]
+    with BatchProcessor(head_dict, workers=1, chunk_size=3) as batch:
+        results = batch.process(clips)
+    assert [result['head'].tolist() for result in results] == [[i, i + 1] for i in range(4)]
+    with BatchProcessor(head_summary, workers=1, chunk_size=3) as batch:
+        results = batch.process(clips)
+    assert all(isinstance(result, Summary) for result in results)
+    assert [result.peak for result in results] == [4.0, 5.0, 6.0, 7.0]
+    assert np.array_equal(results[3].head, [3.0, 4.0])
+
+def test_batch_warms_design_cache_once_per_worker():
+    """Test that designs listed at start-up are cache hits in the tasks."""
+    design = (4, (500 / 22050, 5000 / 22050), 'band', 'sos')
+    DigitalFilters.design_cache.clear()
+    with BatchProcessor(band_pass_cache_stats, workers=1, designs=[design]) as batch:
+        (hits, misses), (hits_after, misses_after) = batch.process([np.ones(100)])[0]
+    # Designed once at start-up, then found in the cache by the task
+    assert misses == 1 and hits == 0
+    assert hits_after >= 1 and misses_after == misses
+    band_pass = functools.partial(DigitalFilters.band_pass_filter, low_cutoff=500,
+                                  high_cutoff=5000, sampling_rate=44100)
+    clips = [np.random.default_rng(i).standard_normal(1000) for i in range(3)]
+    with BatchProcessor(band_pass, workers=1, designs=[design]) as batch:
+        results = batch.process(clips)
+    assert all(np.allclose(result, band_pass(clip)) for result, clip in zip(results, clips))
+
+def test_batch_raises_first_error_in_order():
+    """Test that a failing task raises and later chunks are abandoned cleanly."""
+    clips = [np.ones(4), np.ones(4), -np.ones(4)] + [np.ones(4)] * 20
+    with BatchProcessor(fail_on_negative, workers=2, chunk_size=1, max_pending=3) as batch:
+        results = batch.map(clips)
+        assert np.array_equal(next(results), np.ones(4))
+        assert np.array_equal(next(results), np.ones(4))
+        with pytest.raises(ValueError, match="negative clip"):
+            next(results)
+    with pytest.raises(ValueError):
+        BatchProcessor(fail_on_negative, chunk_size=0)
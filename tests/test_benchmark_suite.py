@@ -0,0 +1,38 @@
+import sys
+import os
+import json
+
+# Add the src directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks import suite
+
+def test_compare_flags_regressions_over_threshold():
+    """Test that only time or memory increases over the threshold are reported."""
+    baseline = {'a': {'seconds': 1.0, 'peak_bytes': 1 << 20},
+                'b': {'seconds': 1.0, 'peak_bytes': 1 << 20},
+                'c': {'seconds': 1.0, 'peak_bytes': 100}}
+    results = {'a': {'seconds': 1.2, 'peak_bytes': 1 << 20},
+               'b': {'seconds': 0.5, 'peak_bytes': 2 << 20},
+               'c': {'seconds': 1.0, 'peak_bytes': 1000},
+               'new': {'seconds': 9.0, 'peak_bytes': 0}}
+    regressions = suite.compare(results, baseline, threshold=0.25)
+    assert [(key, metric) for key, metric, *_ in regressions] == [('b', 'peak_bytes')]
+    assert len(suite.compare(results, baseline, threshold=0.1)) == 2
+
+def test_suite_saves_and_compares_baseline(tmp_path, monkeypatch):
+    """Test a small sweep end to end, including the regression exit status."""
+    monkeypatch.setattr(suite, 'MIN_REPEAT_SECONDS', 0.001)
+    path = str(tmp_path / 'baseline.json')
+    args = ['--sizes', '1000', '--dtypes', 'float32', '--channels', '2',
+            '--filter', 'moving_average']
+    assert suite.main(args + ['--save', path]) == 0
+    with open(path) as f:
+        saved = json.load(f)
+    assert list(saved['results']) == ['DigitalFilters.moving_average|n=1000|float32|ch=2']
+
+    for result in saved['results'].values():
+        result['seconds'] /= 100
+    with open(path, 'w') as f:
+        json.dump(saved, f)
+    assert suite.main(args + ['--compare', path]) == 1
@@ -0,0 +1,59 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# Add the src directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.generators.colored_noise import ColoredNoise
+from src.generators.signal_generator import SignalGenerator
+
+def spectral_slope(noise, sampling_rate=44100):
+    """Fit the log-log PSD slope over the mid band (in powers of f)."""
+    nperseg = 8192
+    segments = noise[:len(noise) // nperseg * nperseg].reshape(-1, nperseg)
+    psd = np.mean(np.abs(np.fft.rfft(segments * np.hanning(nperseg), axis=1)) ** 2, axis=0)
+    freqs = np.fft.rfftfreq(nperseg, 1 / sampling_rate)
+    band = (freqs > 200) & (freqs < 5000)
+    return np.polyfit(np.log10(freqs[band]), np.log10(psd[band]), 1)[0]
+
+@pytest.mark.parametrize("color,slope", [
+    ('white', 0), ('pink', -1), ('brown', -2), ('blue', 1), ('violet', 2),
+])
+def test_colored_noise_spectrum_and_level(color, slope):
+    """Test the PSD slope and RMS level of each color."""
+    noise = ColoredNoise(color, amplitude=0.5, rng=0).generate(1 << 19)
+    assert spectral_slope(noise) == pytest.approx(slope, abs=0.2)
+    assert np.sqrt(np.mean(noise ** 2)) == pytest.approx(0.5, rel=0.1)
+
+def test_colored_noise_blocks_are_seamless_and_reproducible():
+    """Test that blocks concatenate to one long draw from the same seed."""
+    whole = ColoredNoise('pink', rng=42).generate(10000)
+    blocks = list(ColoredNoise('pink', rng=42).blocks(block_size=999, num_samples=10000))
+
+    assert len(blocks) == 11
+    assert np.allclose(np.concatenate(blocks), whole)
+
+    # The level does not depend on how long the stream has been running
+    stream = ColoredNoise('brown', rng=1)
+    first = stream.generate(50000)
+    later = stream.generate(50000)
+    assert np.std(first) == pytest.approx(np.std(later), rel=0.2)
+
+def test_noise_blocks_supports_colors():
+    """Test colored noise through the SignalGenerator block interface."""
+    blocks = list(SignalGenerator.noise_blocks(1.0, 8000, 0.1, 'violet', block_size=2048,
+                                               dtype=np.float32, rng=3))
+    assert sum(len(block) for block in blocks) == 8000
+    assert blocks[0].dtype == np.float32
+    with pytest.raises(ValueError):
+        ColoredNoise('grey')
+
+def test_one_shot_pink_noise_uses_streaming_filter():
+    """Test that noise(noise_type='pink') is the peak-scaled ColoredNoise stream."""
+    _, pink = SignalGenerator.noise(12.0, 44100, 0.8, 'pink', rng=np.random.default_rng(5))
+    stream = ColoredNoise('pink', rng=np.random.default_rng(5)).generate(len(pink))
+    assert np.allclose(pink, stream * 0.8 / np.max(np.abs(stream)))
+    assert np.max(np.abs(pink)) == pytest.approx(0.8)
+    assert spectral_slope(pink) == pytest.approx(-1, abs=0.2)
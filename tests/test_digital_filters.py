@@ -0,0 +1,159 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# Add the src directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.filters.digital_filters import DigitalFilters, FilterDesignCache, MovingAverage, StreamingFilter
+
+def test_streaming_filter_matches_one_shot():
+    """Test that block-wise streaming equals filtering the whole signal."""
+    rng = np.random.default_rng(0)
+    signal = rng.standard_normal(5000)
+    stream = StreamingFilter.band_pass(100, 800, 8000, order=6)
+
+    blocks = [stream.process(block) for block in np.array_split(signal, 23)]
+    assert np.allclose(np.concatenate(blocks), stream.filter(signal))
+
+    # Resetting returns the filter to rest
+    stream.reset()
+    assert np.allclose(stream.process(signal[:300]), stream.filter(signal[:300]))
+
+def test_streaming_filter_zero_phase():
+    """Test that the offline mode matches the one-shot zero-phase filter."""
+    t = np.arange(4000) / 1000
+    signal = np.sin(2 * np.pi * 5 * t) + 0.5 * np.sin(2 * np.pi * 200 * t)
+    stream = StreamingFilter.low_pass(20, 1000)
+
+    filtered = stream.filtfilt(signal)
+    expected = DigitalFilters.low_pass_filter(signal, 20, 1000)
+    assert np.allclose(filtered[500:-500], expected[500:-500], atol=1e-6)
+
+def test_streaming_filter_rejects_bad_sos():
+    """Test validation of the SOS coefficient shape."""
+    with pytest.raises(ValueError):
+        StreamingFilter(np.ones((2, 5)))
+
+def test_design_cache_counters_and_eviction():
+    """Test LRU behaviour and hit/miss/eviction counters of the design cache."""
+    cache = FilterDesignCache(maxsize=2)
+    b, a = cache.butter(4, 0.2, 'low')
+    assert cache.butter(4, 0.2, 'low')[0] is b
+    cache.butter(4, 0.3, 'low')
+    cache.butter(4, [0.1, 0.4], 'band')
+
+    assert cache.stats() == {'hits': 1, 'misses': 3, 'evictions': 1, 'size': 2, 'maxsize': 2}
+    with pytest.raises(ValueError):
+        b[0] = 0.0
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.stats()['misses'] == 0
+
+def test_filters_share_design_cache():
+    """Test that repeated filter calls reuse the shared design."""
+    DigitalFilters.design_cache.clear()
+    signal = np.random.default_rng(2).standard_normal(1000)
+    first = DigitalFilters.high_pass_filter(signal, 50, 1000)
+    second = DigitalFilters.high_pass_filter(signal, 50, 1000)
+
+    assert np.array_equal(first, second)
+    assert DigitalFilters.design_cache.stats()['hits'] == 1
+
+def test_sos_and_ba_forms_agree_at_low_order():
+    """Test that the SOS default matches the legacy transfer-function form."""
+    t = np.arange(8000) / 8000
+    signal = np.sin(2 * np.pi * 50 * t) + np.sin(2 * np.pi * 1500 * t)
+
+    sos = DigitalFilters.band_pass_filter(signal, 20, 200, 8000, order=2)
+    ba = DigitalFilters.band_pass_filter(signal, 20, 200, 8000, order=2, form='ba')
+    assert np.allclose(sos[1000:-1000], ba[1000:-1000], atol=1e-6)
+
+    with pytest.raises(ValueError):
+        DigitalFilters.low_pass_filter(signal, 100, 8000, form='zpk')
+
+def test_sos_form_is_stable_for_narrow_high_order_band():
+    """Test that a high-order band-pass near DC at 44.1 kHz stays finite."""
+    sampling_rate = 44100
+    t = np.arange(4 * sampling_rate) / sampling_rate
+    signal = np.sin(2 * np.pi * 30 * t)
+
+    filtered = DigitalFilters.band_pass_filter(signal, 20, 40, sampling_rate, order=10)
+    assert np.all(np.isfinite(filtered))
+    # Away from the edge transients the in-band tone passes with unit gain
+    steady = filtered[sampling_rate:-sampling_rate]
+    assert np.abs(steady).max() == pytest.approx(1.0, abs=0.01)
+
+    legacy = DigitalFilters.band_pass_filter(signal, 20, 40, sampling_rate, order=10, form='ba')
+    assert not np.all(np.isfinite(legacy))
+
+@pytest.mark.parametrize("method,args", [
+    ('low_pass_filter', (100, 1000)),
+    ('high_pass_filter', (100, 1000)),
+    ('band_pass_filter', (50, 200, 1000)),
+    ('moving_average', (9,)),
+])
+def test_multichannel_filtering_matches_per_channel(method, args):
+    """Test that N-D filtering along an axis equals filtering each channel."""
+    rng = np.random.default_rng(3)
+    channels = rng.standard_normal((6, 2000))
+    func = getattr(DigitalFilters, method)
+
+    expected = np.array([func(channel, *args) for channel in channels])
+    assert np.allclose(func(channels, *args), expected)
+    assert np.allclose(func(channels.T, *args, axis=0), expected.T)
+    assert np.allclose(func(channels, *args, workers=4), expected)
+
+def test_streaming_filter_multichannel_state():
+    """Test streaming over (samples, channels) blocks with a steady-state start."""
+    rng = np.random.default_rng(4)
+    channels = 1.0 + rng.standard_normal((3000, 4))
+    stream = StreamingFilter.low_pass(100, 1000, axis=0)
+
+    blocks = [stream.process(block) for block in np.array_split(channels, 7)]
+    assert np.allclose(np.concatenate(blocks), stream.filter(channels))
+
+    # Starting in the steady state for a constant input produces no transient
+    stream.reset(initial_value=1.0)
+    assert np.allclose(stream.process(np.ones((50, 4))), 1.0)
+
+@pytest.mark.parametrize("window_size", [1, 4, 7, 100])
+def test_moving_average_edge_modes(window_size):
+    """Test the running-mean moving average against np.convolve."""
+    signal = np.random.default_rng(5).standard_normal(1000)
+    window = np.ones(window_size) / window_size
+
+    same = DigitalFilters.moving_average(signal, window_size)
+    assert np.allclose(same, np.convolve(signal, window, mode='same'))
+    valid = DigitalFilters.moving_average(signal, window_size, mode='valid')
+    assert np.allclose(valid, np.convolve(signal, window, mode='valid'))
+
+    padded = np.pad(signal, (window_size // 2, (window_size - 1) // 2), mode='reflect')
+    reflect = DigitalFilters.moving_average(signal, window_size, mode='reflect')
+    assert np.allclose(reflect, np.convolve(padded, window, mode='valid'))
+
+def test_moving_average_weighted_kernels_and_precision():
+    """Test weighted kernels on both convolution paths and float32 output."""
+    signal = np.random.default_rng(6).standard_normal(5000)
+    for window_size in (5, 301):
+        weights = np.hanning(window_size + 2)[1:-1]
+        expected = np.convolve(signal, weights / weights.sum(), mode='same')
+        result = DigitalFilters.moving_average(signal, window_size, weights=weights)
+        assert np.allclose(result, expected)
+
+    single = DigitalFilters.moving_average(signal, 50, dtype=np.float32)
+    assert single.dtype == np.float32
+    with pytest.raises(ValueError):
+        DigitalFilters.moving_average(signal, 5, method='cumsum', weights=np.ones(5))
+
+def test_streaming_moving_average():
+    """Test that block-wise averaging equals the causal average of the stream."""
+    signal = np.random.default_rng(7).standard_normal(3000)
+    for weights in (None, np.arange(1.0, 81.0)):
+        stream = MovingAverage(80, weights=weights)
+        blocks = [stream.process(block) for block in np.array_split(signal, 13)]
+        kernel = np.ones(80) if weights is None else weights
+        expected = np.convolve(signal, kernel / kernel.sum())[:len(signal)]
+        assert np.allclose(np.concatenate(blocks), expected)
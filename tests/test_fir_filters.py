@@ -0,0 +1,69 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# Add the src directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.filters.fir_filters import FIRFilters, OverlapSaveConvolver, best_fft_size
+
+@pytest.mark.parametrize("mode", ['full', 'same', 'valid'])
+def test_overlap_save_matches_np_convolve(mode):
+    """Test one-shot overlap-save convolution against np.convolve."""
+    rng = np.random.default_rng(0)
+    signal = rng.standard_normal(10000)
+    taps = rng.standard_normal(257)
+
+    convolver = OverlapSaveConvolver(taps)
+    assert np.allclose(convolver.convolve(signal, mode=mode), np.convolve(signal, taps, mode=mode))
+
+def test_overlap_save_streaming_and_multichannel():
+    """Test that streamed multichannel blocks equal the causal convolution."""
+    rng = np.random.default_rng(1)
+    signal = rng.standard_normal((3, 6000))
+    taps = rng.standard_normal(300)
+    convolver = OverlapSaveConvolver(taps, fft_size=1024)
+
+    blocks = [convolver.process(block) for block in np.array_split(signal, 17, axis=-1)]
+    expected = np.array([np.convolve(channel, taps)[:6000] for channel in signal])
+    assert np.allclose(np.concatenate(blocks, axis=-1), expected)
+
+    columns = OverlapSaveConvolver(taps, axis=0)
+    assert np.allclose(columns.process(signal.T), expected.T)
+
+def test_overlap_save_streams_empty_blocks():
+    """Test that an empty block mid-stream yields an empty block and keeps the history."""
+    rng = np.random.default_rng(2)
+    signal = rng.standard_normal((2, 500))
+    taps = rng.standard_normal(17)
+    convolver = OverlapSaveConvolver(taps)
+
+    first = convolver.process(signal[:, :200])
+    empty = convolver.process(signal[:, 200:200])
+    rest = convolver.process(signal[:, 200:])
+    assert empty.shape == (2, 0)
+    expected = np.array([np.convolve(channel, taps)[:500] for channel in signal])
+    assert np.allclose(np.concatenate([first, empty, rest], axis=-1), expected)
+
+def test_best_fft_size_is_a_few_kernel_lengths():
+    """Test that the chosen FFT size balances FFT cost against wasted overlap."""
+    for num_taps in (1000, 4096, 16000):
+        size = best_fft_size(num_taps)
+        assert 2 * num_taps <= size <= 32 * num_taps
+
+def test_fir_low_pass_is_zero_delay():
+    """Test that the FIR low-pass keeps an in-band tone aligned and removes a high one."""
+    sampling_rate = 8000
+    t = np.arange(2 * sampling_rate) / sampling_rate
+    low = np.sin(2 * np.pi * 100 * t)
+    signal = low + np.sin(2 * np.pi * 3000 * t)
+
+    filtered = FIRFilters.low_pass_filter(signal, 1000, sampling_rate, num_taps=1001)
+    assert filtered.shape == signal.shape
+    assert np.allclose(filtered[1000:-1000], low[1000:-1000], atol=1e-2)
+
+    taps = FIRFilters.design(1001, (500, 1500), sampling_rate, btype='band')
+    assert np.allclose(taps, taps[::-1])
+    with pytest.raises(ValueError):
+        FIRFilters.design(101, 500, sampling_rate, btype='notch')
@@ -0,0 +1,122 @@
+import sys
+import os
+import json
+import threading
+import numpy as np
+import pytest
+
+# Add the src directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.filters.digital_filters import DigitalFilters, StreamingFilter
+from src.generators.signal_generator import SignalGenerator
+from src.instrumentation import instrumentation
+from src.instrumentation.instrumentation import MetricsRegistry, instrument
+from src.security.signal_security import SignalSecurity
+from src.transforms.transforms import SignalTransforms
+
+def test_instrument_records_calls_and_restores_methods():
+    """Test that calls are counted inside the block and methods restored after it."""
+    original = vars(DigitalFilters)['low_pass_filter']
+    signal = np.random.default_rng(0).standard_normal(4096)
+    with instrument() as metrics:
+        assert instrumentation.is_enabled()
+        filtered = DigitalFilters.low_pass_filter(signal, 1000, 44100)
+        DigitalFilters.low_pass_filter(signal, 2000, 44100)
+        SignalTransforms.fft(filtered, 44100)
+    assert not instrumentation.is_enabled()
+    assert vars(DigitalFilters)['low_pass_filter'] is original
+
+    snapshot = metrics.snapshot()
+    low_pass = snapshot['DigitalFilters.low_pass_filter']
+    assert low_pass['calls'] == 2 and low_pass['errors'] == 0
+    assert low_pass['input_elements'] == 2 * signal.size
+    assert low_pass['max_input_elements'] == signal.size
+    assert 0 < low_pass['wall_seconds'] and low_pass['cpu_seconds'] >= 0
+    # Nested calls into the design cache are recorded separately
+    assert snapshot['FilterDesignCache.butter']['calls'] == 2
+    assert snapshot['SignalTransforms.fft']['calls'] == 1
+
+    DigitalFilters.low_pass_filter(signal, 1000, 44100)
+    assert metrics.snapshot()['DigitalFilters.low_pass_filter']['calls'] == 2
+
+def test_instrument_handles_instance_class_and_static_methods():
+    """Test that every kind of method keeps working and is recorded."""
+    with instrument() as metrics:
+        streaming = StreamingFilter.low_pass(1000, 44100)
+        streaming.process(np.ones(256))
+        _, sine = SignalGenerator.sine_wave(440, 0.01, 44100, time_axis=None)
+        assert SignalSecurity.validate_array_bounds(sine)
+    snapshot = metrics.snapshot()
+    for name in ('StreamingFilter.low_pass', 'StreamingFilter.process',
+                 'SignalGenerator.sine_wave', 'SignalSecurity.validate_array_bounds'):
+        assert snapshot[name]['calls'] == 1
+
+def test_instrument_counts_errors_and_reenable_fails():
+    """Test that raised exceptions are counted and nested enabling is refused."""
+    with instrument() as metrics:
+        with pytest.raises(ValueError):
+            SignalSecurity.validate_array_bounds(np.array([1.0, np.nan]))
+        with pytest.raises(RuntimeError):
+            instrumentation.enable()
+    validate = metrics.snapshot()['SignalSecurity.validate_array_bounds']
+    assert validate['calls'] == 1 and validate['errors'] == 1
+
+def test_instrument_traces_peak_allocation():
+    """Test that peak bytes cover the temporaries of nested calls."""
+    with instrument(trace_memory=True) as metrics:
+        SignalGenerator.noise(1.0, 44100, noise_type='pink', time_axis=None)
+        DigitalFilters.low_pass_filter(np.ones(44100), 1000, 44100)
+    snapshot = metrics.snapshot()
+    # The float64 output alone is 352800 bytes
+    assert snapshot['SignalGenerator.noise']['peak_allocated_bytes'] >= 44100 * 8
+    assert snapshot['DigitalFilters.low_pass_filter']['peak_allocated_bytes'] >= 44100 * 8
+    assert snapshot['DigitalFilters.low_pass_filter']['peak_allocated_bytes'] >= \
+        snapshot['FilterDesignCache.butter']['peak_allocated_bytes']
+
+def test_traced_calls_in_other_threads_do_not_share_peaks():
+    """Test that a small call's peak excludes a large call running in another thread."""
+    small = np.zeros(100)
+    large = np.zeros(1_000_000)
+    done = threading.Event()
+
+    def filter_large():
+        for _ in range(20):
+            DigitalFilters.low_pass_filter(large, 1000, 44100)
+        done.set()
+
+    with instrument(trace_memory=True) as metrics:
+        worker = threading.Thread(target=filter_large)
+        worker.start()
+        while not done.is_set():
+            SignalSecurity.validate_array_bounds(small)
+        worker.join()
+    snapshot = metrics.snapshot()
+    assert snapshot['DigitalFilters.low_pass_filter']['peak_allocated_bytes'] >= 8_000_000
+    assert snapshot['SignalSecurity.validate_array_bounds']['peak_allocated_bytes'] < 1_000_000
+
+def test_trace_memory_requires_reset_peak(monkeypatch):
+    """Test that memory tracing is refused where tracemalloc cannot reset its peak."""
+    monkeypatch.delattr(instrumentation.tracemalloc, 'reset_peak')
+    with pytest.raises(RuntimeError, match="Python 3.9"):
+        instrumentation.enable(trace_memory=True)
+    assert not instrumentation.is_enabled()
+
+def test_registry_exports_json_and_prometheus():
+    """Test both export formats."""
+    registry = MetricsRegistry()
+    registry.record('SignalTransforms.fft', 0.5, 0.25, 1024, 0, False)
+    registry.record('SignalTransforms.fft', 0.5, 0.25, 2048, 4096, True)
+
+    metrics = json.loads(registry.to_json())
+    assert metrics['SignalTransforms.fft'] == {
+        'calls': 2, 'errors': 1, 'wall_seconds': 1.0, 'cpu_seconds': 0.5,
+        'input_elements': 3072, 'max_input_elements': 2048, 'peak_allocated_bytes': 4096}
+
+    text = registry.to_prometheus()
+    assert '# TYPE dsptoolkit_calls_total counter' in text
+    assert 'dsptoolkit_calls_total{method="SignalTransforms.fft"} 2' in text
+    assert 'dsptoolkit_peak_allocated_bytes{method="SignalTransforms.fft"} 4096' in text
+
+    registry.clear()
+    assert registry.snapshot() == {}
@@ -0,0 +1,66 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# Add the src directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.security.memory_budget import MemoryBudget, default_memory_budget
+from src.security.signal_security import SignalSecurity
+
+def test_estimates_scale_with_dtype_and_time_axis():
+    """Test that estimates follow dtype, channels and the time axis mode."""
+    budget = MemoryBudget(1 << 40)
+    full = budget.estimate('sine_wave', 1000)
+    assert full == 1000 * 8 + 1000 * 8
+    assert budget.estimate('sine_wave', 1000, np.float32) == 1000 * 4 + 1000 * 8
+    assert budget.estimate('sine_wave', 1000, time_axis=None) == 1000 * 8
+    assert budget.estimate('low_pass_filter', 1000, channels=4) == 4 * budget.estimate(
+        'low_pass_filter', 1000)
+    assert budget.estimate('noise', 1000, noise_type='pink') > budget.estimate('noise', 1000)
+
+    with pytest.raises(ValueError):
+        budget.plan('fourier', 1000)
+
+def test_plan_recommends_streaming_over_budget():
+    """Test one-shot, streaming and reject recommendations."""
+    budget = MemoryBudget(64 << 20)
+    assert budget.plan('sine_wave', 1_000_000).recommendation == 'one-shot'
+
+    plan = budget.plan('sine_wave', 100_000_000)
+    assert plan.recommendation == 'stream'
+    assert plan.streaming_api == 'SignalGenerator.sine_wave_blocks'
+    assert budget.estimate('sine_wave', plan.block_size) <= budget.max_bytes
+    assert budget.estimate('sine_wave', 2 * plan.block_size) > budget.max_bytes
+
+    assert budget.plan('fft', 100_000_000).recommendation == 'reject'
+    # Identical parameter sets share one cached plan
+    assert budget.plan('sine_wave', 100_000_000) is plan
+
+def test_validate_signal_params_with_budget():
+    """Test that a budget replaces the fixed sample cap with a plan."""
+    plan = SignalSecurity.validate_signal_params(1000, 3600.0, 44100, 1.0)
+    assert plan.operation == 'sine_wave' and plan.recommendation in ('one-shot', 'stream')
+    assert SignalSecurity.validate_signal_params(1000, 1.0, 44100, 1.0).recommendation == \
+        'one-shot'
+    with pytest.raises(ValueError, match="exceeds the limit"):
+        SignalSecurity.validate_signal_params(1000, 3600.0, 44100, 1.0,
+                                              max_samples=100_000_000)
+
+    plan = SignalSecurity.validate_signal_params(1000, 3600.0, 44100, 1.0,
+                                                 memory_budget=MemoryBudget(1 << 30))
+    assert plan.recommendation == 'stream'
+    plan = SignalSecurity.validate_signal_params(1000, 3600.0, 44100, 1.0,
+                                                 memory_budget=MemoryBudget(1 << 40))
+    assert plan.recommendation == 'one-shot'
+    with pytest.raises(ValueError):
+        SignalSecurity.validate_signal_params(1000, 3600.0, 44100, 1.0, operation='fft',
+                                              memory_budget=MemoryBudget(1 << 20))
+
+def test_default_budget_is_resolved_once():
+    """Test that default parameters plan against one fixed budget and share its cache."""
+    assert default_memory_budget() is default_memory_budget()
+    first = SignalSecurity.validate_signal_params(1000, 1.0, 44100, 1.0)
+    assert first.budget_bytes == default_memory_budget().max_bytes
+    assert SignalSecurity.validate_signal_params(1000, 1.0, 44100, 1.0) is first
@@ -0,0 +1,63 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# Add the src directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.security.merkle import MerkleFingerprint
+
+@pytest.mark.parametrize("length", [1, 1000, 1024, 5000])
+def test_fingerprint_is_independent_of_workers(length):
+    """Test that threaded and serial hashing give the same fingerprint."""
+    signal = np.random.default_rng(0).standard_normal(length)
+    serial = MerkleFingerprint.from_signal(signal, chunk_size=256, workers=1)
+    threaded = MerkleFingerprint.from_signal(signal, chunk_size=256, workers=4)
+    assert serial.root == threaded.root
+    assert serial.num_chunks == -(-length // 256)
+
+    # The fingerprint binds the layout as well as the bytes
+    reshaped = MerkleFingerprint.from_signal(signal.view(np.int64), chunk_size=256)
+    assert reshaped.root != serial.root
+
+def test_verify_chunk_with_proof():
+    """Test single-chunk verification through the audit path."""
+    signal = np.random.default_rng(1).standard_normal((3000, 2))
+    fingerprint = MerkleFingerprint.from_signal(signal, chunk_size=128)
+    for index in (0, 7, fingerprint.num_chunks - 1):
+        start, stop = fingerprint.chunk_bounds(index)
+        proof = fingerprint.proof(index)
+        assert fingerprint.verify_chunk(signal[start:stop], index, proof)
+        tampered = signal[start:stop].copy()
+        tampered[3, 1] += 1e-12
+        assert not fingerprint.verify_chunk(tampered, index, proof)
+
+    with pytest.raises(ValueError):
+        fingerprint.proof(fingerprint.num_chunks)
+
+def test_locate_corrupted_chunks():
+    """Test that diff and verify_chunks find exactly the corrupted chunks."""
+    signal = np.random.default_rng(2).standard_normal(10000)
+    reference = MerkleFingerprint.from_signal(signal, chunk_size=100)
+    corrupted = signal.copy()
+    corrupted[[250, 5001, 9999]] = 0.0
+
+    suspect = MerkleFingerprint.from_signal(corrupted, chunk_size=100)
+    assert reference.diff(suspect) == [2, 50, 99]
+    assert reference.diff(reference) == []
+    assert reference.verify_chunks(corrupted, [1, 2, 3, 99]) == [2, 99]
+
+    with pytest.raises(ValueError):
+        reference.diff(MerkleFingerprint.from_signal(signal, chunk_size=50))
+
+def test_empty_signal_fingerprint():
+    """Test that an empty signal has a root and rejects chunk checks with ValueError."""
+    fingerprint = MerkleFingerprint.from_signal(np.zeros(0))
+    assert fingerprint.num_chunks == 0 and len(fingerprint.hexdigest()) == 64
+    other_dtype = MerkleFingerprint.from_signal(np.zeros(0, np.float32))
+    assert fingerprint.hexdigest() != other_dtype.hexdigest()
+    assert fingerprint.diff(MerkleFingerprint.from_signal(np.zeros(0))) == []
+    for proof in (None, []):
+        with pytest.raises(ValueError, match="out of range"):
+            fingerprint.verify_chunk(np.zeros(0), 0, proof)
@@ -0,0 +1,106 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# Add the src directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.filters.digital_filters import MovingAverage, StreamingFilter
+from src.filters.resampling import Resampler
+from src.generators.signal_generator import SignalGenerator
+from src.pipeline.pipeline import Pipeline, RingBuffer, Stage
+from src.security.signal_security import SignalHasher, StreamingValidator
+
+def test_ring_buffer_wraps_and_grows():
+    """Test that samples come out in order across wrap-around and growth."""
+    ring = RingBuffer(8)
+    data = np.arange(100.0).reshape(2, 50)
+    ring.write(data[:, :5])
+    assert np.array_equal(ring.read(3), data[:, :3])
+    ring.write(data[:, 5:11])
+    assert ring.capacity == 8 and ring.available == 8
+    ring.write(data[:, 11:30])
+    assert ring.capacity >= 27
+    assert np.array_equal(ring.read(27), data[:, 3:30])
+    with pytest.raises(ValueError):
+        ring.read(1)
+
+@pytest.mark.parametrize("fuse", [False, True])
+def test_pipeline_matches_one_shot_processing(fuse):
+    """Test that a generator-filter-check pipeline equals one-shot processing."""
+    _, signal = SignalGenerator.noise(1.0, 8000, rng=np.random.default_rng(0))
+    expected = StreamingFilter.low_pass(1000, 8000).filter(signal)
+    expected = MovingAverage(5).process(expected)
+    hasher = SignalHasher()
+
+    pipeline = Pipeline([
+        Stage.wrap(StreamingFilter.low_pass(1000, 8000), block_size=256),
+        Stage.wrap(MovingAverage(5)),
+        Stage.check(StreamingValidator().validate, 'validate'),
+        Stage.check(hasher.update, 'hash'),
+    ], fuse=fuse)
+    output = pipeline.run(Pipeline.array_source(signal, block_size=1000))
+
+    assert np.allclose(output, expected)
+    assert hasher.hexdigest() == SignalHasher().update(output).hexdigest()
+    stats = pipeline.stats()
+    assert len(stats) == (1 if fuse else 4)
+    first = next(iter(stats.values()))
+    assert first['samples_in'] == 8000 and first['calls'] == 32
+    assert first['throughput'] > 0
+
+def test_pipeline_streams_variable_rate_stages():
+    """Test rebatching after a resampler and flushing its tail."""
+    seen = []
+    pipeline = Pipeline([
+        Stage.wrap(Resampler(3, 2)),
+        Stage(lambda block: seen.append(block.shape[-1]) or block * 2, 'scale', block_size=100),
+    ])
+    source = SignalGenerator.sine_wave_blocks(50, 1.0, 1000, block_size=64)
+    output = pipeline.run(source)
+
+    _, signal = SignalGenerator.sine_wave(50, 1.0, 1000)
+    assert np.allclose(output, 2 * Resampler(3, 2).resample(signal))
+    assert seen == [100] * 15
+
+    pipeline.reset()
+    outputs = pipeline.process(signal) + pipeline.flush()
+    assert np.allclose(np.concatenate(outputs), output)
+
+def test_pipeline_check_stage_reports_stream_position():
+    """Test that a failing check names the sample position in the stream."""
+    signal = np.zeros(1000)
+    signal[733] = np.nan
+    pipeline = Pipeline([Stage.check(StreamingValidator().validate)])
+    with pytest.raises(ValueError, match="sample 733"):
+        pipeline.run(Pipeline.array_source(signal, block_size=100))
+
+def test_pipeline_checks_multichannel_blocks_along_time():
+    """Test validation and hashing of (channels, time) blocks with an uneven last block."""
+    signal = np.random.default_rng(1).standard_normal((2, 3500))
+    hasher = SignalHasher()
+    pipeline = Pipeline([
+        Stage.check(StreamingValidator(max_samples=3500).validate, 'validate'),
+        Stage.check(hasher.update, 'hash'),
+    ])
+    output = pipeline.run(Pipeline.array_source(signal, block_size=1000))
+
+    assert np.array_equal(output, signal)
+    assert hasher.shape == (3500, 2)
+    assert hasher.hexdigest() == SignalHasher().update(signal.T).hexdigest()
+
+    signal[1, 2345] = np.inf
+    pipeline = Pipeline([Stage.check(StreamingValidator().validate)])
+    with pytest.raises(ValueError, match=r"sample 2345 \(channel \(1,\)\)"):
+        pipeline.run(Pipeline.array_source(signal, block_size=1000))
+
+@pytest.mark.parametrize("fuse", [False, True])
+def test_pipeline_blocked_passthrough_outputs_are_independent(fuse):
+    """Test that blocks passed on by a fixed-size passthrough stage are not overwritten."""
+    signal = np.arange(20.0)
+    stages = [Stage.check(lambda block: None, block_size=4, axis=None), Stage(lambda block: block[..., :])]
+    assert np.array_equal(np.concatenate(Pipeline(stages, fuse).process(signal[:12])),
+                          signal[:12])
+    pipeline = Pipeline(stages, fuse)
+    assert np.array_equal(pipeline.run(Pipeline.array_source(signal, 10)), signal)
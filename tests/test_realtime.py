@@ -0,0 +1,83 @@
+import sys
+import os
+import asyncio
+import time
+import numpy as np
+import pytest
+
+# Add the src directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.filters.digital_filters import StreamingFilter
+from src.filters.resampling import Resampler
+from src.pipeline.pipeline import Pipeline, Stage
+from src.pipeline.realtime import AsyncPipeline, FakeDevice
+
+def offline_chain():
+    return [Stage.wrap(StreamingFilter.low_pass(1000, 44100)), Stage.wrap(Resampler(1, 2))]
+
+def test_async_pipeline_matches_offline_pipeline():
+    """Test that the async stream equals the synchronous pipeline, flush tails included."""
+    device = FakeDevice.sine(440, 0.1, 44100, noise=0.1, block_size=512, realtime=False)
+    signal = np.concatenate(list(device.blocks))
+    expected = Pipeline(offline_chain()).run(Pipeline.array_source(signal, 512))
+
+    pipeline = AsyncPipeline(offline_chain(), queue_size=2)
+    output = asyncio.run(pipeline.run(FakeDevice(Pipeline.array_source(signal, 512),
+                                                 realtime=False)))
+    assert np.allclose(output, expected)
+    stats = pipeline.stats()
+    assert stats['blocks_in'] == 9 and stats['overruns'] == 0
+    assert stats['stages']['StreamingFilter']['calls'] == 9
+
+def test_async_pipeline_backpressure_keeps_every_block():
+    """Test that a slow stage makes the source wait instead of losing blocks."""
+    received = []
+
+    async def sink(block):
+        received.append(block.copy())
+
+    def slow(block):
+        time.sleep(0.002)
+        return block
+
+    pipeline = AsyncPipeline([slow, lambda block: 2 * block], queue_size=1)
+    blocks = [np.full(64, float(i)) for i in range(20)]
+    assert asyncio.run(pipeline.run(blocks, sink)) is None
+    assert pipeline.blocks_in == pipeline.blocks_out == 20
+    assert np.array_equal(np.concatenate(received), 2 * np.concatenate(blocks))
+
+def test_async_pipeline_counts_overruns_and_underruns():
+    """Test that a real-time source feeding a too-slow stage drops and misses deadlines."""
+    def slow(block):
+        time.sleep(0.02)
+        return block
+
+    device = FakeDevice.sine(440, 0.15, 44100, block_size=256)
+    pipeline = AsyncPipeline([slow], queue_size=1, deadline=256 / 44100, overflow='drop')
+    asyncio.run(pipeline.run(device, lambda block: None))
+    stats = pipeline.stats()
+    assert stats['overruns'] > 0 and stats['underruns'] > 0
+    assert stats['blocks_out'] + stats['overruns'] == stats['blocks_in']
+    assert stats['max_latency_ms'] > 1e3 * 256 / 44100
+
+def test_async_pipeline_meets_generous_deadline():
+    """Test that a fast chain on a real-time device loses nothing."""
+    device = FakeDevice.sine(440, 0.1, 44100, block_size=1024)
+    pipeline = AsyncPipeline([StreamingFilter.low_pass(1000, 44100).process], deadline=0.5,
+                             overflow='drop')
+    output = asyncio.run(pipeline.run(device))
+    assert output.shape == (4410,)
+    assert pipeline.overruns == 0 and pipeline.underruns == 0
+
+def test_async_pipeline_propagates_stage_errors():
+    """Test that a failing stage raises from run() and invalid settings are refused."""
+    def broken(block):
+        raise ValueError("bad block")
+
+    with pytest.raises(ValueError, match="bad block"):
+        asyncio.run(AsyncPipeline([broken]).run([np.zeros(8)] * 10))
+    with pytest.raises(ValueError):
+        AsyncPipeline([Stage(np.abs, block_size=16)])
+    with pytest.raises(ValueError):
+        AsyncPipeline([np.abs], overflow='block')
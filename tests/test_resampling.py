@@ -0,0 +1,54 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# Add the src directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.filters.resampling import Resampler
+from src.generators.signal_generator import SignalGenerator
+
+@pytest.mark.parametrize("input_rate,output_rate", [(48000, 16000), (44100, 48000), (96000, 44100)])
+def test_streaming_resampler_matches_one_shot(input_rate, output_rate):
+    """Test that streamed blocks plus flush equal one-shot resampling exactly."""
+    rng = np.random.default_rng(0)
+    signal = rng.standard_normal((2, 5000))
+    resampler = Resampler.from_rates(input_rate, output_rate)
+
+    expected = resampler.resample(signal)
+    assert expected.shape[-1] == resampler.output_length(5000)
+
+    blocks = [resampler.process(block) for block in np.array_split(signal, 37, axis=-1)]
+    blocks.append(resampler.flush())
+    assert np.allclose(np.concatenate(blocks, axis=-1), expected)
+
+@pytest.mark.parametrize("axis", [-1, 0])
+def test_flush_of_empty_stream_keeps_channel_layout(axis):
+    """Test that flushing a stream without blocks returns no samples in the stream's layout."""
+    resampler = Resampler(2, 3, axis=axis)
+    assert resampler.flush().shape == (0,)
+
+    signal = np.random.default_rng(1).standard_normal((4, 3, 600))
+    signal = np.moveaxis(signal, -1, axis)
+    blocks = [resampler.process(block) for block in np.array_split(signal, 3, axis=axis)]
+    blocks += [resampler.flush(), resampler.flush()]
+    assert blocks[-1].shape[axis] == 0
+    assert np.allclose(np.concatenate(blocks, axis=axis), resampler.resample(signal))
+
+def test_decimation_preserves_in_band_tone():
+    """Test that decimating a generated tone keeps its frequency and length."""
+    _, signal = SignalGenerator.sine_wave(440, 1.0, sampling_rate=48000)
+    decimated = Resampler.decimate(signal, 6)
+
+    assert len(decimated) == 8000
+    spectrum = np.abs(np.fft.rfft(decimated))
+    freqs = np.fft.rfftfreq(len(decimated), 1 / 8000)
+    assert freqs[np.argmax(spectrum)] == pytest.approx(440, abs=1)
+
+def test_resampler_rejects_invalid_factors():
+    """Test validation of the resampling factors."""
+    with pytest.raises(ValueError):
+        Resampler(0, 3)
+    with pytest.raises(ValueError):
+        Resampler(1.5, 2)
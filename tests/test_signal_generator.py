@@ -1,7 +1,9 @@
 import sys
 import os
+import tracemalloc
 import numpy as np
 import pytest
+from scipy.signal import chirp
 
 # Add the src directory to Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
@@ -66,3 +68,144 @@ def test_noise_generation():
     # Test invalid noise type
     with pytest.raises(ValueError):
         gen.noise(duration, sampling_rate, amplitude, 'invalid_type')
+
+@pytest.mark.parametrize("method,args", [
+    ('sine_wave', (440, 1.3)),
+    ('square_wave', (50, 1.3)),
+    ('chirp_signal', (20, 2000, 1.3)),
+])
+def test_block_generators_match_one_shot(method, args):
+    """Test that concatenated blocks equal the one-shot signal exactly."""
+    gen = SignalGenerator()
+    _, expected = getattr(gen, method)(*args, 8000)
+    blocks = list(getattr(gen, method + '_blocks')(*args, 8000, block_size=1000))
+
+    assert all(len(block) == 1000 for block in blocks[:-1])
+    assert np.array_equal(np.concatenate(blocks), expected)
+
+def test_noise_blocks_match_one_shot():
+    """Test that white noise blocks follow the same random stream as noise()."""
+    gen = SignalGenerator()
+    np.random.seed(0)
+    _, expected = gen.noise(0.5, 8000, 2.0)
+    np.random.seed(0)
+    blocks = list(gen.noise_blocks(0.5, 8000, 2.0, block_size=700))
+    assert np.array_equal(np.concatenate(blocks), expected)
+
+    with pytest.raises(ValueError):
+        next(gen.noise_blocks(0.5, 8000, noise_type='grey'))
+
+def test_unbounded_sine_stream():
+    """Test that a sine stream without a duration keeps running with continuous phase."""
+    stream = SignalGenerator.sine_wave_blocks(1000, sampling_rate=8000, block_size=3)
+    samples = np.concatenate([next(stream) for _ in range(100)])
+    expected = np.sin(2 * np.pi * 1000 * np.arange(300) / 8000)
+    assert np.allclose(samples, expected)
+
+def test_unbounded_stream_keeps_phase_precision():
+    """Test that blocks far into unbounded streams match the exact wrapped phase."""
+    block_size, skip = 1 << 16, 300
+    sine = SignalGenerator.sine_wave_blocks(440, sampling_rate=44100, block_size=block_size)
+    square = SignalGenerator.square_wave_blocks(440, sampling_rate=44100, duty_cycle=0.3,
+                                                block_size=block_size)
+    for _ in range(skip):
+        next(sine)
+        next(square)
+
+    # Exact integer phase in cycles: (start + k) * 440 / 44100 modulo one
+    start = skip * block_size
+    cycles = ((start + np.arange(block_size, dtype=np.int64)) * 440 % 44100) / 44100
+    assert np.allclose(next(sine), np.sin(2 * np.pi * cycles), rtol=0, atol=1e-10)
+    expected = np.where(cycles < 0.3, 1.0, -1.0)
+    # Samples within rounding of a duty-cycle edge may fall on either side
+    edge = np.isclose(cycles, 0.3) | np.isclose(cycles, 0.0)
+    assert np.array_equal(next(square)[~edge], expected[~edge])
+
+def test_time_axis_modes():
+    """Test the time array, the lazy time axis and skipping it."""
+    gen = SignalGenerator()
+    t, signal = gen.sine_wave(10, 1.0, 1000)
+    lazy, lazy_signal = gen.sine_wave(10, 1.0, 1000, time_axis='lazy')
+    none, _ = gen.sine_wave(10, 1.0, 1000, time_axis=None)
+
+    assert none is None
+    assert np.array_equal(lazy_signal, signal)
+    assert len(lazy) == len(t)
+    assert np.array_equal(np.asarray(lazy), t)
+    assert lazy[-1] == t[-1]
+    assert np.array_equal(lazy[10:200:7], t[10:200:7])
+
+def test_dtype_and_output_buffer():
+    """Test single-precision output and generation into a reused buffer."""
+    gen = SignalGenerator()
+    _, expected = gen.chirp_signal(20, 400, 2.0, 1000)
+    _, single = gen.chirp_signal(20, 400, 2.0, 1000, dtype=np.float32)
+    assert single.dtype == np.float32
+    assert np.allclose(single, expected, atol=1e-6)
+
+    out = np.empty(2000)
+    _, signal = gen.chirp_signal(20, 400, 2.0, 1000, time_axis=None, out=out)
+    assert signal is out
+    assert np.array_equal(out, expected)
+
+    with pytest.raises(ValueError):
+        gen.sine_wave(10, 2.0, 1000, out=np.empty(10))
+    with pytest.raises(ValueError):
+        gen.sine_wave(10, 2.0, 1000, dtype=np.int16)
+
+def test_generation_into_buffer_does_not_allocate():
+    """Test that steady-state generation into a reused buffer allocates no arrays."""
+    gen = SignalGenerator()
+    out = np.empty(200000, dtype=np.float32)
+    rng = np.random.default_rng(0)
+    gen.sine_wave(440, 5.0, 40000, time_axis=None, out=out)
+    gen.noise(5.0, 40000, time_axis=None, out=out, rng=rng)
+
+    tracemalloc.start()
+    try:
+        for _ in range(3):
+            gen.sine_wave(440, 5.0, 40000, time_axis=None, out=out)
+            gen.noise(5.0, 40000, time_axis=None, out=out, rng=rng)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < 16 * 1024
+
+@pytest.mark.parametrize("method", ['linear', 'quadratic', 'logarithmic', 'hyperbolic'])
+def test_chirp_phase_is_integrated(method):
+    """Test each sweep law against scipy's chirp and its block stream."""
+    gen = SignalGenerator()
+    t, signal = gen.chirp_signal(50, 3000, 2.0, 8000, method=method)
+    assert np.allclose(signal, chirp(t, 50, 2.0, 3000, method=method, phi=-90), atol=1e-9)
+
+    blocks = gen.chirp_signal_blocks(50, 3000, 2.0, 8000, block_size=999,
+                                     dtype=np.float32, method=method)
+    streamed = np.concatenate(list(blocks))
+    assert streamed.dtype == np.float32
+    assert np.allclose(streamed, signal, atol=1e-6)
+
+def test_chirp_rejects_invalid_sweeps():
+    """Test that unknown laws and sign-changing log sweeps are rejected."""
+    gen = SignalGenerator()
+    with pytest.raises(ValueError):
+        gen.chirp_signal(20, 2000, 1.0, 8000, method='cubic')
+    with pytest.raises(ValueError):
+        gen.chirp_signal(0, 2000, 1.0, 8000, method='logarithmic')
+
+def test_impulse_response_from_chirp():
+    """Test that deconvolving a filtered chirp recovers the filter taps."""
+    gen = SignalGenerator()
+    _, sweep = gen.chirp_signal(20, 3900, 2.0, 8000, amplitude=0.5, method='logarithmic')
+    taps = np.zeros(64)
+    taps[10], taps[30] = 0.5, -0.25
+    response = np.convolve(sweep, taps)
+
+    impulse = gen.impulse_response(response, 20, 3900, 2.0, 8000, amplitude=0.5,
+                                   method='logarithmic', length=64)
+    assert np.allclose(impulse, taps, atol=1e-3)
+
+    inverse = gen.chirp_inverse_filter(20, 3900, 2.0, 8000, method='logarithmic')
+    assert not inverse.flags.writeable
+    delta = np.fft.irfft(np.fft.rfft(sweep / 0.5, len(inverse)) * np.fft.rfft(inverse))
+    assert abs(delta[0] - 1) < 1e-3
+    assert np.abs(delta[1:]).max() < 1e-3
@@ -0,0 +1,144 @@
+import sys
+import os
+import secrets
+import numpy as np
+import pytest
+
+# Add the src directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.security.signal_security import (SecureNoise, SignalHasher, SignalSecurity,
+                                         StreamingValidator)
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_secure_random_noise_is_uniform(dtype):
+    """Test that secure noise is finite and uniform over [-amplitude, amplitude)."""
+    noise = SignalSecurity.secure_random_noise(200000, 0.5, dtype=dtype)
+    assert noise.dtype == dtype
+    assert len(noise) == 200000
+    assert np.isfinite(noise).all()
+    assert noise.min() >= -0.5 and noise.max() < 0.5
+
+    counts, _ = np.histogram(noise, bins=10, range=(-0.5, 0.5))
+    assert np.all(np.abs(counts - 20000) < 1000)
+    assert abs(noise.std() - 0.5 / np.sqrt(3)) < 0.005
+
+def test_secure_noise_blocks():
+    """Test block sizes of the secure noise stream and that blocks differ."""
+    blocks = list(SignalSecurity.secure_noise_blocks(block_size=100, num_samples=1050,
+                                                     dtype=np.float32))
+    assert [len(block) for block in blocks] == [100] * 10 + [50]
+    assert all(block.dtype == np.float32 for block in blocks)
+    assert not np.array_equal(blocks[0], blocks[1])
+
+    stream = SecureNoise(2.0)
+    out = np.empty(300000)
+    assert stream.generate(300000, out=out) is out
+    assert np.abs(out).max() <= 2.0
+    with pytest.raises(ValueError):
+        stream.generate(10, dtype=np.int32)
+
+def test_secure_noise_draws_only_needed_bytes(monkeypatch):
+    """Test that one-shot noise reads exactly its bytes while streams use the pool."""
+    requests = []
+    token_bytes = secrets.token_bytes
+    monkeypatch.setattr(secrets, 'token_bytes', lambda n: requests.append(n) or token_bytes(n))
+
+    SignalSecurity.secure_random_noise(100)
+    SignalSecurity.secure_random_noise(100, dtype=np.float32)
+    assert requests == [800, 400]
+
+    requests.clear()
+    stream = SecureNoise()
+    for _ in range(10):
+        stream.generate(100)
+    assert requests == [1 << 16]
+    with pytest.raises(ValueError):
+        SecureNoise(pool_bytes=-1)
+
+@pytest.mark.parametrize("algorithm,key", [('sha256', None), ('sha256', b'secret'),
+                                           ('blake2b', None), ('blake2b', b'secret')])
+def test_signal_hasher_blocks_match_one_piece(algorithm, key):
+    """Test that block-fed and one-piece digests are identical."""
+    signal = np.random.default_rng(0).standard_normal((1000, 2))
+    whole = SignalHasher(algorithm, key).update(signal).hexdigest()
+    hasher = SignalHasher(algorithm, key)
+    for start in range(0, 1000, 300):
+        hasher.update(signal[start:start + 300])
+    assert hasher.hexdigest() == whole
+    assert hasher.shape == (1000, 2)
+
+    # Non-contiguous views hash their C-order contents
+    assert SignalHasher(algorithm, key).update(np.asfortranarray(signal)).hexdigest() == whole
+    if key:
+        assert SignalHasher(algorithm, b'other').update(signal).hexdigest() != whole
+
+def test_signal_hasher_binds_dtype_and_shape():
+    """Test that the same bytes read with another dtype, order or shape hash differently."""
+    signal = np.arange(12, dtype='<f8')
+    digests = {
+        SignalHasher().update(signal).hexdigest(),
+        SignalHasher().update(signal.reshape(3, 4)).hexdigest(),
+        SignalHasher().update(signal.view(np.int64)).hexdigest(),
+        SignalHasher().update(signal.view('>f8')).hexdigest(),
+    }
+    assert len(digests) == 4
+
+    hasher = SignalHasher().update(signal)
+    with pytest.raises(ValueError):
+        hasher.update(signal.astype(np.float32))
+    with pytest.raises(ValueError):
+        SignalHasher('md5')
+
+def test_compute_signal_hash_is_unchanged():
+    """Test that compute_signal_hash still hashes the raw C-order bytes."""
+    import hashlib
+
+    signal = np.random.default_rng(1).standard_normal((500, 3))
+    for array in (signal, signal.T, signal[::2]):
+        expected = hashlib.sha256(array.tobytes()).hexdigest()
+        assert SignalSecurity.compute_signal_hash(array) == expected
+
+def test_validate_array_bounds_reports_first_bad_value():
+    """Test finiteness, dtype and layout checks and the reported index."""
+    signal = np.random.default_rng(2).standard_normal(1_000_000)
+    assert SignalSecurity.validate_array_bounds(signal)
+    # Sums that overflow are not mistaken for non-finite data
+    assert SignalSecurity.validate_array_bounds(np.full(1000, 1e308))
+
+    signal[[700001, 900000]] = [np.inf, np.nan]
+    with pytest.raises(ValueError, match="index 700001"):
+        SignalSecurity.validate_array_bounds(signal)
+    # Non-contiguous arrays are scanned in C order without a copy
+    with pytest.raises(ValueError, match=r"index \(0, 900\)"):
+        SignalSecurity.validate_array_bounds(signal.reshape(1000, 1000).T)
+    assert SignalSecurity.validate_array_bounds(signal, check_finite=False)
+
+    with pytest.raises(ValueError, match="dtype"):
+        SignalSecurity.validate_array_bounds(signal, dtype=np.float32)
+    with pytest.raises(ValueError, match="contiguous"):
+        SignalSecurity.validate_array_bounds(signal[::2], require_contiguous=True)
+    assert SignalSecurity.validate_array_bounds(np.arange(5), dtype=(np.int64, np.float64))
+
+def test_streaming_validator_tracks_position():
+    """Test that the streaming validator reports positions in the whole stream."""
+    validator = StreamingValidator(max_samples=1000, dtype=np.float32)
+    block = np.zeros((100, 2), dtype=np.float32)
+    for _ in range(3):
+        assert validator.validate(block)
+    bad = block.copy()
+    bad[42, 1] = np.nan
+    with pytest.raises(ValueError, match=r"sample 342 \(channel \(1,\)\)"):
+        validator.validate(bad)
+
+    with pytest.raises(ValueError):
+        validator.validate(np.zeros((100, 3), dtype=np.float32))
+    with pytest.raises(ValueError):
+        validator.validate(np.zeros(10))
+    for _ in range(7):
+        validator.validate(block)
+    with pytest.raises(ValueError, match="maximum"):
+        validator.validate(block)
+
+    validator.reset()
+    assert validator.validate(block) and validator.samples_seen == 100
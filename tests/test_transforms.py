@@ -0,0 +1,103 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# Add the src directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.transforms.transforms import SignalTransforms
+
+def test_stft_matches_per_frame_fft():
+    """Test that the batched STFT matches a per-frame real FFT."""
+    rng = np.random.default_rng(0)
+    signal = rng.standard_normal(10000)
+    window_size, hop_length = 256, 64
+
+    stft_matrix = SignalTransforms.stft(signal, window_size, hop_length)
+
+    window = np.hanning(window_size)
+    starts = range(0, len(signal) - window_size + 1, hop_length)
+    expected = np.array([np.fft.rfft(signal[i:i+window_size] * window) for i in starts])
+    assert stft_matrix.shape == (len(starts), window_size // 2 + 1)
+    assert np.allclose(stft_matrix, expected)
+
+def test_stft_padding_options():
+    """Test frame counts with centring, end padding and output buffers."""
+    signal = np.ones(1000)
+    window_size, hop_length = 128, 100
+
+    # The final full frame starting at 800 is included
+    assert SignalTransforms.stft(signal, window_size, hop_length).shape[0] == 9
+    # End padding adds a frame covering the trailing samples
+    assert SignalTransforms.stft(signal, window_size, hop_length, pad_end=True).shape[0] == 10
+    # Centring gives one frame per hop, including both ends
+    centred = SignalTransforms.stft(signal, window_size, hop_length, center=True)
+    assert centred.shape[0] == 1 + len(signal) // hop_length
+
+    out = np.empty((9, window_size // 2 + 1), dtype=complex)
+    result = SignalTransforms.stft(signal, window_size, hop_length, workers=2, out=out)
+    assert result is out
+    with pytest.raises(ValueError):
+        SignalTransforms.stft(signal, window_size, hop_length, out=np.empty((3, 3), dtype=complex))
+    with pytest.raises(ValueError, match="dtype"):
+        SignalTransforms.stft(signal, window_size, hop_length, out=out.astype(np.complex64))
+    with pytest.raises(ValueError, match="dtype"):
+        SignalTransforms.stft(signal, window_size, hop_length, out=np.empty(out.shape))
+
+def test_stft_rejects_complex_input():
+    """Test that a complex signal is rejected with a clear error."""
+    signal = np.exp(2j * np.pi * 0.1 * np.arange(1000))
+    with pytest.raises(ValueError, match="must be real"):
+        SignalTransforms.stft(signal, 128, 64)
+
+def test_stft_preserves_single_precision():
+    """Test that float32 input produces a complex64 STFT."""
+    signal = np.zeros(4096, dtype=np.float32)
+    assert SignalTransforms.stft(signal, 512, 128).dtype == np.complex64
+
+@pytest.mark.parametrize("window_size,hop_length", [(256, 64), (300, 128), (128, 128)])
+def test_istft_round_trip(window_size, hop_length):
+    """Test that istft inverts stft, including the squared-window normalisation."""
+    rng = np.random.default_rng(1)
+    signal = rng.standard_normal(5000)
+
+    stft_matrix = SignalTransforms.stft(signal, window_size, hop_length, window='hamming', center=True)
+    reconstructed = SignalTransforms.istft(stft_matrix, window_size, hop_length, window='hamming',
+                                           center=True, length=len(signal))
+    assert reconstructed.shape == signal.shape
+    assert np.allclose(reconstructed, signal)
+
+def test_istft_output_buffer():
+    """Test that istft writes into a caller-supplied buffer."""
+    signal = np.sin(np.linspace(0, 100, 4000))
+    stft_matrix = SignalTransforms.stft(signal, 512, 128, center=True)
+
+    out = np.empty(len(signal))
+    result = SignalTransforms.istft(stft_matrix, 512, 128, center=True, length=len(signal), out=out)
+    assert result is out
+    assert np.allclose(out, signal)
+    with pytest.raises(ValueError):
+        SignalTransforms.istft(stft_matrix, 512, 128, center=True, length=len(signal), out=np.empty(10))
+
+@pytest.mark.parametrize("n", [1000, 1001])
+def test_fft_round_trip(n):
+    """Test the one-sided FFT and its exact inverse for even and odd lengths."""
+    signal = np.random.default_rng(2).standard_normal(n)
+    frequencies, magnitudes, phases = SignalTransforms.fft(signal, 1000)
+
+    assert len(frequencies) == n // 2 + 1
+    assert frequencies[0] == 0 and frequencies[-1] <= 500
+    assert np.allclose(magnitudes, np.abs(np.fft.rfft(signal)))
+    assert np.allclose(SignalTransforms.ifft(magnitudes, phases, n=n), signal)
+
+def test_fft_fast_length_and_magnitudes_only():
+    """Test zero-padding to a fast length and the in-place magnitude mode."""
+    signal = np.sin(2 * np.pi * 50 * np.arange(1009) / 1000)
+    frequencies, magnitudes = SignalTransforms.fft(signal, 1000, fast_length=True,
+                                                   magnitudes_only=True, workers=2)
+    assert len(frequencies) == len(magnitudes) > 1009 // 2 + 1
+    assert frequencies[np.argmax(magnitudes)] == pytest.approx(50, abs=1)
+
+    _, full_magnitudes, _ = SignalTransforms.fft(signal, 1000, fast_length=True)
+    assert np.allclose(magnitudes, full_magnitudes)